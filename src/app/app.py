@@ -7,6 +7,8 @@ from src.utils.logger import setup_logging
 
 apply_backward_compatibility()
 
+NAV_OPTIONS = ("Training", "Inference")
+
 
 def main() -> None:
     """Main entry point for the Streamlit application. Returns: None."""
@@ -21,12 +23,11 @@ def main() -> None:
     if "nav" not in st.session_state:
         st.session_state["nav"] = "Training"
 
-    options = ["Training", "Inference"]
     default_index = 0
-    if st.session_state.get("nav") in options:
-        default_index = options.index(st.session_state["nav"])
+    if st.session_state.get("nav") in NAV_OPTIONS:
+        default_index = NAV_OPTIONS.index(st.session_state["nav"])
 
-    nav = st.sidebar.radio("Go to", options, index=default_index, key="nav_radio")
+    nav = st.sidebar.radio("Go to", NAV_OPTIONS, index=default_index, key="nav_radio")
     st.session_state["nav"] = nav
 
     if nav == "Training":
@@ -9,7 +9,6 @@ import pandas.api.types as pd_types
 import streamlit as st
 
 from src.app.api_client import APIError, get_api_client
-from src.app.caching import load_data_cached
 from src.app.service_factories import get_workflow_service
 from src.services.workflow_service import WorkflowService, get_workflow_providers
 from src.utils.csv_validator import validate_csv
@@ -1514,9 +1513,9 @@ def render_config_ui(config: Dict[str, Any]) -> Dict[str, Any]:
         else:
             uploaded_file = st.file_uploader("Upload CSV", type=["csv"], key="wizard_uploader")
             if uploaded_file:
-                is_valid, err, df_preview = validate_csv(uploaded_file)
-                if is_valid:
-                    full_df = load_data_cached(uploaded_file)
+                # validate_csv already parses the whole file; reuse it instead of reading it again.
+                is_valid, err, full_df = validate_csv(uploaded_file)
+                if is_valid and full_df is not None:
                     st.session_state["training_data"] = full_df
                     st.session_state["training_dataset_name"] = uploaded_file.name
                     df_to_analyze = full_df
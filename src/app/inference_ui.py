@@ -6,9 +6,12 @@ import seaborn as sns
 import streamlit as st
 
 from src.app.api_client import APIError, get_api_client
-from src.app.service_factories import get_analytics_service, get_inference_service
+from src.app.service_factories import (
+    get_analytics_service,
+    get_inference_service,
+    get_model_registry,
+)
 from src.services.inference_service import InvalidInputError, ModelNotFoundError
-from src.services.model_registry import ModelRegistry
 
 
 def render_model_information_api(
@@ -177,7 +180,7 @@ def render_inference_ui() -> None:
             st.error(f"Failed to load models from API: {e.message}")
             return
     else:
-        registry = ModelRegistry()
+        registry = get_model_registry()
         runs = registry.list_models()
 
     if not runs:
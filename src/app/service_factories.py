@@ -6,6 +6,7 @@ import streamlit as st
 
 from src.services.analytics_service import AnalyticsService
 from src.services.inference_service import InferenceService
+from src.services.model_registry import ModelRegistry
 from src.services.training_service import TrainingService
 from src.services.workflow_service import WorkflowService
 
@@ -22,6 +23,22 @@ def get_inference_service() -> InferenceService:
     return InferenceService()
 
 
+MODEL_REGISTRY_STATE_KEY = "model_registry"
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get model registry instance, preferring one placed in session state.
+
+    A registry stored under MODEL_REGISTRY_STATE_KEY (for example by an AppTest harness) is
+    reused as-is; otherwise a new ModelRegistry is created.
+
+    Returns:
+        ModelRegistry: Model registry.
+    """
+    registry: Optional[ModelRegistry] = st.session_state.get(MODEL_REGISTRY_STATE_KEY)
+    return registry if registry is not None else ModelRegistry()
+
+
 @st.cache_resource
 def get_analytics_service() -> AnalyticsService:
     """Get analytics service instance. Returns: AnalyticsService: Analytics service."""
@@ -2,9 +2,10 @@
 
 import asyncio
 import hashlib
+import json
 import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 import google.generativeai as genai
 from openai import APIError, AsyncOpenAI, OpenAI, RateLimitError
@@ -92,12 +93,18 @@ class OpenAIClient(LLMClient):
             self.async_client = AsyncOpenAI(api_key=self.api_key)
         return self.async_client
 
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """Generate text from OpenAI with retry logic and caching.
 
         Args:
             prompt (str): User prompt.
             system_prompt (Optional[str]): System prompt.
+            response_format (Optional[Dict[str, Any]]): OpenAI response_format, e.g. JSON mode.
 
         Returns:
             str: Generated text.
@@ -106,7 +113,10 @@ class OpenAIClient(LLMClient):
             Exception: If all retries fail.
         """
         cache_manager = get_cache_manager()
-        cache_key = _generate_cache_key(prompt, system_prompt, self.model)
+        cache_model = self.model
+        if response_format:
+            cache_model = f"{self.model}|{json.dumps(response_format, sort_keys=True)}"
+        cache_key = _generate_cache_key(prompt, system_prompt, cache_model)
 
         cached_response = cache_manager.get("llm", cache_key)
         if cached_response is not None:
@@ -123,6 +133,10 @@ class OpenAIClient(LLMClient):
             messages.append(ChatCompletionSystemMessageParam(role="system", content=system_prompt))
         messages.append(ChatCompletionUserMessageParam(role="user", content=prompt))
 
+        create_kwargs: Dict[str, Any] = {}
+        if response_format:
+            create_kwargs["response_format"] = response_format
+
         backoff = INITIAL_BACKOFF
         last_exception = None
 
@@ -130,7 +144,7 @@ class OpenAIClient(LLMClient):
             try:
                 start_time = time.time()
                 response = self.client.chat.completions.create(
-                    model=self.model, messages=messages, temperature=0.0
+                    model=self.model, messages=messages, temperature=0.0, **create_kwargs
                 )
                 latency = time.time() - start_time
 
@@ -185,6 +199,42 @@ class OpenAIClient(LLMClient):
             raise last_exception
         raise RuntimeError("OpenAI generation failed: unknown error")
 
+    def generate_json(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Generate a JSON object from OpenAI using JSON mode or structured outputs.
+
+        The API guarantees syntactically valid JSON, so callers do not need to strip markdown
+        fences or retry on malformed output.
+
+        Args:
+            prompt (str): User prompt. Must mention JSON when no schema is given.
+            system_prompt (Optional[str]): System prompt.
+            schema (Optional[Dict[str, Any]]): Strict JSON schema. Uses plain JSON mode if None.
+
+        Returns:
+            Dict[str, Any]: Parsed JSON object.
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON.
+        """
+        response_format: Dict[str, Any]
+        if schema is not None:
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {"name": "config", "schema": schema, "strict": True},
+            }
+        else:
+            response_format = {"type": "json_object"}
+
+        content = self.generate(
+            prompt, system_prompt=system_prompt, response_format=response_format
+        )
+        return cast(Dict[str, Any], json.loads(content))
+
     async def agenerate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Async generate text from OpenAI with retry logic and caching.
 
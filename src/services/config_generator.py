@@ -1,12 +1,15 @@
 """Configuration generator service providing heuristic-based configuration generation. For AI-powered configuration, use WorkflowService through the Streamlit UI's Configuration Wizard."""
 
-import re
+import json
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from src.utils.logger import get_logger
 
+LEVEL_RANK_PATTERN = r"(\d+)"
+
 
 class ConfigGenerator:
     """Service to generate configuration from data using heuristics. For AI-powered configuration, use WorkflowService through the Streamlit UI's Configuration Wizard."""
@@ -28,23 +31,14 @@ class ConfigGenerator:
         if level_col not in df.columns:
             return {}
 
-        unique_levels = df[level_col].dropna().unique().tolist()
-
-        def extract_rank(val: str) -> int:
-            """Extract numeric rank from level string.
+        unique_levels = df[level_col].dropna().unique()
+        names = pd.Series(unique_levels).astype(str)
 
-            Args:
-                val (str): Level value.
+        digits = names.str.extract(LEVEL_RANK_PATTERN, expand=False)
+        ranks = pd.to_numeric(digits).fillna(-1).to_numpy()
+        order = np.lexsort((names.to_numpy(), ranks))
 
-            Returns:
-                int: Extracted rank or -1 if not found.
-            """
-            match = re.search(r"\d+", str(val))
-            if match:
-                return int(match.group())
-            return -1
-
-        sorted_levels = sorted(unique_levels, key=lambda x: (extract_rank(x), x))
+        sorted_levels = unique_levels[order].tolist()
         return {lvl: i for i, lvl in enumerate(sorted_levels)}
 
     def infer_locations(self, df: pd.DataFrame, loc_col: str = "Location") -> Dict[str, int]:
@@ -159,6 +153,9 @@ class ConfigGenerator:
         },
     }
 
+    # Serialized once so each generated config is an independent deep copy of the template
+    _TEMPLATE_JSON = json.dumps(CONFIG_TEMPLATE)
+
     def generate_config_template(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Generates a template config using heuristics.
 
@@ -173,33 +170,14 @@ class ConfigGenerator:
         targets = self.infer_targets(df)
         features = self.infer_features(df, exclude_cols=targets)
 
-        config = {
-            "mappings": {"levels": levels, "location_targets": locations},
-            "feature_engineering": {
-                "ranked_cols": {"Level": "levels"} if levels else {},
-                "proximity_cols": ["Location"] if locations else [],
-            },
-            "location_settings": {"max_distance_km": 50},
-            "model": {
-                "targets": targets,
-                "quantiles": [0.1, 0.25, 0.5, 0.75, 0.9],
-                "sample_weight_k": 1.0,
-                "features": features,
-                "hyperparameters": {
-                    "training": {
-                        "objective": "reg:quantileerror",
-                        "tree_method": "hist",
-                        "verbosity": 0,
-                    },
-                    "cv": {
-                        "num_boost_round": 100,
-                        "nfold": 5,
-                        "early_stopping_rounds": 10,
-                        "verbose_eval": False,
-                    },
-                },
-            },
+        config: Dict[str, Any] = json.loads(self._TEMPLATE_JSON)
+        config["mappings"] = {"levels": levels, "location_targets": locations}
+        config["feature_engineering"] = {
+            "ranked_cols": {"Level": "levels"} if levels else {},
+            "proximity_cols": ["Location"] if locations else [],
         }
+        config["model"]["targets"] = targets
+        config["model"]["features"] = features
 
         return config
 
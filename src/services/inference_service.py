@@ -1,17 +1,45 @@
 """Inference service for model predictions and validation."""
 
+import copy
+import hashlib
+import json
+import math
+import threading
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from concurrent.futures import as_completed
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union, cast
 
+import numpy as np
 import pandas as pd
+from cachetools import LRUCache, TTLCache
 
 from src.services.model_registry import ModelRegistry
+from src.utils.env_loader import get_env_var
 from src.utils.logger import get_logger
 from src.xgboost.model import SalaryForecaster
 
 
+def _single_row_frame(features: Dict[str, Any]) -> pd.DataFrame:
+    """Wrap one feature dictionary as a single-row DataFrame.
+
+    Filling a preallocated object array skips the per-record type inference pandas runs for
+    pd.DataFrame([features]), which dominates single-row scoring latency. The model converts
+    feature values to numbers itself, so object columns are sufficient.
+
+    Args:
+        features (Dict[str, Any]): Input feature dictionary.
+
+    Returns:
+        pd.DataFrame: One-row frame with one column per feature.
+    """
+    values = np.empty((1, len(features)), dtype=object)
+    for i, value in enumerate(features.values()):
+        values[0, i] = value
+    return pd.DataFrame(values, columns=list(features), copy=False)
+
+
 class ModelNotFoundError(Exception):
     """Raised when a model cannot be found by run_id."""
 
@@ -35,17 +63,37 @@ class ModelSchema:
         """
         self.ranked_features: List[str] = list(model.ranked_encoders.keys())
         self.proximity_features: List[str] = list(model.proximity_encoders.keys())
-        self.numerical_features: List[str] = [
-            f
-            for f in model.feature_names
-            if f not in self.ranked_features
-            and f not in self.proximity_features
-            and f not in [f"{h}_Enc" for h in self.ranked_features]
-            and f not in [f"{h}_Enc" for h in self.proximity_features]
-        ]
+        encoded = self.ranked_features + self.proximity_features
+        excluded = set(encoded) | {f"{h}_Enc" for h in encoded}
+        self.numerical_features: List[str] = [f for f in model.feature_names if f not in excluded]
         self.all_feature_names: List[str] = model.feature_names
         self.targets: List[str] = model.targets
         self.quantiles: List[float] = model.quantiles
+        self.ranked_levels: Dict[str, FrozenSet[Any]] = {
+            col: frozenset(encoder.mapping.keys()) for col, encoder in model.ranked_encoders.items()
+        }
+        self.ranked_levels_preview: Dict[str, str] = {
+            col: self._preview(list(encoder.mapping.keys()))
+            for col, encoder in model.ranked_encoders.items()
+        }
+        self.required_features: List[Tuple[str, FrozenSet[str]]] = [
+            ("ranked", frozenset(self.ranked_features)),
+            ("proximity", frozenset(self.proximity_features)),
+            ("numerical", frozenset(self.numerical_features)),
+        ]
+
+    @staticmethod
+    def _preview(levels: List[Any], limit: int = 10) -> str:
+        """Format the first few valid levels for validation error messages.
+
+        Args:
+            levels (List[Any]): Valid levels in encoder order.
+            limit (int): Maximum number of levels to show.
+
+        Returns:
+            str: Comma-separated levels, with '...' appended when truncated.
+        """
+        return f"{', '.join(map(str, levels[:limit]))}{'...' if len(levels) > limit else ''}"
 
 
 class ValidationResult:
@@ -91,7 +139,21 @@ class InferenceService:
         """
         self.logger = get_logger(__name__)
         self.registry = model_registry or ModelRegistry()
-        self._model_cache: Dict[str, SalaryForecaster] = {}
+        self._model_cache_lock = threading.Lock()
+        # Schemas are immutable per model; weak keys let them go when the model is evicted.
+        self._schema_cache: weakref.WeakKeyDictionary[SalaryForecaster, ModelSchema] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._model_cache: TTLCache[str, SalaryForecaster] = TTLCache(
+            maxsize=int(cast(str, get_env_var("CACHE_MODEL_SIZE", "8"))),
+            ttl=int(cast(str, get_env_var("CACHE_MODEL_TTL", "3600"))),
+        )
+        # Results of repeated identical single predictions, e.g. UI reruns with unchanged inputs.
+        self._prediction_cache_size = int(cast(str, get_env_var("CACHE_PREDICTION_SIZE", "256")))
+        self._prediction_cache_lock = threading.Lock()
+        self._prediction_cache: weakref.WeakKeyDictionary[
+            SalaryForecaster, LRUCache[bytes, PredictionResult]
+        ] = weakref.WeakKeyDictionary()
 
     def load_model(self, run_id: str) -> SalaryForecaster:
         """Load a model from the registry.
@@ -105,19 +167,33 @@ class InferenceService:
         Raises:
             ModelNotFoundError: If model cannot be loaded.
         """
-        if run_id in self._model_cache:
+        with self._model_cache_lock:
+            cached_model = self._model_cache.get(run_id)
+        if cached_model is not None:
             self.logger.debug(f"Returning cached model for run_id: {run_id}")
-            return self._model_cache[run_id]
+            return cached_model
 
         try:
             self.logger.info(f"Loading model from registry: {run_id}")
             model = self.registry.load_model(run_id)
-            self._model_cache[run_id] = model
+            with self._model_cache_lock:
+                self._model_cache.expire()
+                if len(self._model_cache) >= self._model_cache.maxsize:
+                    evicted_run_id, _ = self._model_cache.popitem()
+                    self.logger.info(f"Evicted cached model for run_id: {evicted_run_id}")
+                self._model_cache[run_id] = model
             return model
         except Exception as e:
             self.logger.error(f"Failed to load model {run_id}: {e}", exc_info=True)
             raise ModelNotFoundError(f"Model with run_id '{run_id}' not found: {str(e)}") from e
 
+    def clear_cache(self) -> None:
+        """Drop all cached models and predictions so the next calls recompute them."""
+        with self._model_cache_lock:
+            self._model_cache.clear()
+        with self._prediction_cache_lock:
+            self._prediction_cache.clear()
+
     def get_model_schema(self, model: SalaryForecaster) -> ModelSchema:
         """Get the schema of a model.
 
@@ -127,7 +203,11 @@ class InferenceService:
         Returns:
             ModelSchema: Model schema.
         """
-        return ModelSchema(model)
+        schema = self._schema_cache.get(model)
+        if schema is None:
+            schema = ModelSchema(model)
+            self._schema_cache[model] = schema
+        return schema
 
     def validate_input_features(
         self, model: SalaryForecaster, features: Dict[str, Any]
@@ -141,50 +221,78 @@ class InferenceService:
         Returns:
             ValidationResult: Validation result.
         """
-        schema = self.get_model_schema(model)
-        errors: List[str] = []
+        return self.validate_input_features_batch(model, [features])[0]
 
-        required_ranked = set(schema.ranked_features)
-        required_proximity = set(schema.proximity_features)
-        required_numerical = set(schema.numerical_features)
+    def validate_input_features_batch(
+        self, model: SalaryForecaster, features_list: List[Dict[str, Any]]
+    ) -> List[ValidationResult]:
+        """Validate many input feature dictionaries against the model schema at once.
 
-        provided_features = set(features.keys())
+        Value checks run column-wise: ranked values are tested with isin against the schema's
+        level sets, and numerical values are coerced with pd.to_numeric, so only rows that fail
+        the vectorized check are inspected individually.
 
-        missing_ranked = required_ranked - provided_features
-        if missing_ranked:
-            errors.append(f"Missing ranked features: {', '.join(sorted(missing_ranked))}")
+        Args:
+            model (SalaryForecaster): Model instance.
+            features_list (List[Dict[str, Any]]): Input feature dictionaries.
 
-        missing_proximity = required_proximity - provided_features
-        if missing_proximity:
-            errors.append(f"Missing proximity features: {', '.join(sorted(missing_proximity))}")
+        Returns:
+            List[ValidationResult]: Validation result for each input, in order.
+        """
+        schema = self.get_model_schema(model)
+        row_errors: List[List[str]] = [[] for _ in features_list]
 
-        missing_numerical = required_numerical - provided_features
-        if missing_numerical:
-            errors.append(f"Missing numerical features: {', '.join(sorted(missing_numerical))}")
+        for features, errors in zip(features_list, row_errors):
+            for kind, required_features in schema.required_features:
+                missing = required_features.difference(features)
+                if missing:
+                    errors.append(f"Missing {kind} features: {', '.join(sorted(missing))}")
 
         for col in schema.ranked_features:
-            if col in features:
-                val = features[col]
-                encoder = model.ranked_encoders[col]
-                valid_levels = list(encoder.mapping.keys())
-                if val not in valid_levels:
-                    errors.append(
-                        f"Invalid value for ranked feature '{col}': '{val}'. "
-                        f"Valid values: {', '.join(valid_levels[:10])}{'...' if len(valid_levels) > 10 else ''}"
-                    )
+            rows, values = self._column_values(features_list, col)
+            if not rows:
+                continue
+            invalid = ~values.isin(schema.ranked_levels[col]).to_numpy()
+            for i in np.flatnonzero(invalid):
+                row_errors[rows[i]].append(
+                    f"Invalid value for ranked feature '{col}': '{values.iat[i]}'. "
+                    f"Valid values: {schema.ranked_levels_preview[col]}"
+                )
 
         for col in schema.numerical_features:
-            if col in features:
-                val = features[col]
+            rows, values = self._column_values(features_list, col)
+            if not rows:
+                continue
+            unparsed = pd.to_numeric(values, errors="coerce").isna().to_numpy()
+            for i in np.flatnonzero(unparsed):
+                # NaN floats coerce to NaN too but are valid numbers; confirm each candidate.
+                val = values.iat[i]
                 if not isinstance(val, (int, float)):
                     try:
                         float(val)
                     except (ValueError, TypeError):
-                        errors.append(
+                        row_errors[rows[i]].append(
                             f"Invalid value for numerical feature '{col}': '{val}'. Expected numeric value."
                         )
 
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors)
+        return [ValidationResult(is_valid=not errors, errors=errors) for errors in row_errors]
+
+    @staticmethod
+    def _column_values(
+        features_list: List[Dict[str, Any]], col: str
+    ) -> Tuple[List[int], pd.Series]:
+        """Collect the provided values of one feature across a batch.
+
+        Args:
+            features_list (List[Dict[str, Any]]): Input feature dictionaries.
+            col (str): Feature name.
+
+        Returns:
+            Tuple[List[int], pd.Series]: Row indices that provide the feature, and their values.
+        """
+        rows = [i for i, features in enumerate(features_list) if col in features]
+        values = pd.Series([features_list[i][col] for i in rows], dtype=object)
+        return rows, values
 
     def predict(self, model: SalaryForecaster, features: Dict[str, Any]) -> PredictionResult:
         """Execute prediction for given features.
@@ -199,6 +307,13 @@ class InferenceService:
         Raises:
             InvalidInputError: If input features are invalid.
         """
+        key = self._prediction_cache_key(features)
+        if key is not None:
+            with self._prediction_cache_lock:
+                cached = self._prediction_cache.get(model, {}).get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
         validation_result = self.validate_input_features(model, features)
         if not validation_result.is_valid:
             raise InvalidInputError(
@@ -206,36 +321,163 @@ class InferenceService:
             )
 
         try:
-            input_df = pd.DataFrame([features])
-            raw_predictions = model.predict(input_df)
-
-            formatted_predictions: Dict[str, Dict[str, float]] = {}
-            for target, preds in raw_predictions.items():
-                formatted_predictions[target] = {}
-                for q_key, val_array in preds.items():
-                    formatted_predictions[target][q_key] = float(val_array[0])
-
-            metadata = {
-                "model_targets": model.targets,
-                "model_quantiles": model.quantiles,
-            }
-
-            if hasattr(model, "proximity_encoders") and "Location" in model.proximity_encoders:
-                location_val = features.get("Location")
-                if location_val:
-                    encoder = model.proximity_encoders["Location"]
-                    if hasattr(encoder, "mapper") and hasattr(encoder.mapper, "get_zone"):
-                        try:
-                            zone = encoder.mapper.get_zone(location_val)
-                            metadata["location_zone"] = zone
-                        except Exception:
-                            pass
-
-            return PredictionResult(predictions=formatted_predictions, metadata=metadata)
+            raw_predictions = model.predict(_single_row_frame(features))
+            result = PredictionResult(
+                predictions=self._row_predictions(raw_predictions, 0),
+                metadata=self._prediction_metadata(model, features),
+            )
         except Exception as e:
             self.logger.error(f"Prediction failed: {e}", exc_info=True)
             raise InvalidInputError(f"Prediction failed: {str(e)}") from e
 
+        if key is not None:
+            with self._prediction_cache_lock:
+                model_cache = self._prediction_cache.get(model)
+                if model_cache is None:
+                    model_cache = LRUCache(maxsize=self._prediction_cache_size)
+                    self._prediction_cache[model] = model_cache
+                model_cache[key] = copy.deepcopy(result)
+        return result
+
+    @staticmethod
+    def _prediction_cache_key(features: Dict[str, Any]) -> Optional[bytes]:
+        """Hash a feature dictionary for the prediction result cache.
+
+        Args:
+            features (Dict[str, Any]): Input feature dictionary.
+
+        Returns:
+            Optional[bytes]: Digest of the features, or None if they should not be cached.
+        """
+        try:
+            payload = json.dumps(features, sort_keys=True, default=repr, allow_nan=False)
+        except (TypeError, ValueError):
+            # NaN/inf values and unsortable keys are scored without caching.
+            return None
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+    def predict_batch(
+        self, model: SalaryForecaster, features_list: List[Dict[str, Any]]
+    ) -> List[Union[PredictionResult, Exception]]:
+        """Execute predictions for many feature dictionaries with a single model call.
+
+        Valid rows are scored together in one DataFrame so preprocessing and XGBoost prediction
+        run once over the batch. If the batched call fails, rows are retried individually so a
+        single bad row only fails itself.
+
+        Args:
+            model (SalaryForecaster): Model instance.
+            features_list (List[Dict[str, Any]]): List of feature dictionaries.
+
+        Returns:
+            List[Union[PredictionResult, Exception]]: Result or error for each input, in order.
+        """
+        results: Dict[int, Union[PredictionResult, Exception]] = {}
+        valid_rows: List[int] = []
+        validation_results = self.validate_input_features_batch(model, features_list)
+        for index, validation_result in enumerate(validation_results):
+            if validation_result.is_valid:
+                valid_rows.append(index)
+            else:
+                results[index] = InvalidInputError(
+                    f"Invalid input features: {'; '.join(validation_result.errors)}"
+                )
+
+        if valid_rows:
+            try:
+                input_df = pd.DataFrame.from_records([features_list[i] for i in valid_rows])
+                raw_predictions = model.predict(input_df)
+                row_predictions = self._batch_predictions(raw_predictions, len(valid_rows))
+                for index, predictions in zip(valid_rows, row_predictions):
+                    results[index] = PredictionResult(
+                        predictions=predictions,
+                        metadata=self._prediction_metadata(model, features_list[index]),
+                    )
+            except Exception as e:
+                self.logger.warning(f"Batch prediction failed, retrying rows individually: {e}")
+                for index in valid_rows:
+                    try:
+                        results[index] = self.predict(model, features_list[index])
+                    except Exception as row_error:
+                        results[index] = row_error
+
+        return [results[index] for index in range(len(features_list))]
+
+    @staticmethod
+    def _row_predictions(
+        raw_predictions: Dict[str, Dict[str, Any]], position: int
+    ) -> Dict[str, Dict[str, float]]:
+        """Extract one row of model output as plain floats.
+
+        Args:
+            raw_predictions (Dict[str, Dict[str, Any]]): Model output arrays by target and quantile.
+            position (int): Row position within the predicted batch.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Predictions by target and quantile.
+        """
+        return {
+            target: {q_key: float(val_array[position]) for q_key, val_array in preds.items()}
+            for target, preds in raw_predictions.items()
+        }
+
+    @staticmethod
+    def _batch_predictions(
+        raw_predictions: Dict[str, Dict[str, Any]], n_rows: int
+    ) -> List[Dict[str, Dict[str, float]]]:
+        """Split batched model output into per-row predictions of plain floats.
+
+        Each quantile array is converted to Python floats once with tolist(), so rows are built
+        by indexing lists rather than casting every element individually.
+
+        Args:
+            raw_predictions (Dict[str, Dict[str, Any]]): Model output arrays by target and quantile.
+            n_rows (int): Number of rows in the predicted batch.
+
+        Returns:
+            List[Dict[str, Dict[str, float]]]: Predictions by target and quantile for each row.
+        """
+        columns = [
+            (target, q_key, np.asarray(val_array)[:n_rows].tolist())
+            for target, preds in raw_predictions.items()
+            for q_key, val_array in preds.items()
+        ]
+        rows: List[Dict[str, Dict[str, float]]] = [
+            {target: {} for target in raw_predictions} for _ in range(n_rows)
+        ]
+        for target, q_key, values in columns:
+            for row, value in zip(rows, values):
+                row[target][q_key] = value
+        return rows
+
+    @staticmethod
+    def _prediction_metadata(model: SalaryForecaster, features: Dict[str, Any]) -> Dict[str, Any]:
+        """Build prediction metadata, including the location zone when resolvable.
+
+        Args:
+            model (SalaryForecaster): Model instance.
+            features (Dict[str, Any]): Input feature dictionary.
+
+        Returns:
+            Dict[str, Any]: Metadata dictionary.
+        """
+        metadata: Dict[str, Any] = {
+            "model_targets": model.targets,
+            "model_quantiles": model.quantiles,
+        }
+
+        if hasattr(model, "proximity_encoders") and "Location" in model.proximity_encoders:
+            location_val = features.get("Location")
+            if location_val:
+                encoder = model.proximity_encoders["Location"]
+                if hasattr(encoder, "mapper") and hasattr(encoder.mapper, "get_zone"):
+                    try:
+                        metadata["location_zone"] = encoder.mapper.get_zone(location_val)
+                    except Exception:
+                        pass
+
+        return metadata
+
     def format_predictions(self, predictions: Dict[str, Dict[str, float]]) -> List[Dict[str, Any]]:
         """Format predictions for display.
 
@@ -261,80 +503,73 @@ class InferenceService:
     ) -> List[Tuple[int, Union[PredictionResult, Exception]]]:
         """Execute batch predictions in parallel.
 
+        The inputs are split into at most `concurrency` contiguous chunks and each chunk is scored
+        with a single predict_batch call.
+
         Args:
             model (SalaryForecaster): Model instance.
             features_list (List[Dict[str, Any]]): List of feature dictionaries.
-            concurrency (int): Maximum number of concurrent predictions.
+            concurrency (int): Maximum number of concurrent prediction chunks.
             timeout (Optional[int]): Timeout in seconds for entire batch.
 
         Returns:
             List[Tuple[int, Union[PredictionResult, Exception]]]: List of (index, result) tuples.
         """
-        results: List[Optional[Tuple[int, Union[PredictionResult, Exception]]]] = [None] * len(
-            features_list
-        )
+        results: List[Optional[Union[PredictionResult, Exception]]] = [None] * len(features_list)
+        if not features_list:
+            return []
 
-        def predict_single(
-            index: int, features: Dict[str, Any]
-        ) -> Tuple[int, Union[PredictionResult, Exception]]:
-            """Predict single item.
+        chunk_size = math.ceil(len(features_list) / max(1, concurrency))
+        chunk_starts = range(0, len(features_list), chunk_size)
+
+        def predict_chunk(start: int) -> List[Union[PredictionResult, Exception]]:
+            """Predict one contiguous chunk of items.
 
             Args:
-                index (int): Item index.
-                features (Dict[str, Any]): Feature dictionary.
+                start (int): Index of the first item in the chunk.
 
             Returns:
-                Tuple[int, Union[PredictionResult, Exception]]: Result tuple.
+                List[Union[PredictionResult, Exception]]: Results for the chunk.
             """
-            try:
-                result = self.predict(model, features)
-                return (index, result)
-            except Exception as e:
-                self.logger.error(f"Prediction failed for item {index}: {e}", exc_info=True)
-                return (index, e)
-
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            future_to_index = {
-                executor.submit(predict_single, index, features): index
-                for index, features in enumerate(features_list)
+            chunk_results = self.predict_batch(model, features_list[start : start + chunk_size])
+            for offset, result in enumerate(chunk_results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Prediction failed for item {start + offset}: {result}")
+            return chunk_results
+
+        # Managed explicitly rather than with a context manager, whose exit would block on
+        # chunks still running after a timeout.
+        executor = ThreadPoolExecutor(max_workers=len(chunk_starts))
+        try:
+            future_to_start = {
+                executor.submit(predict_chunk, start): start for start in chunk_starts
             }
 
             try:
-                if timeout:
-                    for future in as_completed(future_to_index, timeout=timeout):
-                        index = future_to_index[future]
-                        try:
-                            results[index] = future.result(timeout=1)
-                        except Exception as e:
-                            self.logger.error(
-                                f"Unexpected error for item {index}: {e}", exc_info=True
-                            )
-                            results[index] = (index, e)
-                else:
-                    for future in as_completed(future_to_index):
-                        index = future_to_index[future]
-                        try:
-                            results[index] = future.result()
-                        except Exception as e:
-                            self.logger.error(
-                                f"Unexpected error for item {index}: {e}", exc_info=True
-                            )
-                            results[index] = (index, e)
+                for future in as_completed(future_to_start, timeout=timeout or None):
+                    start = future_to_start[future]
+                    try:
+                        chunk_results = future.result()
+                    except Exception as e:
+                        self.logger.error(
+                            f"Unexpected error for items starting at {start}: {e}", exc_info=True
+                        )
+                        chunk_results = [e] * len(features_list[start : start + chunk_size])
+                    results[start : start + len(chunk_results)] = chunk_results
             except FutureTimeoutError:
-                for future, index in future_to_index.items():
-                    if not future.done():
-                        error = InvalidInputError(f"Prediction timeout for item {index}")
-                        self.logger.warning(f"Prediction timeout for item {index}")
-                        results[index] = (index, error)
-                        future.cancel()
+                pending = [start for future, start in future_to_start.items() if not future.done()]
+                for start in pending:
+                    self.logger.warning(f"Prediction timeout for items starting at {start}")
+                    for index in range(start, min(start + chunk_size, len(features_list))):
+                        results[index] = InvalidInputError(f"Prediction timeout for item {index}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         final_results: List[Tuple[int, Union[PredictionResult, Exception]]] = []
         for i, result in enumerate(results):
             if result is None:
-                error = InvalidInputError(f"Prediction not completed for item {i}")
                 self.logger.warning(f"Prediction not completed for item {i}")
-                final_results.append((i, error))
-            else:
-                final_results.append(result)
+                result = InvalidInputError(f"Prediction not completed for item {i}")
+            final_results.append((i, result))
 
         return final_results
@@ -6,7 +6,7 @@ from typing import Any, Dict, Optional, cast
 
 import pandas as pd
 
-from src.llm.client import LLMClient, get_llm_client
+from src.llm.client import LLMClient, OpenAIClient, get_llm_client
 from src.model.config_schema_model import Config
 from src.utils.logger import get_logger
 from src.utils.prompt_loader import load_prompt
@@ -71,19 +71,22 @@ class LLMService:
         prompt = user_prompt_template.format(data_sample=sample, dtypes=dtypes)
 
         self.logger.info(f"Sending request to LLM (Preset: {preset})...")
-        response_text = self.client.generate(prompt, system_prompt=system_prompt)
 
         try:
-            cleaned_text = response_text.replace("```json", "").replace("```", "").strip()
-            config_dict = json.loads(cleaned_text)
+            if isinstance(self.client, OpenAIClient):
+                config_dict = self.client.generate_json(prompt, system_prompt=system_prompt)
+            else:
+                response_text = self.client.generate(prompt, system_prompt=system_prompt)
+                cleaned_text = response_text.replace("```json", "").replace("```", "").strip()
+                config_dict = json.loads(cleaned_text)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse LLM response JSON: {e.doc}")
+            raise ValueError("LLM did not return valid JSON.") from e
 
+        try:
             validated_config = Config.model_validate(config_dict)
             self.logger.info("Successfully generated and validated config from LLM.")
             return cast(Dict[str, Any], validated_config.model_dump())
-
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse LLM response JSON: {response_text}")
-            raise ValueError("LLM did not return valid JSON.") from e
         except Exception as e:
             self.logger.error(f"Config validation failed: {e}")
             raise ValueError(f"Generated config failed validation: {e}")
@@ -1,6 +1,9 @@
-from typing import Any, List, Optional
+import pickle
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, List, Optional, Sequence, cast
 
 import mlflow
+import pandas as pd
 from mlflow.pyfunc import PythonModel
 from mlflow.tracking import MlflowClient
 
@@ -9,6 +12,33 @@ from src.utils.logger import get_logger
 from src.xgboost.model import SalaryForecaster
 
 
+def _pin_requirements(packages: Sequence[str]) -> List[str]:
+    """Pin packages to their installed versions for logged model environments.
+
+    Passing exact pins to MLflow skips its environment inference and keeps logged artifacts
+    reproducible. Packages that are not installed are left unpinned.
+
+    Args:
+        packages (Sequence[str]): Distribution names.
+
+    Returns:
+        List[str]: Requirement specifiers.
+    """
+    pinned = []
+    for package in packages:
+        try:
+            pinned.append(f"{package}=={version(package)}")
+        except PackageNotFoundError:
+            pinned.append(package)
+    return pinned
+
+
+MODEL_PIP_REQUIREMENTS = _pin_requirements(("xgboost", "pandas", "scikit-learn"))
+
+# Location of the pickled PythonModel that mlflow.pyfunc.log_model writes under the "model" path.
+PYTHON_MODEL_ARTIFACT = "model/python_model.pkl"
+
+
 def get_experiment_name() -> str:
     """Get MLflow experiment name from environment variable or default.
 
@@ -90,6 +120,7 @@ class ModelRegistry:
                 experiment_ids=experiment_ids,
                 filter_string="status = 'FINISHED'",
                 order_by=["start_time DESC"],
+                output_format="list",
             )
         except (AttributeError, ValueError) as e:
             if "'NoneType' object has no attribute 'copy'" in str(e):
@@ -99,31 +130,37 @@ class ModelRegistry:
                     "Consider cleaning up the mlruns directory or removing corrupted run directories."
                 )
                 try:
-                    runs = self._list_models_fallback()
+                    fallback_runs = self._list_models_fallback()
                 except Exception as fallback_error:
                     self.logger.error(
                         f"Fallback method also failed: {type(fallback_error).__name__}: {fallback_error}",
                         exc_info=True,
                     )
                     return []
+                return cast(List[Any], fallback_runs.to_dict("records"))
             else:
                 self.logger.error(f"Error listing models: {type(e).__name__}: {e}", exc_info=True)
                 return []
 
-        if len(runs) == 0:
-            return []
-
-        cols_to_keep = ["run_id", "start_time"]
+        return [self._run_record(run) for run in runs]
 
-        for c in runs.columns:
-            if c.startswith("tags.") or c.startswith("metrics."):
-                cols_to_keep.append(c)
+    @staticmethod
+    def _run_record(run: Any) -> Dict[str, Any]:
+        """Project an MLflow run onto the flat record shape returned by list_models.
 
-        cols_to_keep = [c for c in cols_to_keep if c in runs.columns]
-
-        from typing import Any, cast
+        Args:
+            run (Any): MLflow Run entity.
 
-        return cast(list[Any], runs[cols_to_keep].to_dict("records"))
+        Returns:
+            Dict[str, Any]: Run id, UTC start time, and 'tags.'/'metrics.' prefixed values.
+        """
+        record: Dict[str, Any] = {
+            "run_id": run.info.run_id,
+            "start_time": pd.Timestamp(run.info.start_time, unit="ms", tz="UTC"),
+        }
+        record.update((f"tags.{key}", value) for key, value in run.data.tags.items())
+        record.update((f"metrics.{key}", value) for key, value in run.data.metrics.items())
+        return record
 
     def _list_models_fallback(self) -> Any:
         """Fallback method to list models by manually iterating runs across all experiments.
@@ -133,8 +170,6 @@ class ModelRegistry:
         """
         from datetime import datetime
 
-        import pandas as pd
-
         run_data = []
         try:
             try:
@@ -226,20 +261,35 @@ class ModelRegistry:
     def load_model(self, run_id: str) -> SalaryForecaster:
         """Load the 'model' artifact from the specified run.
 
+        The pickled python model is downloaded and unpickled directly, skipping the pyfunc
+        loader's environment checks and scoring wrapper. Runs without that artifact fall back
+        to mlflow.pyfunc.load_model.
+
         Args:
             run_id (str): MLflow run ID.
 
         Returns:
             SalaryForecaster: Loaded model.
         """
-        from typing import cast
-
-        model_uri = f"runs:/{run_id}/model"
         self.logger.info(f"Loading model from run: {run_id}")
-        return cast(
-            SalaryForecaster,
-            mlflow.pyfunc.load_model(model_uri).unwrap_python_model().unwrap_python_model(),
-        )
+        try:
+            local_path = mlflow.artifacts.download_artifacts(
+                run_id=run_id, artifact_path=PYTHON_MODEL_ARTIFACT
+            )
+        except Exception as e:
+            self.logger.debug(f"Direct artifact load unavailable for run {run_id}: {e}")
+            return cast(
+                SalaryForecaster,
+                mlflow.pyfunc.load_model(f"runs:/{run_id}/model")
+                .unwrap_python_model()
+                .unwrap_python_model(),
+            )
+
+        with open(local_path, "rb") as f:
+            python_model = pickle.load(f)
+        if isinstance(python_model, SalaryForecasterWrapper):
+            python_model = python_model.unwrap_python_model()
+        return cast(SalaryForecaster, python_model)
 
     def save_model(self, model: SalaryForecaster, run_name: Optional[str] = None) -> None:
         """Save model to MLflow.
@@ -252,7 +302,7 @@ class ModelRegistry:
             mlflow.pyfunc.log_model(
                 artifact_path="model",
                 python_model=model,
-                pip_requirements=["xgboost", "pandas", "scikit-learn"],
+                pip_requirements=MODEL_PIP_REQUIREMENTS,
             )
         else:
 
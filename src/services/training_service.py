@@ -1,15 +1,21 @@
 import asyncio
 import io
 import threading
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import mlflow
 import numpy as np
 import pandas as pd
+from mlflow.entities import Metric
 
-from src.services.model_registry import SalaryForecasterWrapper, get_experiment_name
+from src.services.model_registry import (
+    MODEL_PIP_REQUIREMENTS,
+    SalaryForecasterWrapper,
+    get_experiment_name,
+)
 from src.utils.csv_validator import validate_csv
 from src.utils.logger import get_logger
 from src.utils.performance import (
@@ -22,6 +28,8 @@ from src.utils.performance import (
 )
 from src.xgboost.model import SalaryForecaster
 
+MLFLOW_MAX_METRICS_PER_BATCH = 1000
+
 
 class TrainingService:
     """Service for orchestrating model training and hyperparameter tuning."""
@@ -291,6 +299,35 @@ class TrainingService:
 
         return summary
 
+    def _log_progress_metric(self, run_id: str, key: str, value: float, step: int) -> None:
+        """Stream a progress metric to a run as soon as it is reported.
+
+        Args:
+            run_id (str): MLflow run ID to log against.
+            key (str): Metric name.
+            value (float): Metric value.
+            step (int): Metric step.
+        """
+        try:
+            mlflow.MlflowClient().log_metric(run_id, key, float(value), step=step)
+        except Exception as e:
+            self.logger.warning(f"Failed to log {key} for run {run_id}: {e}")
+
+    def _log_run_metrics(self, run_id: str, metrics: Dict[str, float]) -> None:
+        """Log the summary metrics for a finished run in a single batched request.
+
+        Args:
+            run_id (str): MLflow run ID to log against.
+            metrics (Dict[str, float]): Scalar metrics keyed by name.
+        """
+        timestamp = int(time.time() * 1000)
+        entries = [Metric(key, float(value), timestamp, 0) for key, value in metrics.items()]
+        if not entries:
+            return
+        client = mlflow.MlflowClient()
+        for start in range(0, len(entries), MLFLOW_MAX_METRICS_PER_BATCH):
+            client.log_batch(run_id, metrics=entries[start : start + MLFLOW_MAX_METRICS_PER_BATCH])
+
     async def _run_async_job(
         self,
         job_id: str,
@@ -315,6 +352,8 @@ class TrainingService:
             dataset_name (str): Dataset name.
         """
         loop = asyncio.get_event_loop()
+        # Set once the outer run starts; the callback runs in executor threads with no active run.
+        run_id: Optional[str] = None
 
         def _async_callback(msg: str, data: Optional[Dict[str, Any]] = None) -> None:
             """Thread-safe callback for training progress.
@@ -323,6 +362,7 @@ class TrainingService:
                 msg (str): Message.
                 data (Optional[Dict[str, Any]]): Optional data.
             """
+            score, step = None, None
             with self._lock:
                 if job_id in self._jobs:
                     self._jobs[job_id]["logs"].append(msg)
@@ -332,14 +372,13 @@ class TrainingService:
                             score = data.get("best_score")
                             if score is not None:
                                 self._jobs[job_id]["scores"].append(score)
-
-                            try:
-                                mlflow.log_metric("cv_score", score)
-                            except Exception:
-                                pass  # Ignore if no active run
+                                step = len(self._jobs[job_id]["scores"]) - 1
 
                     self._jobs[job_id]["last_update"] = datetime.now()
 
+            if step is not None and run_id is not None:
+                self._log_progress_metric(run_id, "cv_score", score, step)
+
         try:
             with self._lock:
                 self._jobs[job_id]["status"] = "RUNNING"
@@ -358,6 +397,7 @@ class TrainingService:
             set_global_llm_tracker(global_tracker)
 
             with mlflow.start_run(run_name=run_name) as run:
+                run_id = run.info.run_id
 
                 mlflow.set_tags(
                     {
@@ -378,6 +418,8 @@ class TrainingService:
 
                 forecaster = SalaryForecaster(config=config)
 
+                run_metrics: Dict[str, float] = {}
+
                 if do_tune:
                     self.logger.info(f"Starting tuning for job {job_id}")
                     _async_callback(f"Starting tuning with {n_trials} trials...")
@@ -388,12 +430,10 @@ class TrainingService:
                     mlflow.log_params(best_params)
                     tuning_stats = get_metric_stats("tuning_total_time")
                     if tuning_stats:
-                        mlflow.log_metric("tuning_total_time", tuning_stats["total"])
-                        mlflow.log_metric("tuning_trials_count", n_trials)
+                        run_metrics["tuning_total_time"] = tuning_stats["total"]
+                        run_metrics["tuning_trials_count"] = n_trials
                         if n_trials > 0:
-                            mlflow.log_metric(
-                                "tuning_avg_trial_time", tuning_stats["total"] / n_trials
-                            )
+                            run_metrics["tuning_avg_trial_time"] = tuning_stats["total"] / n_trials
 
                 _async_callback("Starting training...")
                 with PerformanceMetrics("training_total_time"):
@@ -405,43 +445,46 @@ class TrainingService:
                     )
                 training_stats = get_metric_stats("training_total_time")
                 if training_stats:
-                    mlflow.log_metric("training_total_time", training_stats["total"])
+                    run_metrics["training_total_time"] = training_stats["total"]
 
                 preprocessing_stats = get_metric_stats("preprocessing_feature_encoding_time")
                 if preprocessing_stats:
-                    mlflow.log_metric("preprocessing_total_time", preprocessing_stats["total"])
+                    run_metrics["preprocessing_total_time"] = preprocessing_stats["total"]
 
                 preprocessing_cleaning = get_metric_stats("preprocessing_data_cleaning_time")
                 preprocessing_outlier = get_metric_stats("preprocessing_outlier_removal_time")
                 if preprocessing_cleaning:
-                    mlflow.log_metric(
-                        "preprocessing_data_cleaning_time", preprocessing_cleaning["total"]
-                    )
+                    run_metrics["preprocessing_data_cleaning_time"] = preprocessing_cleaning[
+                        "total"
+                    ]
                 if preprocessing_outlier:
-                    mlflow.log_metric(
-                        "preprocessing_outlier_removal_time", preprocessing_outlier["total"]
-                    )
+                    run_metrics["preprocessing_outlier_removal_time"] = preprocessing_outlier[
+                        "total"
+                    ]
 
                 llm_summary = get_llm_metrics_summary()
                 if llm_summary:
-                    mlflow.log_metric("llm_total_tokens", llm_summary["total_tokens"])
-                    mlflow.log_metric("llm_total_cost", llm_summary["total_cost"])
-                    mlflow.log_metric("llm_avg_latency", llm_summary["avg_latency"])
-                    mlflow.log_metric("llm_call_count", llm_summary["call_count"])
+                    run_metrics["llm_total_tokens"] = llm_summary["total_tokens"]
+                    run_metrics["llm_total_cost"] = llm_summary["total_cost"]
+                    run_metrics["llm_avg_latency"] = llm_summary["avg_latency"]
+                    run_metrics["llm_call_count"] = llm_summary["call_count"]
+
+                with self._lock:
+                    scores = list(self._jobs[job_id].get("scores", []))
+                if scores:
+                    mean_score = float(np.mean(scores))
+                    run_metrics["cv_mean_score"] = mean_score
+                    self.logger.info(f"Job {job_id} finished. CV Mean Score: {mean_score:.4f}")
+
+                self._log_run_metrics(run_id, run_metrics)
 
                 wrapper = SalaryForecasterWrapper(forecaster)
                 mlflow.pyfunc.log_model(
                     artifact_path="model",
                     python_model=wrapper,
-                    pip_requirements=["xgboost", "pandas", "scikit-learn"],
+                    pip_requirements=MODEL_PIP_REQUIREMENTS,
                 )
 
-                scores = self._jobs[job_id].get("scores", [])
-                if scores:
-                    mean_score = np.mean(scores)
-                    mlflow.log_metric("cv_mean_score", mean_score)
-                    self.logger.info(f"Job {job_id} finished. CV Mean Score: {mean_score:.4f}")
-
                 with self._lock:
                     self._jobs[job_id]["status"] = "COMPLETED"
                     self._jobs[job_id]["result"] = forecaster
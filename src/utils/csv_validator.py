@@ -2,6 +2,31 @@ from typing import Any, Optional, Tuple
 
 import pandas as pd
 
+# Bytes read up front to detect empty files and single-column headers before parsing.
+SNIFF_BYTES = 8192
+
+
+def _header_is_single_column(head: Any, complete: bool) -> bool:
+    """Check whether the first non-blank line of a CSV head can only hold one column.
+
+    Args:
+        head (Any): Leading bytes or text of the file.
+        complete (bool): Whether head holds the whole file.
+
+    Returns:
+        bool: True if the header line is fully contained in head and has no delimiter or quote.
+    """
+    if isinstance(head, bytes):
+        try:
+            head = head.decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+
+    header = next((line for line in head.splitlines(keepends=True) if line.strip()), None)
+    if header is None or not (complete or header.endswith(("\n", "\r"))):
+        return False
+    return "," not in header and '"' not in header
+
 
 def validate_csv(file_buffer: Any) -> Tuple[bool, Optional[str], Optional[pd.DataFrame]]:
     """Validate a CSV file buffer.
@@ -14,10 +39,13 @@ def validate_csv(file_buffer: Any) -> Tuple[bool, Optional[str], Optional[pd.Dat
     """
     try:
         file_buffer.seek(0)
-        first_byte = file_buffer.read(1)
-        if not first_byte:
+        head = file_buffer.read(SNIFF_BYTES)
+        if not head.strip():
             return False, "File is empty", None
 
+        if _header_is_single_column(head, complete=len(head) < SNIFF_BYTES):
+            return False, "CSV must have at least 2 columns", None
+
         file_buffer.seek(0)
         df = pd.read_csv(file_buffer)
 
@@ -1,9 +1,41 @@
 from io import BytesIO
-from typing import Union
+from typing import Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 
+def iqr_outlier_mask(
+    df: pd.DataFrame, target_cols: Sequence[str], threshold: float = 1.5
+) -> np.ndarray:
+    """Compute a row mask keeping values inside the IQR fences of every target column.
+
+    Quartiles for all targets are computed in a single vectorized pass. Rows with a missing
+    or non-numeric target value are treated as outliers.
+
+    Args:
+        df (pd.DataFrame): Input data.
+        target_cols (Sequence[str]): Target columns to check. Columns not in df are ignored.
+        threshold (float): IQR multiplier.
+
+    Returns:
+        np.ndarray: Boolean mask, True for rows to keep.
+    """
+    cols = [c for c in target_cols if c in df.columns]
+    if not cols or len(df) == 0:
+        return np.ones(len(df), dtype=bool)
+
+    values = df[cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+    iqr = q3 - q1
+
+    lower_bound = q1 - threshold * iqr
+    upper_bound = q3 + threshold * iqr
+
+    mask: np.ndarray = ((values >= lower_bound) & (values <= upper_bound)).all(axis=1)
+    return mask
+
+
 def load_data(filepath: Union[str, BytesIO]) -> pd.DataFrame:
     """Load raw data from CSV without preprocessing.
 
@@ -1,11 +1,16 @@
 import time
-from typing import Any, Dict, Optional, Tuple, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
+import numpy as np
 from geopy.distance import geodesic
 from geopy.geocoders import Nominatim
 
 from src.utils.cache_manager import get_cache_manager
 
+# Spherical distances are within ~0.6% of WGS-84 geodesics; targets whose haversine distance
+# is within this ratio of the closest one are re-measured with geodesic.
+_SPHERE_TOLERANCE = 1.02
+
 
 class GeoMapper:
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
@@ -112,23 +117,73 @@ class GeoMapper:
         if input_city in self.zone_cache:
             return self.zone_cache[input_city]
 
-        input_coords = self._get_coords(input_city)
-        if not input_coords:
-            self.zone_cache[input_city] = 4
+        zone = self._zone_for_city(input_city, self._target_arrays())
+        self.zone_cache[input_city] = zone
+        return zone
+
+    def get_zones(self, cities: Iterable[Any]) -> np.ndarray:
+        """Determine cost zones for many cities, resolving each distinct name once.
+
+        Args:
+            cities (Iterable[Any]): City names.
+
+        Returns:
+            np.ndarray: Cost zone per input city (defaults to 4).
+        """
+        cities = list(cities)
+        targets = self._target_arrays()
+        lookup: Dict[Any, int] = {}
+        for city in dict.fromkeys(c for c in cities if isinstance(c, str)):
+            if city not in self.zone_cache:
+                self.zone_cache[city] = self._zone_for_city(city, targets)
+            lookup[city] = self.zone_cache[city]
+        return np.array([lookup.get(c, 4) if isinstance(c, str) else 4 for c in cities])
+
+    def _target_arrays(self) -> Tuple[List[str], np.ndarray]:
+        """Stack target coordinates into radians for vectorized distance checks.
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Target names and an (n, 2) array of lat/lon radians.
+        """
+        names = list(self.target_coords)
+        coords = np.radians(np.array([self.target_coords[n] for n in names], dtype=float))
+        return names, coords.reshape(-1, 2)
+
+    def _zone_for_city(self, city: str, targets: Tuple[List[str], np.ndarray]) -> int:
+        """Resolve the zone of the nearest target within the configured distance.
+
+        A vectorized haversine pass over all targets narrows the search to those within the
+        spherical approximation error of the closest one; only those candidates are measured
+        with geodesic, so the nearest target matches a full geodesic scan.
+
+        Args:
+            city (str): City name.
+            targets (Tuple[List[str], np.ndarray]): Output of _target_arrays.
+
+        Returns:
+            int: Cost zone (defaults to 4).
+        """
+        names, target_rad = targets
+        input_coords = self._get_coords(city)
+        if not input_coords or not names:
             return 4
 
+        lat, lon = np.radians(input_coords)
+        a = (
+            np.sin((target_rad[:, 0] - lat) / 2) ** 2
+            + np.cos(lat) * np.cos(target_rad[:, 0]) * np.sin((target_rad[:, 1] - lon) / 2) ** 2
+        )
+        central_angle = 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+        candidates = np.flatnonzero(central_angle <= central_angle.min() * _SPHERE_TOLERANCE)
+
         nearest_city = None
         min_dist = float("inf")
-
-        for target_city, target_coords in self.target_coords.items():
-            dist = geodesic(input_coords, target_coords).kilometers
+        for idx in candidates:
+            dist = geodesic(input_coords, self.target_coords[names[idx]]).kilometers
             if dist < min_dist:
                 min_dist = dist
-                nearest_city = target_city
+                nearest_city = names[idx]
 
-        zone = 4
         if nearest_city and min_dist <= self.settings["max_distance_km"]:
-            zone = self.targets[nearest_city]
-
-        self.zone_cache[input_city] = zone
-        return zone
+            return self.targets[nearest_city]
+        return 4
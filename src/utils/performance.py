@@ -71,6 +71,18 @@ def timing_decorator(metric_name: Optional[str] = None, log_result: bool = False
     return decorator
 
 
+def record_metric(name: str, value: float) -> None:
+    """Record a metric value measured outside a PerformanceMetrics block.
+
+    Use this for durations timed elsewhere, such as in a worker process.
+
+    Args:
+        name (str): Metric name.
+        value (float): Metric value.
+    """
+    _record_metric(name, value)
+
+
 def _record_metric(name: str, value: float) -> None:
     """Record a metric value.
 
@@ -1,9 +1,15 @@
-import os
+from functools import lru_cache
+from pathlib import Path
 
+PROMPT_DIR = Path(__file__).resolve().parent.parent / "llm" / "prompts"
 
+
+@lru_cache(maxsize=32)
 def load_prompt(prompt_name: str) -> str:
     """Load a prompt template from the 'prompts' directory.
 
+    Prompts are static at runtime, so each file is read once and served from memory after.
+
     Args:
         prompt_name (str): Filename without extension.
 
@@ -13,12 +19,9 @@ def load_prompt(prompt_name: str) -> str:
     Raises:
         FileNotFoundError: If prompt file not found.
     """
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    prompt_dir = os.path.join(current_dir, "..", "llm", "prompts")
-    prompt_path = os.path.join(prompt_dir, f"{prompt_name}.md")
-
-    if not os.path.exists(prompt_path):
-        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+    prompt_path = PROMPT_DIR / f"{prompt_name}.md"
 
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        return f.read().strip()
+    try:
+        return prompt_path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}") from None
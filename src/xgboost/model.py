@@ -1,13 +1,22 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
-
+import hashlib
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union, cast
+
+import numpy as np
 import optuna
 import pandas as pd
 from pydantic import ValidationError
 
 import xgboost as xgb
 from src.model.config_schema_model import Config
+from src.utils.cache_manager import get_cache_manager
+from src.utils.data_utils import iqr_outlier_mask
 from src.utils.logger import get_logger
-from src.utils.performance import PerformanceMetrics
+from src.utils.performance import PerformanceMetrics, record_metric
 from src.xgboost.preprocessing import (
     CostOfLivingEncoder,
     DateNormalizer,
@@ -17,6 +26,160 @@ from src.xgboost.preprocessing import (
     SampleWeighter,
 )
 
+CV_METRIC_NAME = "test-quantile-mean"
+CV_METRICS = ("quantile",)
+
+# Inputs larger than this are not memoized, so bulk scoring does not pin large matrices in memory.
+PREDICTION_CACHE_MAX_ROWS = 10_000
+
+# Threads given to each concurrent fit when n_jobs=-1 sizes the training pool automatically.
+THREADS_PER_FIT = 8
+
+YEARS_COLUMNS = ("YearsOfExperience", "YearsAtCompany")
+
+# Per-process training matrix installed by _init_training_worker in process pool workers.
+_worker_dtrain: Optional[xgb.DMatrix] = None
+
+
+def _to_float32(values: Optional[Any]) -> Optional[np.ndarray]:
+    """Convert label or weight values to a float32 array.
+
+    Args:
+        values (Optional[Any]): Series or other array-like to convert.
+
+    Returns:
+        Optional[np.ndarray]: float32 array, or None if values is None.
+    """
+    return None if values is None else np.asarray(values, dtype=np.float32)
+
+
+def _clean_years(values: pd.Series) -> pd.Series:
+    """Normalize a years column to floats, parsing strings like '11+' or '5-10'.
+
+    Numeric columns are cast directly; object columns are parsed with vectorized string ops,
+    taking the midpoint of ranges and dropping a trailing '+'.
+
+    Args:
+        values (pd.Series): Raw years column.
+
+    Returns:
+        pd.Series: Float years with the same index.
+
+    Raises:
+        ValueError: If a non-null value cannot be parsed.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float)
+
+    text = values.astype(str).str.strip()
+    out = pd.to_numeric(text, errors="coerce").astype(float)
+
+    plus_mask = out.isna() & text.str.contains("+", regex=False)
+    if plus_mask.any():
+        stripped = text[plus_mask].str.replace("+", "", regex=False)
+        out[plus_mask] = pd.to_numeric(stripped, errors="coerce")
+
+    range_mask = out.isna() & ~plus_mask & text.str.contains("-", regex=False)
+    if range_mask.any():
+        parts = text[range_mask].str.split("-", n=2, expand=True)
+        low = pd.to_numeric(parts[0], errors="coerce")
+        high = pd.to_numeric(parts[1], errors="coerce")
+        out[range_mask] = (low + high) / 2
+
+    invalid = out.isna() & values.notna() & (text.str.lower() != "nan")
+    if invalid.any():
+        raise ValueError(f"Could not parse years value: {values[invalid].iloc[0]!r}")
+    return out
+
+
+def _build_dmatrix(
+    X: pd.DataFrame, label: Optional[Any] = None, weight: Optional[Any] = None
+) -> xgb.DMatrix:
+    """Build a DMatrix from a contiguous float32 array instead of a DataFrame.
+
+    XGBoost stores features as float32 either way; converting up front skips its per-column
+    pandas dtype inspection and halves the bytes copied from float64 frames.
+
+    Args:
+        X (pd.DataFrame): Preprocessed features.
+        label (Optional[Any]): Target values.
+        weight (Optional[Any]): Sample weights.
+
+    Returns:
+        xgb.DMatrix: DMatrix carrying the frame's column names as feature names.
+    """
+    return xgb.DMatrix(
+        X.to_numpy(dtype=np.float32),
+        label=_to_float32(label),
+        weight=_to_float32(weight),
+        feature_names=[str(c) for c in X.columns],
+    )
+
+
+def _cv_and_train(
+    params: Dict[str, Any], dtrain: xgb.DMatrix, cv_params: Dict[str, Any]
+) -> Tuple[xgb.Booster, int, float]:
+    """Cross-validate to find the optimal number of rounds, then fit the final model.
+
+    Args:
+        params (Dict[str, Any]): Training parameters.
+        dtrain (xgb.DMatrix): Training data.
+        cv_params (Dict[str, Any]): CV parameters.
+
+    Returns:
+        Tuple[xgb.Booster, int, float]: Trained model, best round and best CV score.
+    """
+    cv_results = xgb.cv(
+        params,
+        dtrain,
+        num_boost_round=cv_params.get("num_boost_round", 100),
+        nfold=cv_params.get("nfold", 5),
+        early_stopping_rounds=cv_params.get("early_stopping_rounds", 10),
+        metrics=CV_METRICS,
+        seed=42,
+        verbose_eval=cv_params.get("verbose_eval", False),
+    )
+    best_round, best_score = QuantileForecaster._analyze_cv_results(cv_results, CV_METRIC_NAME)
+    model = xgb.train(params, dtrain, num_boost_round=best_round)
+    return model, best_round, best_score
+
+
+def _init_training_worker(X: pd.DataFrame, weights: pd.Series) -> None:
+    """Process pool initializer: build the shared features/weights DMatrix once per worker.
+
+    Args:
+        X (pd.DataFrame): Preprocessed features.
+        weights (pd.Series): Sample weights.
+    """
+    global _worker_dtrain
+    _worker_dtrain = _build_dmatrix(X, weight=weights)
+
+
+def _fit_quantile_model(
+    params: Dict[str, Any], label: np.ndarray, cv_params: Dict[str, Any]
+) -> Tuple[xgb.Booster, int, float, float]:
+    """Process pool task: train one quantile model on the worker's DMatrix.
+
+    Args:
+        params (Dict[str, Any]): Training parameters.
+        label (np.ndarray): Target values.
+        cv_params (Dict[str, Any]): CV parameters.
+
+    Returns:
+        Tuple[xgb.Booster, int, float, float]: Trained model, best round, best CV score and
+            elapsed training time in seconds.
+
+    Raises:
+        RuntimeError: If the worker was not initialized with _init_training_worker.
+    """
+    if _worker_dtrain is None:
+        raise RuntimeError("Training worker was not initialized with a DMatrix")
+
+    start_time = time.perf_counter()
+    _worker_dtrain.set_label(label)
+    model, best_round, best_score = _cv_and_train(params, _worker_dtrain, cv_params)
+    return model, best_round, best_score, time.perf_counter() - start_time
+
 
 class QuantileForecaster:
     def __init__(self, config: Dict[str, Any]) -> None:
@@ -94,6 +257,7 @@ class QuantileForecaster:
 
         self.features_config: List[Dict[str, Any]] = model_config["features"]
         self.feature_names: List[str] = [f["name"] for f in self.features_config]
+        self._cache_token = uuid.uuid4().hex
 
     def _preprocess(self, X: pd.DataFrame) -> pd.DataFrame:
         """Preprocesses input data.
@@ -104,24 +268,25 @@ class QuantileForecaster:
         Returns:
             pd.DataFrame: Preprocessed data.
         """
-        X_proc = X.copy()
+        # Only encoded columns are materialized; passthrough features are read straight from X.
+        encoded: Dict[str, pd.Series] = {}
 
         for col, encoder in self.ranked_encoders.items():
-            if col in X_proc.columns:
-                X_proc[f"{col}_Enc"] = encoder.transform(X_proc[col])
+            if col in X.columns:
+                encoded[f"{col}_Enc"] = encoder.transform(X[col])
 
         for col, proximity_encoder in self.proximity_encoders.items():
-            if col in X_proc.columns:
-                X_proc[f"{col}_Enc"] = proximity_encoder.transform(X_proc[col])
+            if col in X.columns:
+                encoded[f"{col}_Enc"] = proximity_encoder.transform(X[col])
 
         optional_feature_names = []
         for col, optional_encoder in self.optional_encoders.items():
-            if col in X_proc.columns:
+            if col in X.columns:
                 if (
                     isinstance(optional_encoder, DateNormalizer)
                     and optional_encoder.min_date is None
                 ):
-                    optional_encoder.fit(X_proc[col])
+                    optional_encoder.fit(X[col])
 
                 if isinstance(optional_encoder, CostOfLivingEncoder):
                     feature_name = f"{col}_CostOfLiving"
@@ -132,19 +297,19 @@ class QuantileForecaster:
                 else:
                     feature_name = f"{col}_Optional"
 
-                X_proc[feature_name] = optional_encoder.transform(X_proc[col])
+                encoded[feature_name] = optional_encoder.transform(X[col])
                 optional_feature_names.append(feature_name)
 
-        missing_feats = [f for f in self.feature_names if f not in X_proc.columns]
-        if missing_feats:
-            for f in missing_feats:
-                if f in X.columns:
-                    X_proc[f] = X[f]
-
         all_feature_names = list(self.feature_names) + [
             f for f in optional_feature_names if f not in self.feature_names
         ]
-        return X_proc[all_feature_names]
+        missing_feats = [f for f in all_feature_names if f not in encoded and f not in X.columns]
+        if missing_feats:
+            raise KeyError(f"Missing feature columns: {missing_feats}")
+
+        return pd.DataFrame(
+            {f: encoded[f] if f in encoded else X[f] for f in all_feature_names}, index=X.index
+        )
 
     def remove_outliers(
         self, df: pd.DataFrame, method: str = "iqr", threshold: float = 1.5
@@ -165,24 +330,8 @@ class QuantileForecaster:
         if method != "iqr":
             raise NotImplementedError("Only IQR method is currently supported.")
 
-        df_clean = df.copy()
-        initial_len = len(df_clean)
-
-        mask = pd.Series(True, index=df_clean.index)
-
-        for target in self.targets:
-            if target in df_clean.columns:
-                q1 = df_clean[target].quantile(0.25)
-                q3 = df_clean[target].quantile(0.75)
-                iqr = q3 - q1
-
-                lower_bound = q1 - threshold * iqr
-                upper_bound = q3 + threshold * iqr
-
-                col_mask = (df_clean[target] >= lower_bound) & (df_clean[target] <= upper_bound)
-                mask = mask & col_mask
-
-        df_clean = df_clean[mask]
+        initial_len = len(df)
+        df_clean = df.loc[iqr_outlier_mask(df, self.targets, threshold)]
         removed_count = initial_len - len(df_clean)
 
         return df_clean, removed_count
@@ -198,29 +347,9 @@ class QuantileForecaster:
         """
         df_clean = df.copy()
 
-        def clean_years(val: Union[int, float, str]) -> float:
-            """Parse year strings like '11+' or '5-10' into floats.
-
-            Args:
-                val (Union[int, float, str]): Year value.
-
-            Returns:
-                float: Parsed year.
-            """
-            if isinstance(val, (int, float)):
-                return float(val)
-            val = str(val).strip()
-            if "+" in val:
-                return float(val.replace("+", ""))
-            if "-" in val:
-                parts = val.split("-")
-                return (float(parts[0]) + float(parts[1])) / 2
-            return float(val)
-
-        if "YearsOfExperience" in df_clean.columns:
-            df_clean["YearsOfExperience"] = df_clean["YearsOfExperience"].apply(clean_years)
-        if "YearsAtCompany" in df_clean.columns:
-            df_clean["YearsAtCompany"] = df_clean["YearsAtCompany"].apply(clean_years)
+        for col in YEARS_COLUMNS:
+            if col in df_clean.columns:
+                df_clean[col] = _clean_years(df_clean[col])
 
         if "Date" in df_clean.columns:
             try:
@@ -284,6 +413,17 @@ class QuantileForecaster:
         Returns:
             Dict[str, Any]: Training parameters.
         """
+        return {**self._get_base_training_params(monotone_constraints), "quantile_alpha": quantile}
+
+    def _get_base_training_params(self, monotone_constraints: str) -> Dict[str, Any]:
+        """Get the training parameters shared by every quantile model.
+
+        Args:
+            monotone_constraints (str): Monotonic constraints string.
+
+        Returns:
+            Dict[str, Any]: Training parameters without quantile_alpha.
+        """
         hyperparams = self.model_config.get("hyperparameters", {})
         train_params_config = hyperparams.get(
             "training", {"objective": "reg:quantileerror", "tree_method": "hist", "verbosity": 0}
@@ -292,14 +432,23 @@ class QuantileForecaster:
         params: Dict[str, Any] = (
             dict(train_params_config) if isinstance(train_params_config, dict) else {}
         )
-        params.update(
-            {
-                "quantile_alpha": quantile,
-                "monotone_constraints": monotone_constraints,
-            }
-        )
+        params["monotone_constraints"] = monotone_constraints
+        device = self._get_device()
+        if device:
+            params.setdefault("device", device)
+            params.setdefault("tree_method", "hist")
         return params
 
+    def _get_device(self) -> Optional[str]:
+        """Get the XGBoost device to train on.
+
+        Returns:
+            Optional[str]: Value of hyperparameters["device"] (e.g. "cuda" or "cuda:1"), or None
+                to use XGBoost's default CPU device.
+        """
+        device = self.model_config.get("hyperparameters", {}).get("device")
+        return str(device) if device else None
+
     def _get_cv_params(self) -> Dict[str, Any]:
         """Get cross-validation parameters.
 
@@ -320,67 +469,153 @@ class QuantileForecaster:
         )
         return cast(Dict[str, Any], result)
 
-    def _train_single_model(
+    def _get_n_jobs(self, n_models: int) -> int:
+        """Get the number of quantile models to train concurrently.
+
+        Args:
+            n_models (int): Number of (target, quantile) models to train.
+
+        Returns:
+            int: Worker count, from hyperparameters["n_jobs"]. Defaults to 1, and is always 1
+                when training on a CUDA device. -1 spreads all cores over workers of
+                THREADS_PER_FIT threads each, since a single XGBoost fit scales poorly beyond that.
+        """
+        device = self._get_device()
+        if device and device.startswith("cuda"):
+            # Concurrent fits would contend for the same GPU; it already parallelizes each fit.
+            return 1
+
+        hyperparams = self.model_config.get("hyperparameters", {})
+        n_jobs = int(hyperparams.get("n_jobs", 1) or 1)
+        if n_jobs < 0:
+            n_jobs = (os.cpu_count() or 1) // THREADS_PER_FIT
+        return max(1, min(n_jobs, n_models))
+
+    def _report_training_start(
         self,
         model_name: str,
-        dtrain: xgb.DMatrix,
-        params: Dict[str, Any],
-        cv_params: Dict[str, Any],
         callback: Optional[Callable[[str, Optional[Dict[str, Any]]], None]],
-    ) -> xgb.Booster:
-        """Train a single quantile model.
+    ) -> None:
+        """Report that training of a quantile model has started.
 
         Args:
             model_name (str): Model name.
-            dtrain (xgb.DMatrix): Training data.
-            params (Dict[str, Any]): Training parameters.
-            cv_params (Dict[str, Any]): CV parameters.
             callback (Optional[Callable]): Progress callback.
-
-        Returns:
-            xgb.Booster: Trained model.
         """
         if callback:
             callback(f"Training {model_name}...", {"stage": "start", "model_name": model_name})
-        else:
-            self.logger.info(f"Training {model_name}...")
-
-        if callback:
             callback("Running Cross-Validation...", {"stage": "cv_start"})
         else:
+            self.logger.info(f"Training {model_name}...")
             self.logger.debug(f"Running Cross-Validation for {model_name}...")
 
-        cv_results = xgb.cv(
-            params,
-            dtrain,
-            num_boost_round=cv_params.get("num_boost_round", 100),
-            nfold=cv_params.get("nfold", 5),
-            early_stopping_rounds=cv_params.get("early_stopping_rounds", 10),
-            metrics={"quantile"},
-            seed=42,
-            verbose_eval=cv_params.get("verbose_eval", False),
-        )
-
-        metric_name = "test-quantile-mean"
-        best_round, best_score = self._analyze_cv_results(cv_results, metric_name)
+    def _report_cv_result(
+        self,
+        model_name: str,
+        best_round: int,
+        best_score: float,
+        callback: Optional[Callable[[str, Optional[Dict[str, Any]]], None]],
+    ) -> None:
+        """Report the cross-validation outcome of a quantile model.
 
+        Args:
+            model_name (str): Model name.
+            best_round (int): Optimal number of boosting rounds.
+            best_score (float): Best CV score.
+            callback (Optional[Callable]): Progress callback.
+        """
         if callback:
             data = {
                 "stage": "cv_end",
                 "model_name": model_name,
                 "best_round": best_round,
                 "best_score": best_score,
-                "metric_name": metric_name,
+                "metric_name": CV_METRIC_NAME,
             }
             callback(f"Best Round: {best_round}, Score: {best_score:.4f}", data)
         else:
             self.logger.info(
-                f"  Optimal rounds: {best_round}, Best {metric_name}: {best_score:.4f}"
+                f"  Optimal rounds: {best_round}, Best {CV_METRIC_NAME}: {best_score:.4f}"
             )
 
-        model = xgb.train(params, dtrain, num_boost_round=best_round)
+    def _train_single_model(
+        self,
+        model_name: str,
+        dtrain: xgb.DMatrix,
+        params: Dict[str, Any],
+        cv_params: Dict[str, Any],
+        callback: Optional[Callable[[str, Optional[Dict[str, Any]]], None]],
+    ) -> xgb.Booster:
+        """Train a single quantile model.
+
+        Args:
+            model_name (str): Model name.
+            dtrain (xgb.DMatrix): Training data.
+            params (Dict[str, Any]): Training parameters.
+            cv_params (Dict[str, Any]): CV parameters.
+            callback (Optional[Callable]): Progress callback.
+
+        Returns:
+            xgb.Booster: Trained model.
+        """
+        self._report_training_start(model_name, callback)
+        model, best_round, best_score = _cv_and_train(params, dtrain, cv_params)
+        self._report_cv_result(model_name, best_round, best_score, callback)
         return model
 
+    def _train_parallel(
+        self,
+        X: pd.DataFrame,
+        df: pd.DataFrame,
+        weights: pd.Series,
+        monotone_constraints: str,
+        cv_params: Dict[str, Any],
+        n_jobs: int,
+        callback: Optional[Callable[[str, Optional[Dict[str, Any]]], None]],
+    ) -> None:
+        """Train all (target, quantile) models concurrently in a process pool.
+
+        Features and weights are sent to each worker once, where they are binned into a DMatrix
+        that is reused for every task; tasks only carry their label. Each worker runs with an
+        equal share of the CPU threads so concurrent fits do not oversubscribe cores. Progress
+        callbacks and timing metrics are recorded in the calling process.
+
+        Args:
+            X (pd.DataFrame): Preprocessed features.
+            df (pd.DataFrame): Prepared training data containing the targets.
+            weights (pd.Series): Sample weights.
+            monotone_constraints (str): Monotonic constraints string.
+            cv_params (Dict[str, Any]): CV parameters.
+            n_jobs (int): Number of worker processes.
+            callback (Optional[Callable]): Progress callback.
+        """
+        base_params = self._get_base_training_params(monotone_constraints)
+        base_params.setdefault("nthread", max(1, (os.cpu_count() or 1) // n_jobs))
+        mp_context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=mp_context,
+            initializer=_init_training_worker,
+            initargs=(X, weights),
+        ) as executor:
+            future_to_name: Dict[Future, str] = {}
+            for target in self.targets:
+                label = _to_float32(df[target])
+                for q in self.quantiles:
+                    model_name = f"{target}_p{int(q*100)}"
+                    params = {**base_params, "quantile_alpha": q}
+                    self._report_training_start(model_name, callback)
+                    future = executor.submit(_fit_quantile_model, params, label, cv_params)
+                    future_to_name[future] = model_name
+
+            for future in as_completed(future_to_name):
+                model_name = future_to_name[future]
+                model, best_round, best_score, elapsed = future.result()
+                record_metric(f"training_quantile_{model_name}_time", elapsed)
+                self._report_cv_result(model_name, best_round, best_score, callback)
+                self.models[model_name] = model
+
     def train(
         self,
         df: pd.DataFrame,
@@ -394,6 +629,7 @@ class QuantileForecaster:
             callback (Optional[Callable]): Optional callback for status updates.
             remove_outliers (bool): If True, applies IQR outlier removal before training.
         """
+        self._cache_token = uuid.uuid4().hex
         df = self._prepare_training_data(df, remove_outliers, callback)
 
         with PerformanceMetrics("preprocessing_feature_encoding_time"):
@@ -404,59 +640,26 @@ class QuantileForecaster:
         monotone_constraints = str(tuple(constraints))
 
         cv_params = self._get_cv_params()
-        quantile_times: Dict[str, float] = {}
 
+        n_jobs = self._get_n_jobs(len(self.targets) * len(self.quantiles))
+        if n_jobs > 1:
+            self._train_parallel(X, df, weights, monotone_constraints, cv_params, n_jobs, callback)
+            return
+
+        # Features and weights are shared by every model, so bin them once and swap labels.
+        dtrain = _build_dmatrix(X, weight=weights)
+        base_params = self._get_base_training_params(monotone_constraints)
         for target in self.targets:
-            y = df[target]
-            dtrain = xgb.DMatrix(X, label=y, weight=weights)
+            dtrain.set_label(_to_float32(df[target]))
 
             for q in self.quantiles:
                 model_name = f"{target}_p{int(q*100)}"
-                params = self._get_training_params(q, monotone_constraints)
+                params = {**base_params, "quantile_alpha": q}
 
-                with PerformanceMetrics(f"training_quantile_{model_name}_time") as quantile_metric:
+                with PerformanceMetrics(f"training_quantile_{model_name}_time"):
                     model = self._train_single_model(
                         model_name, dtrain, params, cv_params, callback
                     )
-                    self.models[model_name] = model
-                    quantile_times[model_name] = quantile_metric.elapsed
-
-                dtrain = xgb.DMatrix(X, label=y, weight=weights)
-
-                if callback:
-                    callback("Running Cross-Validation...", {"stage": "cv_start"})
-                else:
-                    self.logger.debug(f"Running Cross-Validation for {model_name}...")
-
-                cv_results = xgb.cv(
-                    params,
-                    dtrain,
-                    num_boost_round=cv_params.get("num_boost_round", 100),
-                    nfold=cv_params.get("nfold", 5),
-                    early_stopping_rounds=cv_params.get("early_stopping_rounds", 10),
-                    metrics={"quantile"},
-                    seed=42,
-                    verbose_eval=cv_params.get("verbose_eval", False),
-                )
-
-                metric_name = "test-quantile-mean"
-                best_round, best_score = self._analyze_cv_results(cv_results, metric_name)
-
-                if callback:
-                    data = {
-                        "stage": "cv_end",
-                        "model_name": model_name,
-                        "best_round": best_round,
-                        "best_score": best_score,
-                        "metric_name": metric_name,
-                    }
-                    callback(f"Best Round: {best_round}, Score: {best_score:.4f}", data)
-                else:
-                    self.logger.info(
-                        f"  Optimal rounds: {best_round}, Best {metric_name}: {best_score:.4f}"
-                    )
-
-                model = xgb.train(params, dtrain, num_boost_round=best_round)
                 self.models[model_name] = model
 
     def tune(
@@ -484,7 +687,7 @@ class QuantileForecaster:
         constraints = [f["monotone_constraint"] for f in self.features_config]
         monotone_constraints = str(tuple(constraints))
 
-        dtrain = xgb.DMatrix(X, label=y, weight=weights)
+        dtrain = _build_dmatrix(X, label=y, weight=weights)
 
         def objective(trial: optuna.trial.Trial) -> float:
             """Optuna objective function for hyperparameter optimization.
@@ -514,15 +717,13 @@ class QuantileForecaster:
                 num_boost_round=100,
                 nfold=3,
                 early_stopping_rounds=10,
-                metrics={"quantile"},
+                metrics=CV_METRICS,
                 seed=42,
                 verbose_eval=False,
             )
 
-            score = cv_results["test-quantile-mean"].min()
-            from typing import cast
-
-            return cast(float, score)
+            _, score = self._analyze_cv_results(cv_results, CV_METRIC_NAME)
+            return score
 
         study = optuna.create_study(direction="minimize")
         study.optimize(objective, n_trials=n_trials, timeout=timeout)
@@ -537,27 +738,109 @@ class QuantileForecaster:
 
         return cast(Dict[str, Any], best_params)
 
-    def predict(self, X_input: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    @staticmethod
+    def _frame_from_columns(columns: Mapping[str, Any]) -> pd.DataFrame:
+        """Builds a DataFrame from a column mapping using the column-oriented constructor.
+
+        Args:
+            columns (Mapping[str, Any]): Column name to scalar or array-like of values. Scalars are
+                broadcast against array-like columns; an all-scalar mapping yields one row.
+
+        Returns:
+            pd.DataFrame: Input frame.
+        """
+        if all(np.ndim(values) == 0 for values in columns.values()):
+            return pd.DataFrame(dict(columns), index=[0])
+        return pd.DataFrame(dict(columns))
+
+    def _prediction_cache_key(self, X: pd.DataFrame) -> Optional[str]:
+        """Build a content-hash cache key for a prediction input.
+
+        Args:
+            X (pd.DataFrame): Raw prediction input.
+
+        Returns:
+            Optional[str]: Cache key, or None if the input should not be cached.
+        """
+        if len(X) > PREDICTION_CACHE_MAX_ROWS:
+            return None
+        # hash_pandas_object stringifies object values (5 and "5", None and "None" collide), so
+        # the value types of object columns are hashed alongside the values themselves.
+        try:
+            row_hashes = pd.util.hash_pandas_object(X, index=False).to_numpy()
+            type_hashes = [
+                pd.util.hash_pandas_object(
+                    X.iloc[:, i].map(lambda v: type(v).__qualname__), index=False
+                ).to_numpy()
+                for i in np.flatnonzero(X.dtypes == object)
+            ]
+        except TypeError:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\x1f".join(map(str, X.columns)).encode())
+        digest.update("\x1f".join(map(str, X.dtypes)).encode())
+        digest.update(row_hashes.tobytes())
+        for hashes in type_hashes:
+            digest.update(hashes.tobytes())
+        # Unpickled models from before the cache existed have no token yet.
+        token = getattr(self, "_cache_token", None)
+        if token is None:
+            token = self._cache_token = uuid.uuid4().hex
+        return f"predict:{token}:{digest.hexdigest()}"
+
+    def _get_prediction_matrix(self, X: pd.DataFrame) -> xgb.DMatrix:
+        """Preprocess input into a DMatrix, reusing the result for repeated inputs.
+
+        Args:
+            X (pd.DataFrame): Raw prediction input.
+
+        Returns:
+            xgb.DMatrix: Prediction matrix.
+        """
+        key = self._prediction_cache_key(X)
+        cache_manager = get_cache_manager()
+        if key is not None:
+            cached = cache_manager.get("preprocessing", key)
+            if cached is not None:
+                return cast(xgb.DMatrix, cached)
+
+        dtest = _build_dmatrix(self._preprocess(X))
+        if key is not None:
+            cache_manager.set("preprocessing", key, dtest)
+        return dtest
+
+    def predict(self, X_input: Union[pd.DataFrame, Mapping[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Generates predictions for input data.
 
         Args:
-            X_input (pd.DataFrame): Input data with features matching training columns.
+            X_input (Union[pd.DataFrame, Mapping[str, Any]]): Input data with features matching
+                training columns, either as a DataFrame or a column mapping of arrays/scalars.
 
         Returns:
             Dict[str, Dict[str, Any]]: A nested dictionary: {target: {quantile_key: predictions}}.
         """
-        X_proc = self._preprocess(X_input)
-        dtest = xgb.DMatrix(X_proc)
+        if not isinstance(X_input, pd.DataFrame):
+            X_input = self._frame_from_columns(X_input)
+        dtest = self._get_prediction_matrix(X_input)
+
+        results: Dict[str, Dict[str, Any]] = {target: {} for target in self.targets}
+        available = [
+            (target, f"p{int(q*100)}", f"{target}_p{int(q*100)}")
+            for target in self.targets
+            for q in self.quantiles
+            if f"{target}_p{int(q*100)}" in self.models
+        ]
 
-        results: Dict[str, Dict[str, Any]] = {}
-        for target in self.targets:
-            target_res = {}
-            for q in self.quantiles:
-                model_name = f"{target}_p{int(q*100)}"
-                if model_name in self.models:
-                    preds = self.models[model_name].predict(dtest)
-                    target_res[f"p{int(q*100)}"] = preds
-            results[target] = target_res
+        # All quantile predictions share one column-major buffer; each result is a contiguous
+        # column view rather than a separately allocated array.
+        out: Optional[np.ndarray] = None
+        for i, (target, q_key, model_name) in enumerate(available):
+            preds = self.models[model_name].predict(dtest)
+            if out is None:
+                out = np.empty((len(preds), len(available)), dtype=np.float32, order="F")
+            out[:, i] = preds
+            results[target][q_key] = out[:, i]
 
         return results
 
@@ -582,10 +865,10 @@ class QuantileForecaster:
                 f"Metric {metric_name} not found in CV results columns: {cv_results.columns}"
             )
 
-        best_round = cv_results[metric_name].argmin() + 1
-        best_score = float(cv_results[metric_name].min())
+        scores = cv_results[metric_name].to_numpy(dtype=np.float64)
+        best_idx = int(np.nanargmin(scores))
 
-        return best_round, best_score
+        return best_idx + 1, float(scores[best_idx])
 
 
 # Backward Compatibility Aliases
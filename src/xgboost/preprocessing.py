@@ -1,11 +1,92 @@
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from src.utils.geo_utils import GeoMapper
 from src.utils.performance import PerformanceMetrics
 
+NS_PER_DAY = 86_400_000_000_000
+DAYS_PER_YEAR = 365.25
+
+
+def _map_unique_locations(
+    X: pd.Series, func: Callable[[List[str]], Iterable[int]], default: int
+) -> pd.Series:
+    """Map locations by evaluating func once over the distinct string values.
+
+    Values are factorized into integer codes (categorical input reuses its existing codes), so
+    the per-row step is an array gather from the per-unique results.
+
+    Args:
+        X (pd.Series): Input locations.
+        func (Callable[[List[str]], Iterable[int]]): Batch mapping for distinct location strings.
+        default (int): Value for missing or non-string entries.
+
+    Returns:
+        pd.Series: Mapped integer values aligned with X.
+    """
+    codes, uniques = pd.factorize(X)
+    is_str = np.fromiter((isinstance(loc, str) for loc in uniques), dtype=bool, count=len(uniques))
+    # Missing values get code -1, which selects the trailing default sentinel.
+    values = np.full(len(uniques) + 1, default, dtype=np.int64)
+    if is_str.any():
+        values[np.flatnonzero(is_str)] = np.fromiter(
+            func([loc for loc in uniques if isinstance(loc, str)]), dtype=np.int64
+        )
+    return pd.Series(values[codes], index=X.index)
+
+
+def _as_series(X: Any) -> pd.Series:
+    """Return the single input column as a Series without copying Series input.
+
+    Args:
+        X (Any): Series, DataFrame (first column is used), or array-like.
+
+    Returns:
+        pd.Series: Input values.
+    """
+    if isinstance(X, pd.Series):
+        return X
+    if isinstance(X, pd.DataFrame):
+        return X.iloc[:, 0]
+    return pd.Series(X)
+
+
+def _as_datetime(X: Any) -> Any:
+    """Coerce input to datetimes, skipping the parse when X is already datetime64.
+
+    Args:
+        X (Any): Dates as strings, timestamps, or a datetime64 Series.
+
+    Returns:
+        Any: Datetime values, with unparseable entries as NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(X):
+        return X
+    return pd.to_datetime(X, errors="coerce", cache=True)
+
+
+def _datetime_values(X: pd.Series) -> np.ndarray:
+    """Get the datetime64[ns] values of a date column.
+
+    A single value is parsed as a scalar, which skips the fixed cost of Series parsing on the
+    one-row inputs seen at prediction time.
+
+    Args:
+        X (pd.Series): Dates as strings, timestamps, or datetime64 values.
+
+    Returns:
+        np.ndarray: datetime64[ns] values (UTC for timezone-aware input), NaT where unparseable.
+    """
+    if len(X) == 1 and not pd.api.types.is_datetime64_any_dtype(X):
+        value = pd.to_datetime(X.iat[0], errors="coerce")
+        if pd.isna(value):
+            return np.full(1, np.datetime64("NaT"), dtype="datetime64[ns]")
+        return np.array([pd.Timestamp(value).value], dtype=np.int64).view("datetime64[ns]")
+    return _as_datetime(X).to_numpy(dtype="datetime64[ns]")
+
 
 class RankedCategoryEncoder:
     """Maps ordinal categorical values to integers based on a provided mapping."""
@@ -60,9 +141,29 @@ class RankedCategoryEncoder:
             pd.Series: Integer encoded categories. Unknown categories mapped to -1.
         """
         with PerformanceMetrics("preprocessing_ranked_encoder_time"):
-            if isinstance(X, pd.DataFrame):
-                X = X.iloc[:, 0]
-            return pd.Series(X).map(self.mapping).fillna(-1).astype(int)
+            X = _as_series(X)
+
+            # Misses get position -1, which selects the trailing -1 sentinel in codes.
+            keys, codes = self._get_lookup()
+            positions = keys.get_indexer(X.to_numpy())
+            return pd.Series(codes[positions], index=X.index)
+
+    def _get_lookup(self) -> Tuple[pd.Index, np.ndarray]:
+        """Get the cached key index and code array for the current mapping.
+
+        The lookup is built lazily and rebuilt when self.mapping is reassigned or resized, so
+        encoders unpickled from older models (without the cache) keep working.
+
+        Returns:
+            Tuple[pd.Index, np.ndarray]: Category index and codes with a trailing -1 sentinel.
+        """
+        cache = getattr(self, "_lookup_cache", None)
+        if cache is None or cache[0] is not self.mapping or cache[1] != len(self.mapping):
+            keys = pd.Index(list(self.mapping.keys()), dtype=object)
+            codes = np.append(np.asarray(list(self.mapping.values()), dtype=int), -1)
+            cache = (self.mapping, len(self.mapping), keys, codes)
+            self._lookup_cache = cache
+        return cache[2], cache[3]
 
 
 class ProximityEncoder:
@@ -98,15 +199,9 @@ class ProximityEncoder:
             pd.Series: Cost zones (1-4).
         """
         with PerformanceMetrics("preprocessing_proximity_encoder_time"):
-            if isinstance(X, pd.DataFrame):
-                X = X.iloc[:, 0]
-
-            def map_loc(loc: Any) -> int:
-                if not isinstance(loc, str):
-                    return 4
-                return self.mapper.get_zone(loc)
+            X = _as_series(X)
 
-            return X.apply(map_loc)
+            return _map_unique_locations(X, self.mapper.get_zones, 4)
 
 
 class SampleWeighter:
@@ -148,29 +243,35 @@ class SampleWeighter:
             X (Union[pd.DataFrame, pd.Series]): Input dates or dataframe containing date_col.
 
         Returns:
-            pd.Series: Calculated weights.
+            pd.Series: Calculated float32 weights.
         """
-        if isinstance(X, pd.DataFrame):
-            if self.date_col in X.columns:
-                X = X[self.date_col]
-            else:
-                X = X.iloc[:, 0]
+        if isinstance(X, pd.DataFrame) and self.date_col in X.columns:
+            X = X[self.date_col]
+        X = _as_series(X)
+        if len(X) == 0:
+            return pd.Series(index=X.index, dtype=np.float32)
 
         try:
-            X_parsed = pd.to_datetime(X, errors="coerce")
-            if X_parsed.isna().all():
-                return pd.Series(1.0, index=X.index if isinstance(X, pd.Series) else range(len(X)))
-            X = X_parsed
-        except Exception:
-            return pd.Series(1.0, index=X.index if isinstance(X, pd.Series) else range(len(X)))
+            dates = _datetime_values(X)
+        except (TypeError, ValueError):
+            # e.g. mixed timezones, which coercion cannot resolve
+            dates = np.full(len(X), np.datetime64("NaT"), dtype="datetime64[ns]")
 
-        age_days = (self.ref_date - X).dt.days
-        age_years = age_days / 365.25
+        missing = np.isnat(dates)
+        if missing.all():
+            return pd.Series(1.0, index=X.index, dtype=np.float32)
 
-        age_years = age_years.clip(lower=0)
+        # Whole days of age from int64 nanoseconds; NaT entries wrap here and become NaN below.
+        age_days = (pd.Timestamp(self.ref_date).value - dates.view(np.int64)) // NS_PER_DAY
 
-        weights = 1 / (1 + age_years) ** self.k
-        return weights
+        # Single float32 buffer updated in place: 1 / (1 + max(age_years, 0)) ** k
+        weights = np.divide(age_days, DAYS_PER_YEAR, dtype=np.float32)
+        weights[missing] = np.nan
+        np.maximum(weights, 0.0, out=weights)
+        weights += 1.0
+        np.power(weights, self.k, out=weights)
+        np.reciprocal(weights, out=weights)
+        return pd.Series(weights, index=X.index)
 
 
 class CostOfLivingEncoder:
@@ -206,15 +307,9 @@ class CostOfLivingEncoder:
             pd.Series: Cost of living tiers (1-4, where 1 is highest cost).
         """
         with PerformanceMetrics("preprocessing_cost_of_living_encoder_time"):
-            if isinstance(X, pd.DataFrame):
-                X = X.iloc[:, 0]
+            X = _as_series(X)
 
-            def map_loc(loc: Any) -> int:
-                if not isinstance(loc, str):
-                    return 4
-                return self.mapper.get_zone(loc)
-
-            return X.apply(map_loc)
+            return _map_unique_locations(X, self.mapper.get_zones, 4)
 
 
 class MetroPopulationEncoder:
@@ -251,16 +346,38 @@ class MetroPopulationEncoder:
             pd.Series: Approximate population values.
         """
         with PerformanceMetrics("preprocessing_metro_population_encoder_time"):
-            if isinstance(X, pd.DataFrame):
-                X = X.iloc[:, 0]
+            X = _as_series(X)
+
+            zones = _map_unique_locations(X, self.mapper.get_zones, 4).to_numpy()
+            lut = self._get_population_lut()
+            in_table = (zones >= 0) & (zones < len(lut))
+            populations = np.where(
+                in_table, lut[np.where(in_table, zones, 0)], self.population_map[4]
+            )
+            return pd.Series(populations, index=X.index)
 
-            def map_loc(loc: Any) -> int:
-                if not isinstance(loc, str):
-                    return self.population_map[4]
-                zone = self.mapper.get_zone(loc)
-                return self.population_map.get(zone, self.population_map[4])
+    def _get_population_lut(self) -> np.ndarray:
+        """Get the cached zone-indexed population table for the current population_map.
 
-            return X.apply(map_loc)
+        The table is built lazily and rebuilt when population_map is reassigned or resized, so
+        encoders unpickled from older models (without the cache) keep working.
+
+        Returns:
+            np.ndarray: Populations indexed by zone; unmapped zones hold the zone 4 population.
+        """
+        cache = getattr(self, "_population_lut_cache", None)
+        if (
+            cache is None
+            or cache[0] is not self.population_map
+            or cache[1] != len(self.population_map)
+        ):
+            default = self.population_map[4]
+            lut = np.full(max(self.population_map) + 1, default, dtype=np.int64)
+            for zone, population in self.population_map.items():
+                lut[zone] = population
+            cache = (self.population_map, len(self.population_map), lut)
+            self._population_lut_cache = cache
+        return cache[2]
 
 
 class DateNormalizer:
@@ -286,15 +403,16 @@ class DateNormalizer:
         Returns:
             DateNormalizer: Self instance.
         """
-        if isinstance(X, pd.DataFrame):
-            X = X.iloc[:, 0]
+        X = _as_series(X)
 
-        X = pd.to_datetime(X, errors="coerce")
-        valid_dates = X.dropna()
+        X = _as_datetime(X)
+        dates = X.to_numpy(dtype="datetime64[ns]")
+        valid_ns = dates.view(np.int64)[~np.isnat(dates)]
 
-        if len(valid_dates) > 0:
-            self.min_date = valid_dates.min()
-            self.max_date = valid_dates.max()
+        if valid_ns.size > 0:
+            tz = getattr(X.dtype, "tz", None)
+            self.min_date = pd.Timestamp(valid_ns.min(), tz=tz)
+            self.max_date = pd.Timestamp(valid_ns.max(), tz=tz)
         else:
             self.min_date = pd.Timestamp.now()
             self.max_date = pd.Timestamp.now()
@@ -308,7 +426,7 @@ class DateNormalizer:
             X (Union[pd.DataFrame, pd.Series]): Input dates.
 
         Returns:
-            pd.Series: Normalized dates (0.0 to 1.0).
+            pd.Series: Normalized float32 dates (0.0 to 1.0).
 
         Raises:
             ValueError: If normalizer has not been fitted.
@@ -317,25 +435,21 @@ class DateNormalizer:
             raise ValueError("DateNormalizer must be fitted before transform")
 
         with PerformanceMetrics("preprocessing_date_normalizer_time"):
-            if isinstance(X, pd.DataFrame):
-                X = X.iloc[:, 0]
-
-            X = pd.to_datetime(X, errors="coerce")
-
-            date_range = (self.max_date - self.min_date).total_seconds()
-
-            if date_range == 0:
-                return pd.Series([1.0] * len(X), index=X.index)
+            X = _as_series(X)
 
-            if self.mode == "normalize_recent":
-                normalized = (X - self.min_date).dt.total_seconds() / date_range
-            else:
-                normalized = (X - self.min_date).dt.total_seconds() / date_range
+            # Both modes map the earliest fitted date to 0.0 and the latest to 1.0.
+            span = self.max_date.value - self.min_date.value
+            if span == 0 or len(X) == 0:
+                return pd.Series(1.0, index=X.index, dtype=np.float32)
 
-            normalized = normalized.fillna(0.0)
-            normalized = normalized.clip(0.0, 1.0)
+            dates = _datetime_values(X)
+            # int64 nanosecond offsets; NaT entries wrap here and are reset to 0.0 below.
+            offsets = dates.view(np.int64) - np.int64(self.min_date.value)
+            normalized = np.divide(offsets, span, dtype=np.float32)
+            np.clip(normalized, 0.0, 1.0, out=normalized)
+            normalized[np.isnat(dates)] = 0.0
 
-            return normalized
+            return pd.Series(normalized, index=X.index)
 
 
 # Backward Compatibility Aliases
@@ -6,6 +6,7 @@ import pytest
 
 from src.model.config_schema_model import Config
 from src.utils.cache_manager import get_cache_manager
+from src.utils.prompt_loader import load_prompt
 
 
 def create_test_config() -> Dict[str, Any]:
@@ -67,5 +68,7 @@ def clear_cache():
     """Clear all caches before each test to ensure clean state."""
     cache_manager = get_cache_manager()
     cache_manager.clear()
+    load_prompt.cache_clear()
     yield
     cache_manager.clear()
+    load_prompt.cache_clear()
@@ -629,7 +629,7 @@ class TestTrainingWithOptionalEncodings(unittest.TestCase):
         mock_cv.return_value = pd.DataFrame({"test-quantile-mean": [0.5]})
 
         mock_mapper = mock_geo_mapper.return_value
-        mock_mapper.get_zone.return_value = 1
+        mock_mapper.get_zones.side_effect = lambda cities: [1] * len(cities)
 
         from src.xgboost.model import QuantileForecaster
 
@@ -733,7 +733,7 @@ class TestTrainingWithOptionalEncodings(unittest.TestCase):
         mock_cv.return_value = pd.DataFrame({"test-quantile-mean": [0.5]})
 
         mock_mapper = mock_geo_mapper.return_value
-        mock_mapper.get_zone.return_value = 1
+        mock_mapper.get_zones.side_effect = lambda cities: [1] * len(cities)
 
         from src.xgboost.model import QuantileForecaster
 
@@ -98,14 +98,14 @@ class TestDirectModeServiceUsage:
 
     @patch.dict(os.environ, {"USE_API": "false"})
     @patch("src.app.service_factories.get_inference_service")
-    @patch("src.app.inference_ui.ModelRegistry")
+    @patch("src.app.inference_ui.get_model_registry")
     @patch("src.app.inference_ui.st")
     def test_inference_ui_uses_service_factories_when_disabled(
-        self, mock_st, mock_registry_class, mock_get_inference_service
+        self, mock_st, mock_get_registry, mock_get_inference_service
     ):
         """Verify inference UI uses service factories when API is disabled."""
         mock_registry = MagicMock()
-        mock_registry_class.return_value = mock_registry
+        mock_get_registry.return_value = mock_registry
         mock_registry.list_models.return_value = []
 
         mock_st.session_state = {}
@@ -114,8 +114,8 @@ class TestDirectModeServiceUsage:
 
         render_inference_ui()
 
-        # Verify ModelRegistry was used for listing (matching API pattern)
-        mock_registry_class.assert_called_once()
+        # Verify the registry was used for listing (matching API pattern)
+        mock_get_registry.assert_called_once()
         mock_registry.list_models.assert_called_once()
 
     @patch.dict(os.environ, {"USE_API": "false"})
@@ -169,10 +169,10 @@ class TestDirectModeServiceUsage:
 
     @patch.dict(os.environ, {"USE_API": "false"})
     @patch("src.app.inference_ui.get_inference_service")
-    @patch("src.app.inference_ui.ModelRegistry")
+    @patch("src.app.inference_ui.get_model_registry")
     @patch("src.app.inference_ui.st")
     def test_inference_ui_model_loading_uses_inference_service(
-        self, mock_st, mock_registry_class, mock_get_inference_service
+        self, mock_st, mock_get_registry, mock_get_inference_service
     ):
         """Verify model loading uses InferenceService, not ModelRegistry directly."""
         from src.services.inference_service import ModelSchema
@@ -186,7 +186,7 @@ class TestDirectModeServiceUsage:
         }
 
         mock_registry = MagicMock()
-        mock_registry_class.return_value = mock_registry
+        mock_get_registry.return_value = mock_registry
         mock_registry.list_models.return_value = [run_data]
 
         mock_inference_service = MagicMock()
@@ -274,10 +274,10 @@ class TestErrorHandlingAlignment:
 
     @patch.dict(os.environ, {"USE_API": "false"})
     @patch("src.app.service_factories.get_inference_service")
-    @patch("src.app.inference_ui.ModelRegistry")
+    @patch("src.app.inference_ui.get_model_registry")
     @patch("src.app.inference_ui.st")
     def test_model_not_found_error_handling(
-        self, mock_st, mock_registry_class, mock_get_inference_service
+        self, mock_st, mock_get_registry, mock_get_inference_service
     ):
         """Verify ModelNotFoundError is handled correctly in direct mode."""
         from src.services.inference_service import ModelNotFoundError
@@ -291,7 +291,7 @@ class TestErrorHandlingAlignment:
         }
 
         mock_registry = MagicMock()
-        mock_registry_class.return_value = mock_registry
+        mock_get_registry.return_value = mock_registry
         mock_registry.list_models.return_value = [run_data]
 
         mock_inference_service = MagicMock()
@@ -339,14 +339,14 @@ class TestServiceFactoryCaching:
 
     @patch.dict(os.environ, {"USE_API": "false"})
     @patch("src.app.service_factories.get_inference_service")
-    @patch("src.app.inference_ui.ModelRegistry")
+    @patch("src.app.inference_ui.get_model_registry")
     @patch("src.app.inference_ui.st")
     def test_service_instances_are_cached(
-        self, mock_st, mock_registry_class, mock_get_inference_service
+        self, mock_st, mock_get_registry, mock_get_inference_service
     ):
         """Verify service factory pattern is used (caching handled by @st.cache_resource)."""
         mock_registry = MagicMock()
-        mock_registry_class.return_value = mock_registry
+        mock_get_registry.return_value = mock_registry
         mock_registry.list_models.return_value = []
 
         mock_st.session_state = {}
@@ -356,7 +356,7 @@ class TestServiceFactoryCaching:
         # Call render_inference_ui
         render_inference_ui()
 
-        # Verify ModelRegistry was used for listing (matching API pattern)
+        # Verify the registry was used for listing (matching API pattern)
         mock_registry.list_models.assert_called()
 
         # Note: The actual caching behavior is tested in test_service_factories.py
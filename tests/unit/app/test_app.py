@@ -1,144 +1,210 @@
 import os
-import unittest
-from unittest.mock import patch
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, create_autospec, patch
 
-from streamlit.testing.v1 import AppTest
+import pytest
+from conftest import create_test_config
 
-from src.app.app import main
-
-
-class TestStreamlitApp(unittest.TestCase):
-    def setUp(self):
-        self.app_path = "src/app/app.py"
-
-        if not os.path.exists(self.app_path):
-            self.fail(f"App file not found at {self.app_path}")
-
-    def test_app_smoke(self):
-        at = AppTest.from_file(self.app_path)
-        at.run()
-
-        self.assertTrue(len(at.header) > 0)
-        self.assertEqual(at.header[0].value, "Model Training")
-
-        self.assertTrue(at.sidebar.title[0].value == "Navigation")
-
-    def test_navigation_training(self):
-        at = AppTest.from_file(self.app_path)
-        at.run()
-
-        at.sidebar.radio[0].set_value("Training").run()
-
-        self.assertEqual(at.header[0].value, "Model Training")
-
-        if len(at.checkbox) > 0:
-            self.assertTrue(
-                len(at.checkbox) >= 2, "Should have at least 2 checkboxes (Outliers, Tune)"
-            )
-
-    def test_navigation_inference(self):
-        at = AppTest.from_file(self.app_path)
-        at.run()
-
-        at.sidebar.radio[0].set_value("Inference").run()
-
-        self.assertEqual(at.header[0].value, "Salary Inference")
-
-        has_warning = len(at.warning) > 0
-        has_selectbox = len(at.selectbox) > 0
-
-        self.assertTrue(
-            has_warning or has_selectbox or len(at.header) > 0,
-            "Should show header (and optionally warning or model selector)",
-        )
-
-        if has_selectbox:
-            subheaders = [sh.value for sh in at.subheader]
-            self.assertTrue(len(subheaders) > 0, "Should have subheaders when model is loaded")
-
-    def test_navigation_configuration_removed(self):
-        at = AppTest.from_file(self.app_path)
-        at.run()
-
-        radio_options = at.sidebar.radio[0].options
-        self.assertNotIn("Configuration", radio_options)
-        self.assertNotIn("Data Analysis", radio_options)
-        self.assertNotIn("Model Analysis", radio_options)
-        self.assertIn("Training", radio_options)
-        self.assertIn("Inference", radio_options)
-
-    def test_inference_inputs(self):
-        at = AppTest.from_file(self.app_path)
-        at.run()
-        at.sidebar.radio[0].set_value("Inference").run()
-
-        if at.selectbox:
-            subheaders = [sh.value for sh in at.subheader]
-            self.assertTrue(len(subheaders) > 0, "Should have subheaders when model is loaded")
-
-            self.assertTrue(
-                any("Model Information" in sh.value for sh in at.subheader),
-                "Should show Model Information section",
-            )
-
-
-class TestMain(unittest.TestCase):
-    @patch("src.app.app.st")
-    @patch("src.app.app.render_training_ui")
-    def test_main_defaults_to_training(self, mock_render_training, mock_st):
-        mock_st.session_state = {}
-        mock_st.sidebar.radio.return_value = "Training"
-
-        main()
-
-        mock_st.set_page_config.assert_called_once()
-        mock_st.sidebar.title.assert_called_with("Navigation")
-        mock_render_training.assert_called_once()
-        # Verify config_override is initialized to None
-        self.assertIn("config_override", mock_st.session_state)
-        self.assertIsNone(mock_st.session_state["config_override"])
-
-    @patch("src.app.app.st")
-    @patch("src.app.app.render_inference_ui")
-    def test_main_navigation_to_inference(self, mock_render_inference, mock_st):
-        mock_st.session_state = {"nav": "Inference"}
-        mock_st.sidebar.radio.return_value = "Inference"
-
-        main()
-
-        mock_render_inference.assert_called_once()
-        # Verify config_override is initialized to None
-        self.assertIn("config_override", mock_st.session_state)
-        self.assertIsNone(mock_st.session_state["config_override"])
-
-    @patch("src.app.app.st")
-    @patch("src.app.app.render_training_ui")
-    def test_main_initializes_empty_config_state(self, mock_render_training, mock_st):
-        """Test that app initializes with empty config state."""
-        mock_st.session_state = {}
-        mock_st.sidebar.radio.return_value = "Training"
-
-        main()
-
-        # Verify config_override is initialized
-        self.assertIn("config_override", mock_st.session_state)
-        self.assertIsNone(mock_st.session_state["config_override"])
-
-    @patch("src.app.app.st")
-    @patch("src.app.app.render_training_ui")
-    def test_main_preserves_existing_config(self, mock_render_training, mock_st):
-        """Test that app preserves existing config from workflow wizard."""
-        import sys
-        from pathlib import Path
-
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-        from conftest import create_test_config
-
-        existing_config = create_test_config()
-        mock_st.session_state = {"config_override": existing_config}
-        mock_st.sidebar.radio.return_value = "Training"
-
-        main()
-
-        # Verify existing config is preserved
-        self.assertEqual(mock_st.session_state["config_override"], existing_config)
+import src.app.app as app_module
+from src.app.app import NAV_OPTIONS, main
+from src.app.service_factories import MODEL_REGISTRY_STATE_KEY
+from src.services.inference_service import ModelSchema
+from src.services.model_registry import ModelRegistry
+from src.xgboost.model import SalaryForecaster
+
+APP_PATH = str(Path(__file__).resolve().parents[3] / "src" / "app" / "app.py")
+
+# Per-run budget for AppTest; streamlit's 3s default is tight for the first cold import.
+APP_RUN_TIMEOUT = 10
+# Covers building both module-scoped app runs inside a single test's setup.
+APPTEST_TIMEOUT = 30
+
+
+def apptest(func):
+    """Mark a test backed by the real app runtime.
+
+    Such tests share one xdist worker so the module-scoped app runs happen once, and are
+    bounded by pytest-timeout so a hung script cannot stall the run.
+    """
+    func = pytest.mark.xdist_group("apptest")(func)
+    return pytest.mark.timeout(APPTEST_TIMEOUT)(func)
+
+
+def _run_app(app_path, page=None, session_state=None):
+    """Run the Streamlit app once, optionally seeding session state and navigating to a page."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=APP_RUN_TIMEOUT)
+    for key, value in (session_state or {}).items():
+        at.session_state[key] = value
+    at.run()
+    if page is not None:
+        at.sidebar.radio[0].set_value(page).run(timeout=APP_RUN_TIMEOUT)
+    return at
+
+
+@pytest.fixture(scope="module")
+def app_path():
+    assert os.path.exists(APP_PATH), f"App file not found at {APP_PATH}"
+    return APP_PATH
+
+
+@pytest.fixture(scope="module")
+def at_training(app_path):
+    return _run_app(app_path)
+
+
+@pytest.fixture(scope="module")
+def at_inference(app_path):
+    return _run_app(app_path, "Inference")
+
+
+@apptest
+@pytest.mark.parametrize(
+    "app_fixture, header",
+    [("at_training", "Model Training"), ("at_inference", "Salary Inference")],
+)
+def test_navigation_states(request, app_fixture, header):
+    at = request.getfixturevalue(app_fixture)
+
+    assert len(at.header) > 0
+    assert at.header[0].value == header
+    assert at.sidebar.title[0].value == "Navigation"
+    assert list(at.sidebar.radio[0].options) == list(NAV_OPTIONS)
+
+
+@apptest
+def test_navigation_training(at_training):
+    if len(at_training.checkbox) > 0:
+        assert len(at_training.checkbox) >= 2, "Should have at least 2 checkboxes (Outliers, Tune)"
+
+
+@apptest
+def test_navigation_inference(at_inference):
+    has_warning = len(at_inference.warning) > 0
+    has_selectbox = len(at_inference.selectbox) > 0
+
+    assert (
+        has_warning or has_selectbox or len(at_inference.header) > 0
+    ), "Should show header (and optionally warning or model selector)"
+
+    if has_selectbox:
+        subheaders = [sh.value for sh in at_inference.subheader]
+        assert len(subheaders) > 0, "Should have subheaders when model is loaded"
+        assert any(
+            "Model Information" in sh for sh in subheaders
+        ), "Should show Model Information section"
+
+
+@apptest
+def test_inference_renders_loaded_model(app_path):
+    registry = create_autospec(ModelRegistry, instance=True)
+    registry.list_models.return_value = [
+        {
+            "run_id": "test_run",
+            "start_time": datetime(2023, 1, 1, 12, 0),
+            "tags.model_type": "XGBoost",
+            "metrics.cv_mean_score": 0.95,
+            "tags.dataset_name": "Test Dataset",
+        }
+    ]
+    forecaster = MagicMock(spec=SalaryForecaster)
+    forecaster.ranked_encoders = {"Level": MagicMock(mapping={"E3": 0, "E4": 1})}
+    forecaster.proximity_encoders = {}
+    forecaster.feature_names = ["Level_Enc", "YearsOfExperience"]
+    schema = MagicMock(spec=ModelSchema)
+    schema.ranked_features = ["Level"]
+    schema.proximity_features = []
+    schema.numerical_features = ["YearsOfExperience"]
+    schema.all_feature_names = ["Level_Enc", "YearsOfExperience"]
+    schema.targets = ["BaseSalary"]
+    schema.quantiles = [0.5]
+
+    # A cached forecaster for the selected run skips loading it from MLflow.
+    at = _run_app(
+        app_path,
+        session_state={
+            "nav": "Inference",
+            MODEL_REGISTRY_STATE_KEY: registry,
+            "forecaster": forecaster,
+            "forecaster_schema": schema,
+            "current_run_id": "test_run",
+        },
+    )
+
+    assert not at.exception
+    assert at.header[0].value == "Salary Inference"
+    assert "Model Information" in [sh.value for sh in at.subheader]
+    registry.list_models.assert_called_once_with()
+
+
+def test_navigation_configuration_removed():
+    assert "Configuration" not in NAV_OPTIONS
+    assert "Data Analysis" not in NAV_OPTIONS
+    assert "Model Analysis" not in NAV_OPTIONS
+    assert "Training" in NAV_OPTIONS
+    assert "Inference" in NAV_OPTIONS
+
+
+@pytest.fixture(scope="module")
+def _patched_app():
+    """Patch streamlit and the page renderers in src.app.app once for the module."""
+    with patch.multiple(
+        app_module,
+        st=MagicMock(session_state={}),
+        render_training_ui=DEFAULT,
+        render_inference_ui=DEFAULT,
+    ) as mocks:
+        yield SimpleNamespace(st=app_module.st, **mocks)
+
+
+@pytest.fixture
+def app_mocks(_patched_app):
+    """Reset the shared app mocks so call assertions don't leak between tests."""
+    for mock in vars(_patched_app).values():
+        mock.reset_mock()
+    _patched_app.st.session_state.clear()
+    return _patched_app
+
+
+EXISTING_CONFIG = create_test_config()
+
+
+@pytest.mark.parametrize(
+    "initial_state, nav, renderer, expected_override",
+    [
+        pytest.param({}, "Training", "render_training_ui", None, id="defaults_to_training"),
+        pytest.param(
+            {"nav": "Inference"},
+            "Inference",
+            "render_inference_ui",
+            None,
+            id="navigation_to_inference",
+        ),
+        # Config produced by the workflow wizard must survive a rerun of main().
+        pytest.param(
+            {"config_override": EXISTING_CONFIG},
+            "Training",
+            "render_training_ui",
+            EXISTING_CONFIG,
+            id="preserves_existing_config",
+        ),
+    ],
+)
+def test_main_flow(app_mocks, initial_state, nav, renderer, expected_override):
+    mock_st = app_mocks.st
+    mock_st.session_state.update(initial_state)
+    mock_st.sidebar.radio.return_value = nav
+
+    main()
+
+    mock_st.set_page_config.assert_called_once()
+    mock_st.sidebar.title.assert_called_with("Navigation")
+    for name in ("render_training_ui", "render_inference_ui"):
+        assert getattr(app_mocks, name).call_count == (1 if name == renderer else 0)
+    assert mock_st.session_state["nav"] == nav
+    # config_override is initialized to None unless a config already exists
+    assert "config_override" in mock_st.session_state
+    assert mock_st.session_state["config_override"] == expected_override
@@ -11,42 +11,45 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
+from src.app import data_analysis
 from src.app.data_analysis import render_data_analysis_ui
 
 
-@pytest.fixture
-def mock_streamlit():
-    with patch("src.app.data_analysis.st") as mock_st:
-        # Setup session state mock
-        mock_st.session_state = {}
-        # Setup columns mock to return 3 items
-        mock_st.columns.return_value = [MagicMock(), MagicMock(), MagicMock()]
-
-        # Setup columns(2) as well just in case (e.g. for breakdown) - side_effect can handle this
-        def columns_side_effect(spec):
-            if isinstance(spec, list):
-                count = len(spec)
-            else:
-                count = spec
-            return [MagicMock() for _ in range(count)]
-
-        mock_st.columns.side_effect = columns_side_effect
-
-        # Setup selectbox to return a valid column
-        mock_st.selectbox.return_value = "BaseSalary"
-
+@pytest.fixture(scope="module")
+def _patched_st():
+    """Patch streamlit in src.app.data_analysis once for the module."""
+    with patch.object(data_analysis, "st") as mock_st:
         yield mock_st
 
 
+def _columns_side_effect(spec):
+    count = len(spec) if isinstance(spec, list) else spec
+    return [MagicMock() for _ in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def mock_streamlit(_patched_st):
+    """Reset the shared streamlit mock and re-apply the per-test defaults."""
+    mock_st = _patched_st
+    mock_st.reset_mock(return_value=True, side_effect=True)
+    mock_st.session_state = {}
+    # columns(n) / columns([...]) return one mock per requested column
+    mock_st.columns.side_effect = _columns_side_effect
+    # Setup selectbox to return a valid column
+    mock_st.selectbox.return_value = "BaseSalary"
+    return mock_st
+
+
 @pytest.fixture
 def mock_load_data():
-    with patch("src.app.data_analysis.load_data") as mock_ld:
+    with patch.object(data_analysis, "load_data") as mock_ld:
         yield mock_ld
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_df():
-    return pd.DataFrame(
+    """Frame shared by the module's tests; teardown fails if any test mutated it."""
+    df = pd.DataFrame(
         {
             "Level": ["E3", "E4", "E3"],
             "Location": ["NY", "SF", "NY"],
@@ -58,6 +61,9 @@ def sample_df():
             "YearsAtCompany": [1, 2, 1],
         }
     )
+    snapshot = df.copy()
+    yield df
+    pd.testing.assert_frame_equal(df, snapshot)
 
 
 def test_render_no_data_shows_uploader(mock_streamlit):
@@ -30,7 +30,7 @@ def mock_streamlit():
 
 @pytest.fixture
 def mock_registry():
-    with patch("src.app.inference_ui.ModelRegistry") as MockReg:
+    with patch("src.app.inference_ui.get_model_registry") as mock_get_registry:
         mock_instance = MagicMock()
         run_data = {
             "run_id": "test_run_123",
@@ -41,7 +41,7 @@ def mock_registry():
             "tags.additional_tag": "test_tag",
         }
         mock_instance.list_models.return_value = [run_data]
-        MockReg.return_value = mock_instance
+        mock_get_registry.return_value = mock_instance
         yield mock_instance
 
 
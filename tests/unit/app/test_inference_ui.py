@@ -1,125 +1,148 @@
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, create_autospec, patch
 
-import pandas as pd
+import pytest
 
 from src.app.inference_ui import render_inference_ui, render_model_information
-from src.services.inference_service import ModelSchema
-
-
-class TestRenderModelInformation(unittest.TestCase):
-    """Tests for render_model_information function."""
-
-    @patch("src.app.inference_ui.st")
-    def test_render_model_information_with_run(self, mock_st):
-        """Verify model information displays correctly when run data is available."""
-        mock_forecaster = MagicMock()
-        mock_forecaster.ranked_encoders = {"Level": MagicMock(mapping={"E3": 0, "E4": 1, "E5": 2})}
-        mock_forecaster.proximity_encoders = {"Location": MagicMock()}
-        mock_forecaster.feature_names = ["Level_Enc", "Location_Enc", "YearsOfExperience"]
-
-        mock_schema = MagicMock(spec=ModelSchema)
-        mock_schema.ranked_features = ["Level"]
-        mock_schema.proximity_features = ["Location"]
-        mock_schema.numerical_features = ["YearsOfExperience"]
-        mock_schema.all_feature_names = ["Level_Enc", "Location_Enc", "YearsOfExperience"]
-
-        run_id = "test_run_12345"
-        runs = [
-            {
-                "run_id": run_id,
-                "start_time": datetime(2023, 1, 1, 12, 0),
-                "tags.model_type": "XGBoost",
-                "metrics.cv_mean_score": 0.95,
-                "tags.dataset_name": "Test Dataset",
-                "tags.additional_tag": "test_tag",
-            }
-        ]
-
-        mock_col1 = MagicMock()
-        mock_col2 = MagicMock()
-        mock_st.columns.return_value = [mock_col1, mock_col2]
-        mock_expander = MagicMock()
-        mock_st.expander.return_value.__enter__ = MagicMock(return_value=mock_expander)
-        mock_st.expander.return_value.__exit__ = MagicMock(return_value=None)
-
-        render_model_information(mock_forecaster, mock_schema, run_id, runs)
-
-        mock_st.subheader.assert_called_with("Model Information")
-
-        markdown_calls = [call[0][0] for call in mock_st.markdown.call_args_list]
-        self.assertTrue(any("Run ID" in call for call in markdown_calls))
-
-    @patch("src.app.inference_ui.st")
-    def test_render_model_information_no_run(self, mock_st):
-        """Verify graceful handling when run metadata is missing."""
-        mock_forecaster = MagicMock()
-        mock_forecaster.ranked_encoders = {}
-        mock_forecaster.proximity_encoders = {}
-        mock_forecaster.feature_names = []
-
-        mock_schema = MagicMock(spec=ModelSchema)
-        mock_schema.ranked_features = []
-        mock_schema.proximity_features = []
-        mock_schema.numerical_features = []
-        mock_schema.all_feature_names = []
-
-        run_id = "missing_run"
-        runs = [{"run_id": "other_run", "start_time": datetime(2023, 1, 1)}]
-
-        mock_expander = MagicMock()
-        mock_st.expander.return_value.__enter__ = MagicMock(return_value=mock_expander)
-        mock_st.expander.return_value.__exit__ = MagicMock(return_value=None)
-
-        render_model_information(mock_forecaster, mock_schema, run_id, runs)
-
-        mock_st.info.assert_called_with("Metadata not available")
-
-    @patch("src.app.inference_ui.st")
-    def test_render_model_information_feature_info(self, mock_st):
-        """Verify feature information is displayed for model transparency."""
-        mock_forecaster = MagicMock()
-        mock_forecaster.ranked_encoders = {
-            "Level": MagicMock(mapping={"E3": 0, "E4": 1, "E5": 2, "E6": 3, "E7": 4, "E8": 5})
-        }
-        mock_forecaster.proximity_encoders = {"Location": MagicMock()}
-        mock_forecaster.feature_names = ["Level_Enc", "Location_Enc", "YearsOfExperience"]
-
-        mock_schema = MagicMock(spec=ModelSchema)
-        mock_schema.ranked_features = ["Level"]
-        mock_schema.proximity_features = ["Location"]
-        mock_schema.numerical_features = ["YearsOfExperience"]
-        mock_schema.all_feature_names = ["Level_Enc", "Location_Enc", "YearsOfExperience"]
-
-        run_id = "test_run"
-        runs = [{"run_id": run_id, "start_time": datetime(2023, 1, 1)}]
-
-        mock_col1 = MagicMock()
-        mock_col2 = MagicMock()
-        mock_st.columns.return_value = [mock_col1, mock_col2]
-        mock_expander = MagicMock()
-        mock_st.expander.return_value.__enter__ = MagicMock(return_value=mock_expander)
-        mock_st.expander.return_value.__exit__ = MagicMock(return_value=None)
-
-        render_model_information(mock_forecaster, mock_schema, run_id, runs)
-
-        markdown_calls = [call[0][0] for call in mock_st.markdown.call_args_list]
-        self.assertTrue(any("Ranked Features" in call for call in markdown_calls))
-        self.assertTrue(any("Proximity Features" in call for call in markdown_calls))
-        self.assertTrue(any("Total Features" in call for call in markdown_calls))
+from src.services.analytics_service import AnalyticsService
+from src.services.inference_service import InferenceService, ModelSchema
+from src.services.model_registry import ModelRegistry
+from src.xgboost.model import SalaryForecaster
+
+
+def make_streamlit_mock() -> MagicMock:
+    """Build a streamlit mock with form, expander and two-column layouts already wired."""
+    mock_st = MagicMock()
+    mock_st.session_state = {}
+    mock_st.columns.return_value = [MagicMock(), MagicMock()]
+    for container in (mock_st.form, mock_st.expander):
+        container.return_value.__enter__.return_value = MagicMock()
+        container.return_value.__exit__.return_value = None
+    return mock_st
+
+
+# Patched src.app.inference_ui attributes that get a pre-wired or spec'd double.
+_MOCK_FACTORIES = {
+    "st": make_streamlit_mock,
+    "get_model_registry": lambda: MagicMock(
+        return_value=create_autospec(ModelRegistry, instance=True)
+    ),
+    "get_inference_service": lambda: MagicMock(return_value=MagicMock(spec=InferenceService)),
+    "get_analytics_service": lambda: MagicMock(return_value=MagicMock(spec=AnalyticsService)),
+}
+
+
+@pytest.fixture(scope="module")
+def forecaster():
+    """Forecaster double with one ranked, one proximity and one numerical feature."""
+    m = MagicMock(spec=SalaryForecaster)
+    m.ranked_encoders = {
+        "Level": MagicMock(mapping={"E3": 0, "E4": 1, "E5": 2, "E6": 3, "E7": 4, "E8": 5})
+    }
+    m.proximity_encoders = {"Location": MagicMock()}
+    m.feature_names = ["Level_Enc", "Location_Enc", "YearsOfExperience"]
+    return m
+
+
+def _schema(populated):
+    """Model schema double matching the forecaster fixture, or an empty one."""
+    schema = MagicMock(spec=ModelSchema)
+    schema.ranked_features = ["Level"] if populated else []
+    schema.proximity_features = ["Location"] if populated else []
+    schema.numerical_features = ["YearsOfExperience"] if populated else []
+    schema.all_feature_names = (
+        ["Level_Enc", "Location_Enc", "YearsOfExperience"] if populated else []
+    )
+    return schema
+
+
+def _empty_forecaster():
+    forecaster = MagicMock(spec=SalaryForecaster)
+    forecaster.ranked_encoders = {}
+    forecaster.proximity_encoders = {}
+    forecaster.feature_names = []
+    return forecaster
+
+
+@pytest.mark.parametrize(
+    "populated, run_id, runs, expected_info, expected_markdown",
+    [
+        pytest.param(
+            True,
+            "test_run_12345",
+            [
+                {
+                    "run_id": "test_run_12345",
+                    "start_time": datetime(2023, 1, 1, 12, 0),
+                    "tags.model_type": "XGBoost",
+                    "metrics.cv_mean_score": 0.95,
+                    "tags.dataset_name": "Test Dataset",
+                    "tags.additional_tag": "test_tag",
+                }
+            ],
+            None,
+            ["Run ID"],
+            id="with_run",
+        ),
+        pytest.param(
+            False,
+            "missing_run",
+            [{"run_id": "other_run", "start_time": datetime(2023, 1, 1)}],
+            "Metadata not available",
+            [],
+            id="no_run",
+        ),
+        pytest.param(
+            True,
+            "test_run",
+            [{"run_id": "test_run", "start_time": datetime(2023, 1, 1)}],
+            None,
+            ["Ranked Features", "Proximity Features", "Total Features"],
+            id="feature_info",
+        ),
+    ],
+)
+@patch("src.app.inference_ui.st", new_callable=make_streamlit_mock)
+def test_render_model_information(
+    mock_st, forecaster, populated, run_id, runs, expected_info, expected_markdown
+):
+    """Verify run metadata and feature information rendering for each scenario."""
+    model = forecaster if populated else _empty_forecaster()
+
+    render_model_information(model, _schema(populated), run_id, runs)
+
+    mock_st.subheader.assert_called_with("Model Information")
+    if expected_info is not None:
+        mock_st.info.assert_called_with(expected_info)
+
+    markdown_calls = [call[0][0] for call in mock_st.markdown.call_args_list]
+    for text in expected_markdown:
+        assert any(text in call for call in markdown_calls)
 
 
 class TestRenderInferenceUI(unittest.TestCase):
     """Tests for render_inference_ui function."""
 
-    @patch("src.app.inference_ui.st")
-    @patch("src.app.inference_ui.get_api_client")
-    @patch("src.app.inference_ui.ModelRegistry")
-    def test_render_inference_ui_no_models(self, mock_registry_class, mock_get_api_client, mock_st):
+    def _patch_inference_ui(self, *names):
+        """Patch the given src.app.inference_ui attributes for this test.
+
+        Returns:
+            tuple: The patched mocks, in the order the names were given.
+        """
+        targets = {name: _MOCK_FACTORIES.get(name, lambda: DEFAULT)() for name in names}
+        patcher = patch.multiple("src.app.inference_ui", **targets)
+        mocks = {**targets, **patcher.start()}
+        self.addCleanup(patcher.stop)
+        return tuple(mocks[name] for name in names)
+
+    def test_render_inference_ui_no_models(self):
         """Verify user is informed when no models are available."""
+        mock_st, mock_get_api_client, mock_get_model_registry = self._patch_inference_ui(
+            "st", "get_api_client", "get_model_registry"
+        )
         mock_get_api_client.return_value = None  # API disabled
-        mock_registry = mock_registry_class.return_value
+        mock_registry = mock_get_model_registry.return_value
         mock_registry.list_models.return_value = []
 
         render_inference_ui()
@@ -129,22 +152,23 @@ class TestRenderInferenceUI(unittest.TestCase):
         )
         mock_st.selectbox.assert_not_called()
 
-    @patch("src.app.inference_ui.st")
-    @patch("src.app.inference_ui.get_api_client")
-    @patch("src.app.inference_ui.get_inference_service")
-    @patch("src.app.inference_ui.ModelRegistry")
-    @patch("src.app.inference_ui.render_model_information")
-    def test_render_inference_ui_model_loading_error(
-        self,
-        mock_render_info,
-        mock_registry_class,
-        mock_get_inference_service,
-        mock_get_api_client,
-        mock_st,
-    ):
+    def test_render_inference_ui_model_loading_error(self):
         """Verify graceful error handling when model loading fails."""
+        (
+            mock_st,
+            mock_get_api_client,
+            mock_get_inference_service,
+            mock_get_model_registry,
+            mock_render_info,
+        ) = self._patch_inference_ui(
+            "st",
+            "get_api_client",
+            "get_inference_service",
+            "get_model_registry",
+            "render_model_information",
+        )
         mock_get_api_client.return_value = None  # API disabled
-        mock_registry = mock_registry_class.return_value
+        mock_registry = mock_get_model_registry.return_value
         mock_registry.list_models.return_value = [
             {
                 "run_id": "test_run",
@@ -159,8 +183,6 @@ class TestRenderInferenceUI(unittest.TestCase):
             "2023-01-01 12:00 | XGBoost | Test Dataset | CV:0.9500 | ID:test_run"
         )
 
-        mock_st.session_state = {}
-
         mock_inference_service = mock_get_inference_service.return_value
         from src.services.inference_service import ModelNotFoundError
 
@@ -173,111 +195,25 @@ class TestRenderInferenceUI(unittest.TestCase):
         error_call = mock_st.error.call_args[0][0]
         self.assertIn("Failed to load model", error_call)
 
-    @patch("src.app.inference_ui.st")
-    @patch("src.app.inference_ui.get_api_client")
-    @patch("src.app.inference_ui.get_inference_service")
-    @patch("src.app.inference_ui.get_analytics_service")
-    @patch("src.app.inference_ui.ModelRegistry")
-    @patch("src.app.inference_ui.render_model_information")
-    def test_render_inference_ui_success(
-        self,
-        mock_render_info,
-        mock_registry_class,
-        mock_get_analytics_service,
-        mock_get_inference_service,
-        mock_get_api_client,
-        mock_st,
-    ):
-        """Test render_inference_ui with successful model loading."""
-        mock_get_api_client.return_value = None  # API disabled
-        mock_registry = mock_registry_class.return_value
-        mock_registry.list_models.return_value = [
-            {
-                "run_id": "test_run",
-                "start_time": datetime(2023, 1, 1, 12, 0),
-                "tags.model_type": "XGBoost",
-                "metrics.cv_mean_score": 0.95,
-                "tags.dataset_name": "Test Dataset",
-            }
-        ]
-
-        # Mock forecaster
-        mock_forecaster = MagicMock()
-        mock_forecaster.ranked_encoders = {"Level": MagicMock(mapping={"E3": 0, "E4": 1})}
-        mock_forecaster.proximity_encoders = {}
-        mock_forecaster.feature_names = ["Level_Enc", "YearsOfExperience"]
-
-        # Mock schema
-        mock_schema = MagicMock(spec=ModelSchema)
-        mock_schema.ranked_features = ["Level"]
-        mock_schema.proximity_features = []
-        mock_schema.numerical_features = ["YearsOfExperience"]
-        mock_schema.all_feature_names = ["Level_Enc", "YearsOfExperience"]
-        mock_schema.targets = ["BaseSalary"]
-        mock_schema.quantiles = [0.5]
-
-        mock_inference_service = mock_get_inference_service.return_value
-        mock_inference_service.load_model.return_value = mock_forecaster
-        mock_inference_service.get_model_schema.return_value = mock_schema
-
-        # Mock selectbox
-        mock_st.selectbox.return_value = (
-            "2023-01-01 12:00 | XGBoost | Test Dataset | CV:0.9500 | ID:test_run"
-        )
-
-        # Mock session state
-        mock_st.session_state = {}
-
-        # Mock form and columns
-        mock_form = MagicMock()
-        mock_st.form.return_value.__enter__ = MagicMock(return_value=mock_form)
-        mock_st.form.return_value.__exit__ = MagicMock(return_value=None)
-        # Mock form_submit_button to return False (form not submitted)
-        # Note: form_submit_button is called on st, not on the form context
-        mock_st.form_submit_button.return_value = False
-        mock_col1 = MagicMock()
-        mock_col2 = MagicMock()
-        mock_st.columns.return_value = [mock_col1, mock_col2]
-
-        # Mock analytics service
-        mock_analytics = mock_get_analytics_service.return_value
-        mock_analytics.get_feature_importance.return_value = pd.DataFrame()
-
-        # Mock expander for Model Analysis
-        mock_expander = MagicMock()
-        mock_expander.__enter__ = MagicMock(return_value=MagicMock())
-        mock_expander.__exit__ = MagicMock(return_value=None)
-        mock_st.expander.return_value = mock_expander
-
-        render_inference_ui()
-
-        # Verify model information was rendered
-        mock_render_info.assert_called_once()
-        # Verify schema was passed
-        call_args = mock_render_info.call_args
-        self.assertEqual(call_args[0][1], mock_schema)  # schema is second positional arg
-
-        # Verify header was set
-        mock_st.header.assert_called_with("Salary Inference")
-
-    @patch("src.app.inference_ui.st")
-    @patch("src.app.inference_ui.get_api_client")
-    @patch("src.app.inference_ui.get_inference_service")
-    @patch("src.app.inference_ui.get_analytics_service")
-    @patch("src.app.inference_ui.ModelRegistry")
-    @patch("src.app.inference_ui.render_model_information")
-    def test_render_inference_ui_uses_inference_service(
-        self,
-        mock_render_info,
-        mock_registry_class,
-        mock_get_analytics_service,
-        mock_get_inference_service,
-        mock_get_api_client,
-        mock_st,
-    ):
+    def test_render_inference_ui_uses_inference_service(self):
         """Verify that InferenceService is used for model loading and schema retrieval."""
+        (
+            mock_st,
+            mock_get_api_client,
+            mock_get_inference_service,
+            mock_get_analytics_service,
+            mock_get_model_registry,
+            mock_render_info,
+        ) = self._patch_inference_ui(
+            "st",
+            "get_api_client",
+            "get_inference_service",
+            "get_analytics_service",
+            "get_model_registry",
+            "render_model_information",
+        )
         mock_get_api_client.return_value = None  # API disabled
-        mock_registry = mock_registry_class.return_value
+        mock_registry = mock_get_model_registry.return_value
         mock_registry.list_models.return_value = [
             {
                 "run_id": "test_run",
@@ -288,7 +224,8 @@ class TestRenderInferenceUI(unittest.TestCase):
             }
         ]
 
-        mock_forecaster = MagicMock()
+        mock_forecaster = MagicMock(spec=SalaryForecaster)
+        mock_forecaster.ranked_encoders = {"Level": MagicMock(mapping={"E3": 0, "E4": 1})}
         mock_schema = MagicMock(spec=ModelSchema)
         mock_schema.ranked_features = ["Level"]
         mock_schema.proximity_features = []
@@ -304,18 +241,9 @@ class TestRenderInferenceUI(unittest.TestCase):
         mock_st.selectbox.return_value = (
             "2023-01-01 12:00 | XGBoost | Test Dataset | CV:0.9500 | ID:test_run"
         )
-        mock_st.session_state = {}
         mock_st.form_submit_button.return_value = False
-        mock_form = MagicMock()
-        mock_st.form.return_value.__enter__ = MagicMock(return_value=mock_form)
-        mock_st.form.return_value.__exit__ = MagicMock(return_value=None)
-        mock_st.columns.return_value = [MagicMock(), MagicMock()]
         mock_analytics = mock_get_analytics_service.return_value
-        mock_analytics.get_feature_importance.return_value = pd.DataFrame()
-        mock_expander = MagicMock()
-        mock_expander.__enter__ = MagicMock(return_value=MagicMock())
-        mock_expander.__exit__ = MagicMock(return_value=None)
-        mock_st.expander.return_value = mock_expander
+        mock_analytics.get_feature_importance.return_value = MagicMock(empty=True)
 
         render_inference_ui()
 
@@ -324,24 +252,25 @@ class TestRenderInferenceUI(unittest.TestCase):
         mock_inference_service.load_model.assert_called_once_with("test_run")
         mock_inference_service.get_model_schema.assert_called_once_with(mock_forecaster)
 
-    @patch("src.app.inference_ui.st")
-    @patch("src.app.inference_ui.get_api_client")
-    @patch("src.app.inference_ui.get_inference_service")
-    @patch("src.app.inference_ui.get_analytics_service")
-    @patch("src.app.inference_ui.ModelRegistry")
-    def test_render_inference_ui_prediction_success(
-        self,
-        mock_registry_class,
-        mock_get_analytics_service,
-        mock_get_inference_service,
-        mock_get_api_client,
-        mock_st,
-    ):
+    def test_render_inference_ui_prediction_success(self):
         """Verify successful prediction flow using InferenceService."""
+        (
+            mock_st,
+            mock_get_api_client,
+            mock_get_inference_service,
+            mock_get_analytics_service,
+            mock_get_model_registry,
+        ) = self._patch_inference_ui(
+            "st",
+            "get_api_client",
+            "get_inference_service",
+            "get_analytics_service",
+            "get_model_registry",
+        )
         from src.services.inference_service import PredictionResult
 
         mock_get_api_client.return_value = None
-        mock_registry = mock_registry_class.return_value
+        mock_registry = mock_get_model_registry.return_value
         mock_registry.list_models.return_value = [
             {
                 "run_id": "test_run",
@@ -352,7 +281,8 @@ class TestRenderInferenceUI(unittest.TestCase):
             }
         ]
 
-        mock_forecaster = MagicMock()
+        mock_forecaster = MagicMock(spec=SalaryForecaster)
+        mock_forecaster.ranked_encoders = {"Level": MagicMock(mapping={"E3": 0, "E4": 1})}
         mock_schema = MagicMock(spec=ModelSchema)
         mock_schema.ranked_features = ["Level"]
         mock_schema.proximity_features = []
@@ -374,14 +304,8 @@ class TestRenderInferenceUI(unittest.TestCase):
         mock_st.selectbox.return_value = (
             "2023-01-01 12:00 | XGBoost | Test Dataset | CV:0.9500 | ID:test_run"
         )
-        mock_st.session_state = {}
 
-        # Mock form submission
-        mock_form = MagicMock()
-        mock_st.form.return_value.__enter__ = MagicMock(return_value=mock_form)
-        mock_st.form.return_value.__exit__ = MagicMock(return_value=None)
         mock_st.form_submit_button.return_value = True  # Form submitted
-        mock_st.columns.return_value = [MagicMock(), MagicMock()]
 
         # selectbox is called multiple times - need to handle all calls
         selectbox_calls = [
@@ -401,12 +325,8 @@ class TestRenderInferenceUI(unittest.TestCase):
 
         mock_st.number_input.return_value = 5  # YearsOfExperience
         mock_st.text_input.return_value = "New York"  # Location (if needed)
-        mock_expander = MagicMock()
-        mock_expander.__enter__ = MagicMock(return_value=MagicMock())
-        mock_expander.__exit__ = MagicMock(return_value=None)
-        mock_st.expander.return_value = mock_expander
         mock_analytics = mock_get_analytics_service.return_value
-        mock_analytics.get_feature_importance.return_value = pd.DataFrame()
+        mock_analytics.get_feature_importance.return_value = MagicMock(empty=True)
 
         render_inference_ui()
 
@@ -416,18 +336,17 @@ class TestRenderInferenceUI(unittest.TestCase):
         self.assertEqual(call_args[0][0], mock_forecaster)  # First arg is model
         self.assertIn("Level", call_args[0][1])  # Second arg is features dict
 
-    @patch("src.app.inference_ui.st")
-    @patch("src.app.inference_ui.get_api_client")
-    @patch("src.app.inference_ui.get_inference_service")
-    @patch("src.app.inference_ui.ModelRegistry")
-    def test_render_inference_ui_prediction_invalid_input_error(
-        self, mock_registry_class, mock_get_inference_service, mock_get_api_client, mock_st
-    ):
+    def test_render_inference_ui_prediction_invalid_input_error(self):
         """Verify InvalidInputError is handled gracefully during prediction."""
+        mock_st, mock_get_api_client, mock_get_inference_service, mock_get_model_registry = (
+            self._patch_inference_ui(
+                "st", "get_api_client", "get_inference_service", "get_model_registry"
+            )
+        )
         from src.services.inference_service import InvalidInputError
 
         mock_get_api_client.return_value = None
-        mock_registry = mock_registry_class.return_value
+        mock_registry = mock_get_model_registry.return_value
         mock_registry.list_models.return_value = [
             {
                 "run_id": "test_run",
@@ -438,7 +357,8 @@ class TestRenderInferenceUI(unittest.TestCase):
             }
         ]
 
-        mock_forecaster = MagicMock()
+        mock_forecaster = MagicMock(spec=SalaryForecaster)
+        mock_forecaster.ranked_encoders = {"Level": MagicMock(mapping={"E3": 0, "E4": 1})}
         mock_schema = MagicMock(spec=ModelSchema)
         mock_schema.ranked_features = ["Level"]
         mock_schema.proximity_features = []
@@ -457,14 +377,8 @@ class TestRenderInferenceUI(unittest.TestCase):
         mock_st.selectbox.return_value = (
             "2023-01-01 12:00 | XGBoost | Test Dataset | CV:0.9500 | ID:test_run"
         )
-        mock_st.session_state = {}
-        mock_form = MagicMock()
-        mock_st.form.return_value.__enter__ = MagicMock(return_value=mock_form)
-        mock_st.form.return_value.__exit__ = MagicMock(return_value=None)
         mock_st.form_submit_button.return_value = True
-        mock_st.columns.return_value = [MagicMock(), MagicMock()]
         mock_st.number_input.return_value = 5
-        mock_st.expander.return_value = MagicMock()
 
         render_inference_ui()
 
@@ -473,22 +387,23 @@ class TestRenderInferenceUI(unittest.TestCase):
         error_call = mock_st.error.call_args[0][0]
         self.assertIn("Invalid input", error_call)
 
-    @patch("src.app.inference_ui.st")
-    @patch("src.app.inference_ui.get_api_client")
-    @patch("src.app.inference_ui.get_inference_service")
-    @patch("src.app.inference_ui.get_analytics_service")
-    @patch("src.app.inference_ui.ModelRegistry")
-    def test_render_inference_ui_uses_schema_for_features(
-        self,
-        mock_registry_class,
-        mock_get_analytics_service,
-        mock_get_inference_service,
-        mock_get_api_client,
-        mock_st,
-    ):
+    def test_render_inference_ui_uses_schema_for_features(self):
         """Verify that schema is used for building feature input forms."""
+        (
+            mock_st,
+            mock_get_api_client,
+            mock_get_inference_service,
+            mock_get_analytics_service,
+            mock_get_model_registry,
+        ) = self._patch_inference_ui(
+            "st",
+            "get_api_client",
+            "get_inference_service",
+            "get_analytics_service",
+            "get_model_registry",
+        )
         mock_get_api_client.return_value = None
-        mock_registry = mock_registry_class.return_value
+        mock_registry = mock_get_model_registry.return_value
         mock_registry.list_models.return_value = [
             {
                 "run_id": "test_run",
@@ -499,7 +414,7 @@ class TestRenderInferenceUI(unittest.TestCase):
             }
         ]
 
-        mock_forecaster = MagicMock()
+        mock_forecaster = MagicMock(spec=SalaryForecaster)
         mock_forecaster.ranked_encoders = {"Level": MagicMock(mapping={"E3": 0, "E4": 1})}
         mock_schema = MagicMock(spec=ModelSchema)
         mock_schema.ranked_features = ["Level"]
@@ -516,20 +431,9 @@ class TestRenderInferenceUI(unittest.TestCase):
         mock_st.selectbox.return_value = (
             "2023-01-01 12:00 | XGBoost | Test Dataset | CV:0.9500 | ID:test_run"
         )
-        mock_st.session_state = {}
-        mock_form = MagicMock()
-        mock_st.form.return_value.__enter__ = MagicMock(return_value=mock_form)
-        mock_st.form.return_value.__exit__ = MagicMock(return_value=None)
         mock_st.form_submit_button.return_value = False
-        mock_col1 = MagicMock()
-        mock_col2 = MagicMock()
-        mock_st.columns.return_value = [mock_col1, mock_col2]
         mock_analytics = mock_get_analytics_service.return_value
-        mock_analytics.get_feature_importance.return_value = pd.DataFrame()
-        mock_expander = MagicMock()
-        mock_expander.__enter__ = MagicMock(return_value=MagicMock())
-        mock_expander.__exit__ = MagicMock(return_value=None)
-        mock_st.expander.return_value = mock_expander
+        mock_analytics.get_feature_importance.return_value = MagicMock(empty=True)
 
         render_inference_ui()
 
@@ -7,31 +7,42 @@ still works correctly for backward compatibility.
 """
 
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
 import pytest
 
+from src.app import model_analysis
 from src.app.model_analysis import render_model_analysis_ui
+from src.xgboost.model import SalaryForecaster
 
 
-@pytest.fixture
-def mock_streamlit():
-    with patch("src.app.model_analysis.st") as mock_st:
-        # Defaults
-        mock_st.selectbox.return_value = None
+@pytest.fixture(scope="module")
+def _patched_st():
+    """Patch streamlit in src.app.model_analysis once for the module."""
+    with patch.object(model_analysis, "st") as mock_st:
         yield mock_st
 
 
+@pytest.fixture(autouse=True)
+def mock_streamlit(_patched_st):
+    """Reset the shared streamlit mock and re-apply the per-test defaults."""
+    mock_st = _patched_st
+    mock_st.reset_mock(return_value=True, side_effect=True)
+    mock_st.session_state = {}
+    mock_st.selectbox.return_value = None
+    return mock_st
+
+
 @pytest.fixture
 def mock_registry():
-    with patch("src.app.model_analysis.ModelRegistry") as MockReg:
+    with patch.object(model_analysis, "ModelRegistry") as MockReg:
         yield MockReg.return_value
 
 
 @pytest.fixture
 def mock_analytics():
-    with patch("src.app.model_analysis.get_analytics_service") as mock_get_analytics:
+    with patch.object(model_analysis, "get_analytics_service") as mock_get_analytics:
         mock_instance = MagicMock()
         mock_get_analytics.return_value = mock_instance
         yield mock_instance
@@ -45,7 +56,7 @@ def test_no_models_shows_warning(mock_streamlit, mock_registry):
     )
 
 
-@patch("src.app.model_analysis.get_inference_service")
+@patch.object(model_analysis, "get_inference_service")
 def test_load_valid_model(
     mock_get_inference_service, mock_streamlit, mock_registry, mock_analytics
 ):
@@ -65,7 +76,7 @@ def test_load_valid_model(
     mock_streamlit.selectbox.side_effect = [expected_label, "BaseSalary", 0.5]
 
     # Mock model and schema
-    mock_forecaster = MagicMock()
+    mock_forecaster = Mock(spec=SalaryForecaster)
     mock_schema = MagicMock(spec=ModelSchema)
     mock_schema.targets = ["BaseSalary"]
     mock_schema.quantiles = [0.5]
@@ -87,7 +98,7 @@ def test_load_valid_model(
     mock_streamlit.pyplot.assert_called()
 
 
-@patch("src.app.model_analysis.get_inference_service")
+@patch.object(model_analysis, "get_inference_service")
 def test_empty_importance(
     mock_get_inference_service, mock_streamlit, mock_registry, mock_analytics
 ):
@@ -106,7 +117,7 @@ def test_empty_importance(
         0.5,
     ]
 
-    mock_forecaster = MagicMock()
+    mock_forecaster = Mock(spec=SalaryForecaster)
     mock_schema = MagicMock(spec=ModelSchema)
     mock_schema.targets = ["BaseSalary"]
     mock_schema.quantiles = [0.5]
@@ -172,7 +183,7 @@ def test_empty_selected_label_returns_early(mock_streamlit, mock_registry):
     mock_registry.load_model.assert_not_called()
 
 
-@patch("src.app.model_analysis.get_inference_service")
+@patch.object(model_analysis, "get_inference_service")
 def test_no_targets_shows_error(
     mock_get_inference_service, mock_streamlit, mock_registry, mock_analytics
 ):
@@ -189,7 +200,7 @@ def test_no_targets_shows_error(
     expected_label = "2023-01-01 12:00 | CV:0.9900 | ID:run123"
     mock_streamlit.selectbox.return_value = expected_label
 
-    mock_forecaster = MagicMock()
+    mock_forecaster = Mock(spec=SalaryForecaster)
     mock_schema = MagicMock(spec=ModelSchema)
     mock_schema.targets = []  # No targets
 
@@ -204,7 +215,7 @@ def test_no_targets_shows_error(
     )
 
 
-@patch("src.app.model_analysis.get_inference_service")
+@patch.object(model_analysis, "get_inference_service")
 def test_exception_handling_displays_traceback(
     mock_get_inference_service, mock_streamlit, mock_registry
 ):
@@ -4,8 +4,10 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from src.app.service_factories import (
+    MODEL_REGISTRY_STATE_KEY,
     get_analytics_service,
     get_inference_service,
+    get_model_registry,
     get_training_service,
     get_workflow_service,
 )
@@ -47,6 +49,29 @@ class TestServiceFactories(unittest.TestCase):
         service2 = get_analytics_service()
         self.assertIs(service, service2)
 
+    @patch("src.app.service_factories.st")
+    def test_get_model_registry_prefers_session_state(self, mock_st):
+        """Verify get_model_registry reuses a registry stored in session state."""
+        injected = MagicMock()
+        mock_st.session_state = {MODEL_REGISTRY_STATE_KEY: injected}
+
+        with patch("src.app.service_factories.ModelRegistry") as mock_registry_class:
+            registry = get_model_registry()
+
+        self.assertIs(registry, injected)
+        mock_registry_class.assert_not_called()
+
+    @patch("src.app.service_factories.st")
+    def test_get_model_registry_default(self, mock_st):
+        """Verify get_model_registry creates a ModelRegistry when none is injected."""
+        mock_st.session_state = {}
+
+        with patch("src.app.service_factories.ModelRegistry") as mock_registry_class:
+            registry = get_model_registry()
+
+        mock_registry_class.assert_called_once_with()
+        self.assertIs(registry, mock_registry_class.return_value)
+
     def test_get_workflow_service_default_provider(self):
         """Verify get_workflow_service returns WorkflowService with default provider."""
         with patch("src.app.service_factories.WorkflowService") as mock_workflow_class:
@@ -1,4 +1,5 @@
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
@@ -8,21 +9,30 @@ from conftest import create_test_config
 from src.app.train_ui import render_training_ui
 
 
-@pytest.fixture
-def mock_streamlit():
+@pytest.fixture(scope="module")
+def _patched_st():
+    """Patch streamlit in src.app.train_ui once for the module."""
     with patch("src.app.train_ui.st") as mock_st:
-        mock_st.session_state = {}
+        yield mock_st
 
-        # Mock columns to return proper number of mock objects
-        def columns_side_effect(n):
-            if isinstance(n, int):
-                return [MagicMock() for _ in range(n)]
-            elif isinstance(n, list):
-                return [MagicMock() for _ in range(len(n))]
-            return []
 
-        mock_st.columns.side_effect = columns_side_effect
-        yield mock_st
+def _columns_side_effect(n):
+    if isinstance(n, int):
+        return [MagicMock() for _ in range(n)]
+    elif isinstance(n, list):
+        return [MagicMock() for _ in range(len(n))]
+    return []
+
+
+@pytest.fixture(autouse=True)
+def mock_streamlit(_patched_st):
+    """Reset the shared streamlit mock and re-apply the per-test defaults."""
+    mock_st = _patched_st
+    mock_st.reset_mock(return_value=True, side_effect=True)
+    mock_st.session_state = {}
+    # Mock columns to return proper number of mock objects
+    mock_st.columns.side_effect = _columns_side_effect
+    return mock_st
 
 
 @pytest.fixture
@@ -65,9 +75,10 @@ def mock_workflow_wizard():
         yield mock_wizard
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_df():
-    return pd.DataFrame(
+    """Training frame shared across the module; teardown checks no test modified it."""
+    df = pd.DataFrame(
         {
             "Level": ["E3", "E4", "E3"],
             "Location": ["NY", "SF", "NY"],
@@ -77,6 +88,9 @@ def sample_df():
             "YearsAtCompany": [1, 2, 1],
         }
     )
+    snapshot = df.copy()
+    yield df
+    pd.testing.assert_frame_equal(df, snapshot)
 
 
 def test_render_training_ui_upload_loads_data(
@@ -84,12 +98,11 @@ def test_render_training_ui_upload_loads_data(
 ):
     # Setup: No training_data, uploader active
     mock_streamlit.session_state = {}
-    mock_upload_file = MagicMock()
-    mock_upload_file.name = "test.csv"
+    mock_upload_file = SimpleNamespace(name="test.csv")
     mock_streamlit.file_uploader.return_value = mock_upload_file
 
     # Validation succeeds
-    df = MagicMock()
+    df = MagicMock(spec=pd.DataFrame)
     df.__len__.return_value = 10
     mock_load_data.return_value = df
 
@@ -116,7 +129,7 @@ def test_render_training_ui_upload_loads_data(
 
 def test_render_training_ui_requires_wizard(mock_streamlit, mock_load_data, mock_training_service):
     # Setup state - data loaded but wizard not completed
-    df = MagicMock()
+    df = MagicMock(spec=pd.DataFrame)
     mock_streamlit.session_state = {
         "training_data": df,
         "training_dataset_name": "dataset.csv",
@@ -151,7 +164,7 @@ def test_render_training_ui_starts_job_after_wizard(
     mock_streamlit, mock_load_data, mock_training_service
 ):
     # Setup state - wizard completed with valid config
-    df = MagicMock()
+    df = MagicMock(spec=pd.DataFrame)
     config = create_test_config()
     mock_streamlit.session_state = {
         "training_data": df,
@@ -293,7 +306,7 @@ class TestConfigValidationInTrainUI(unittest.TestCase):
 
     def test_training_requires_config_from_wizard(self):
         """Test that training requires config from workflow wizard."""
-        df = MagicMock()
+        df = MagicMock(spec=pd.DataFrame)
         self.mock_st.session_state = {
             "training_data": df,
             "training_dataset_name": "dataset.csv",
@@ -320,7 +333,7 @@ class TestConfigValidationInTrainUI(unittest.TestCase):
 
     def test_training_requires_valid_config(self):
         """Test that training requires valid (non-empty) config."""
-        df = MagicMock()
+        df = MagicMock(spec=pd.DataFrame)
         self.mock_st.session_state = {
             "training_data": df,
             "training_dataset_name": "dataset.csv",
@@ -347,7 +360,7 @@ class TestConfigValidationInTrainUI(unittest.TestCase):
 
     def test_training_with_valid_config(self):
         """Test that training proceeds with valid config."""
-        df = MagicMock()
+        df = MagicMock(spec=pd.DataFrame)
         config = create_test_config()
         self.mock_st.session_state = {
             "training_data": df,
@@ -380,7 +393,7 @@ class TestConfigValidationInTrainUI(unittest.TestCase):
 
     def test_config_retrieved_from_session_state(self):
         """Test that config is retrieved from session state."""
-        df = MagicMock()
+        df = MagicMock(spec=pd.DataFrame)
         config = create_test_config()
         self.mock_st.session_state = {
             "training_data": df,
@@ -411,7 +424,7 @@ class TestConfigValidationInTrainUI(unittest.TestCase):
 
     def test_error_message_when_config_missing(self):
         """Test user-facing error message when config is missing."""
-        df = MagicMock()
+        df = MagicMock(spec=pd.DataFrame)
         self.mock_st.session_state = {
             "training_data": df,
             "training_dataset_name": "dataset.csv",
@@ -445,7 +458,7 @@ class TestConfigValidationInTrainUI(unittest.TestCase):
 
     def test_error_message_when_config_invalid(self):
         """Test user-facing error message when config is invalid."""
-        df = MagicMock()
+        df = MagicMock(spec=pd.DataFrame)
         self.mock_st.session_state = {
             "training_data": df,
             "training_dataset_name": "dataset.csv",
@@ -476,7 +489,7 @@ class TestConfigValidationInTrainUI(unittest.TestCase):
 
     def test_config_validation_error_handling(self):
         """Test error handling when config validation fails during training."""
-        df = MagicMock()
+        df = MagicMock(spec=pd.DataFrame)
         config = create_test_config()
         self.mock_st.session_state = {
             "training_data": df,
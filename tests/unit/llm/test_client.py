@@ -552,3 +552,51 @@ def test_gemini_client_init_missing_key_raises_error(mock_get_env):
     mock_get_env.return_value = None
     with pytest.raises(ValueError, match="GEMINI_API_KEY not found"):
         GeminiClient()
+
+
+@patch("src.llm.client.get_env_var")
+@patch("src.llm.client.OpenAI")
+def test_openai_client_generate_json_uses_json_mode(mock_openai, mock_get_env):
+    """Test OpenAIClient.generate_json requests JSON mode and returns the parsed object."""
+    mock_get_env.return_value = "fake-key"
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = '{"targets": ["Salary"]}'
+    mock_client.chat.completions.create.return_value = mock_response
+
+    client = OpenAIClient()
+    result = client.generate_json("Return JSON for generate_json_mode test")
+
+    assert result == {"targets": ["Salary"]}
+    call_kwargs = mock_client.chat.completions.create.call_args[1]
+    assert call_kwargs["response_format"] == {"type": "json_object"}
+
+
+@patch("src.llm.client.get_env_var")
+@patch("src.llm.client.OpenAI")
+def test_openai_client_generate_json_with_schema(mock_openai, mock_get_env):
+    """Test OpenAIClient.generate_json requests strict structured output when given a schema."""
+    mock_get_env.return_value = "fake-key"
+    mock_client = MagicMock()
+    mock_openai.return_value = mock_client
+
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = '{"name": "x"}'
+    mock_client.chat.completions.create.return_value = mock_response
+
+    schema = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+        "required": ["name"],
+        "additionalProperties": False,
+    }
+    client = OpenAIClient()
+    result = client.generate_json("Return JSON for generate_json_schema test", schema=schema)
+
+    assert result == {"name": "x"}
+    response_format = mock_client.chat.completions.create.call_args[1]["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["schema"] == schema
+    assert response_format["json_schema"]["strict"] is True
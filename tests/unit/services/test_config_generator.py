@@ -32,6 +32,15 @@ class TestConfigGenerator(unittest.TestCase):
         sorted_keys = sorted(levels, key=levels.get)
         self.assertEqual(sorted_keys, ["Manager M1", "IC3", "IC4", "IC5"])
 
+    def test_infer_levels_numeric_order_and_ties(self):
+        data = pd.DataFrame({"Level": ["L10", "L9", "B2", "A2", "Intern", None, "L9"]})
+        levels = self.generator.infer_levels(data)
+
+        # Multi-digit ranks compare numerically; equal ranks fall back to the name
+        sorted_keys = sorted(levels, key=levels.get)
+        self.assertEqual(sorted_keys, ["Intern", "A2", "B2", "L9", "L10"])
+        self.assertEqual(levels["Intern"], 0)
+
     def test_infer_levels_missing_column(self):
         data = pd.DataFrame({"Other": ["A", "B"]})
         levels = self.generator.infer_levels(data)
@@ -128,6 +137,21 @@ class TestConfigGenerator(unittest.TestCase):
         self.assertIn("quantiles", model)
         self.assertIn("hyperparameters", model)
 
+    def test_generate_config_template_does_not_alias_template(self):
+        """Test that generated configs are independent deep copies of CONFIG_TEMPLATE."""
+        data = pd.DataFrame({"Level": ["L3"], "Location": ["NY"], "Salary": [100000]})
+
+        first = self.generator.generate_config_template(data)
+        first["model"]["quantiles"].append(0.99)
+        first["location_settings"]["max_distance_km"] = 1
+        second = self.generator.generate_config_template(data)
+
+        self.assertEqual(second["model"]["quantiles"], [0.1, 0.25, 0.5, 0.75, 0.9])
+        self.assertEqual(second["location_settings"]["max_distance_km"], 50)
+        self.assertEqual(
+            ConfigGenerator.CONFIG_TEMPLATE["location_settings"]["max_distance_km"], 50
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
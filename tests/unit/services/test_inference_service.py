@@ -1,10 +1,12 @@
 """Unit tests for InferenceService."""
 
+import os
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -51,6 +53,35 @@ class TestInferenceService(unittest.TestCase):
         self.assertEqual(result2, mock_model)
         mock_registry.load_model.assert_called_once_with("test_run_id")
 
+    def test_load_model_cache_is_bounded(self):
+        """Test that the least recently used model is evicted once the cache is full."""
+        mock_registry = MagicMock()
+        mock_registry.load_model.side_effect = lambda run_id: f"model-{run_id}"
+
+        with patch.dict(os.environ, {"CACHE_MODEL_SIZE": "2"}):
+            service = InferenceService(model_registry=mock_registry)
+        service.load_model("a")
+        service.load_model("b")
+        service.load_model("a")
+        service.load_model("c")
+        service.load_model("a")
+        service.load_model("b")
+
+        self.assertEqual(
+            [c.args[0] for c in mock_registry.load_model.call_args_list], ["a", "b", "c", "b"]
+        )
+
+    def test_clear_cache(self):
+        """Test that clear_cache forces the next load to hit the registry."""
+        mock_registry = MagicMock()
+        service = InferenceService(model_registry=mock_registry)
+
+        service.load_model("test_run_id")
+        service.clear_cache()
+        service.load_model("test_run_id")
+
+        self.assertEqual(mock_registry.load_model.call_count, 2)
+
     def test_load_model_not_found(self):
         """Test loading a non-existent model raises ModelNotFoundError."""
         mock_registry = MagicMock()
@@ -78,6 +109,40 @@ class TestInferenceService(unittest.TestCase):
         self.assertEqual(schema.targets, ["BaseSalary"])
         self.assertEqual(schema.quantiles, [0.1, 0.5, 0.9])
 
+    def test_get_model_schema_cached_per_model(self):
+        """Test that the schema is built once per model instance."""
+        mock_model = MagicMock()
+        mock_model.ranked_encoders = {"Level": MagicMock(mapping={"L4": 1})}
+        mock_model.proximity_encoders = {}
+        mock_model.feature_names = ["Level_Enc", "YearsOfExperience"]
+        other_model = MagicMock()
+        other_model.ranked_encoders = {}
+        other_model.proximity_encoders = {}
+        other_model.feature_names = ["YearsOfExperience"]
+
+        schema = self.service.get_model_schema(mock_model)
+
+        self.assertIs(self.service.get_model_schema(mock_model), schema)
+        self.assertIsNot(self.service.get_model_schema(other_model), schema)
+        self.assertEqual(schema.ranked_levels, {"Level": frozenset({"L4"})})
+
+    def test_get_model_schema_precomputes_level_preview(self):
+        """Test that the valid-level hint for error messages is built with the schema."""
+        mock_model = MagicMock()
+        mock_model.ranked_encoders = {
+            "Level": MagicMock(mapping={f"L{i}": i for i in range(12)}),
+            "Band": MagicMock(mapping={1: 0, 2: 1}),
+        }
+        mock_model.proximity_encoders = {}
+        mock_model.feature_names = ["Level_Enc", "Band_Enc"]
+
+        schema = self.service.get_model_schema(mock_model)
+
+        self.assertEqual(
+            schema.ranked_levels_preview["Level"], ", ".join(f"L{i}" for i in range(10)) + "..."
+        )
+        self.assertEqual(schema.ranked_levels_preview["Band"], "1, 2")
+
     def test_validate_input_features_valid(self):
         """Test validation with valid input features."""
         mock_model = MagicMock()
@@ -174,6 +239,29 @@ class TestInferenceService(unittest.TestCase):
         self.assertFalse(result.is_valid)
         self.assertIn("Invalid value for numerical feature", result.errors[0])
 
+    def test_validate_input_features_batch(self):
+        """Test batch validation reports errors per row in input order."""
+        mock_model = MagicMock()
+        mock_model.ranked_encoders = {"Level": MagicMock(mapping={"L4": 1, "L5": 2})}
+        mock_model.proximity_encoders = {}
+        mock_model.feature_names = ["Level_Enc", "YearsOfExperience"]
+
+        results = self.service.validate_input_features_batch(
+            mock_model,
+            [
+                {"Level": "L4", "YearsOfExperience": 5},
+                {"Level": "L9", "YearsOfExperience": "five"},
+                {"YearsOfExperience": float("nan")},
+                {"Level": "L5", "YearsOfExperience": "6"},
+            ],
+        )
+
+        self.assertEqual([r.is_valid for r in results], [True, False, False, True])
+        self.assertEqual(len(results[1].errors), 2)
+        self.assertIn("Invalid value for ranked feature 'Level': 'L9'", results[1].errors[0])
+        self.assertIn("Invalid value for numerical feature", results[1].errors[1])
+        self.assertEqual(results[2].errors, ["Missing ranked features: Level"])
+
     def test_predict_success(self):
         """Test successful prediction."""
         mock_model = MagicMock()
@@ -192,6 +280,42 @@ class TestInferenceService(unittest.TestCase):
         self.assertIn("BaseSalary", result.predictions)
         self.assertEqual(result.predictions["BaseSalary"]["p50"], 150000.0)
 
+    def test_predict_passes_single_row_frame(self):
+        """Test prediction input is a one-row frame in feature order."""
+        mock_model = MagicMock()
+        mock_model.ranked_encoders = {"Level": MagicMock(mapping={"L4": 1})}
+        mock_model.proximity_encoders = {}
+        mock_model.feature_names = ["Level_Enc", "YearsOfExperience"]
+        mock_model.targets = ["BaseSalary"]
+        mock_model.quantiles = [0.5]
+        mock_model.predict.return_value = {"BaseSalary": {"p50": pd.Series([150000.0])}}
+
+        self.service.predict(mock_model, {"Level": "L4", "YearsOfExperience": 5})
+
+        input_df = mock_model.predict.call_args[0][0]
+        self.assertEqual(list(input_df.columns), ["Level", "YearsOfExperience"])
+        self.assertEqual(input_df.iloc[0].tolist(), ["L4", 5])
+
+    def test_predict_reuses_result_for_identical_features(self):
+        """Test repeated identical predictions are served from the result cache."""
+        mock_model = MagicMock()
+        mock_model.ranked_encoders = {"Level": MagicMock(mapping={"L4": 1})}
+        mock_model.proximity_encoders = {}
+        mock_model.feature_names = ["Level_Enc", "YearsOfExperience"]
+        mock_model.targets = ["BaseSalary"]
+        mock_model.quantiles = [0.5]
+        mock_model.predict.return_value = {"BaseSalary": {"p50": pd.Series([150000.0])}}
+
+        first = self.service.predict(mock_model, {"Level": "L4", "YearsOfExperience": 5})
+        first.predictions["BaseSalary"]["p50"] = 0.0
+        second = self.service.predict(mock_model, {"YearsOfExperience": 5, "Level": "L4"})
+        self.service.predict(mock_model, {"Level": "L4", "YearsOfExperience": 6})
+        self.service.predict(mock_model, {"Level": "L4", "YearsOfExperience": float("nan")})
+        self.service.predict(mock_model, {"Level": "L4", "YearsOfExperience": float("nan")})
+
+        self.assertEqual(second.predictions["BaseSalary"]["p50"], 150000.0)
+        self.assertEqual(mock_model.predict.call_count, 4)
+
     def test_predict_invalid_input(self):
         """Test prediction fails with invalid input."""
         mock_model = MagicMock()
@@ -242,6 +366,56 @@ class TestInferenceService(unittest.TestCase):
         self.assertEqual(formatted[0]["p50"], 150000.0)
         self.assertEqual(formatted[0]["p90"], 180000.0)
 
+    def test_predict_batch_single_model_call(self):
+        """Test batch prediction scores all valid rows with one model call."""
+        from src.services.inference_service import PredictionResult
+
+        mock_model = MagicMock()
+        mock_model.ranked_encoders = {"Level": MagicMock(mapping={"L4": 1})}
+        mock_model.proximity_encoders = {}
+        mock_model.feature_names = ["Level_Enc", "YearsOfExperience"]
+        mock_model.targets = ["BaseSalary"]
+        mock_model.quantiles = [0.5]
+        mock_model.predict.side_effect = lambda df: {
+            "BaseSalary": {"p50": df["YearsOfExperience"].to_numpy() * 1000.0}
+        }
+
+        features_list = [
+            {"Level": "L4", "YearsOfExperience": 5},
+            {"Level": "L9", "YearsOfExperience": 6},
+            {"Level": "L4", "YearsOfExperience": 7},
+        ]
+
+        results = self.service.predict_batch(mock_model, features_list)
+
+        mock_model.predict.assert_called_once()
+        self.assertEqual(len(mock_model.predict.call_args[0][0]), 2)
+        self.assertIsInstance(results[0], PredictionResult)
+        self.assertIsInstance(results[1], InvalidInputError)
+        self.assertEqual(results[0].predictions["BaseSalary"]["p50"], 5000.0)
+        self.assertEqual(results[2].predictions["BaseSalary"]["p50"], 7000.0)
+
+    def test_batch_predictions_splits_rows_as_python_floats(self):
+        """Test batched output is split into per-row dicts of plain floats."""
+        raw = {
+            "BaseSalary": {
+                "p10": np.array([1.5, 2.5], dtype=np.float32),
+                "p90": np.array([3.0, 4.0], dtype=np.float32),
+            },
+            "TotalComp": {"p50": pd.Series([5.0, 6.0])},
+        }
+
+        rows = InferenceService._batch_predictions(raw, 2)
+
+        self.assertEqual(
+            rows,
+            [
+                {"BaseSalary": {"p10": 1.5, "p90": 3.0}, "TotalComp": {"p50": 5.0}},
+                {"BaseSalary": {"p10": 2.5, "p90": 4.0}, "TotalComp": {"p50": 6.0}},
+            ],
+        )
+        self.assertIs(type(rows[1]["BaseSalary"]["p10"]), float)
+
     def test_predict_batch_parallel_success(self):
         """Test parallel batch prediction with all successes."""
         from src.services.inference_service import PredictionResult
@@ -252,7 +426,9 @@ class TestInferenceService(unittest.TestCase):
         mock_model.feature_names = ["Level_Enc", "YearsOfExperience"]
         mock_model.targets = ["BaseSalary"]
         mock_model.quantiles = [0.5]
-        mock_model.predict.return_value = {"BaseSalary": {"p50": pd.Series([150000.0])}}
+        mock_model.predict.side_effect = lambda df: {
+            "BaseSalary": {"p50": pd.Series([150000.0] * len(df))}
+        }
 
         features_list = [
             {"Level": "L4", "YearsOfExperience": 5},
@@ -280,9 +456,9 @@ class TestInferenceService(unittest.TestCase):
         mock_model.quantiles = [0.5]
 
         def mock_predict(df):
-            if df.iloc[0]["YearsOfExperience"] == 6:
+            if (df["YearsOfExperience"] == 6).any():
                 raise InvalidInputError("Invalid features")
-            return {"BaseSalary": {"p50": pd.Series([150000.0])}}
+            return {"BaseSalary": {"p50": pd.Series([150000.0] * len(df))}}
 
         mock_model.predict.side_effect = mock_predict
 
@@ -332,7 +508,9 @@ class TestInferenceService(unittest.TestCase):
         mock_model.feature_names = ["Level_Enc", "YearsOfExperience"]
         mock_model.targets = ["BaseSalary"]
         mock_model.quantiles = [0.5]
-        mock_model.predict.return_value = {"BaseSalary": {"p50": pd.Series([150000.0])}}
+        mock_model.predict.side_effect = lambda df: {
+            "BaseSalary": {"p50": pd.Series([150000.0] * len(df))}
+        }
 
         features_list = [{"Level": "L4", "YearsOfExperience": i} for i in range(10)]
 
@@ -350,6 +528,41 @@ class TestInferenceService(unittest.TestCase):
 
         self.assertEqual(len(results), 0)
 
+    def test_predict_batch_parallel_timeout_returns_without_waiting(self):
+        """Test a timed-out batch returns without waiting for running chunks to finish."""
+        import threading
+        import time
+
+        release = threading.Event()
+        mock_model = MagicMock()
+        mock_model.ranked_encoders = {"Level": MagicMock(mapping={"L4": 1})}
+        mock_model.proximity_encoders = {}
+        mock_model.feature_names = ["Level_Enc", "YearsOfExperience"]
+        mock_model.targets = ["BaseSalary"]
+        mock_model.quantiles = [0.5]
+
+        def blocked_predict(df):
+            release.wait(5)
+            return {"BaseSalary": {"p50": pd.Series([150000.0] * len(df))}}
+
+        mock_model.predict.side_effect = blocked_predict
+        features_list = [{"Level": "L4", "YearsOfExperience": i} for i in range(4)]
+
+        try:
+            started = time.monotonic()
+            results = self.service.predict_batch_parallel(
+                mock_model, features_list, concurrency=2, timeout=0.2
+            )
+            elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        self.assertLess(elapsed, 2)
+        self.assertEqual([index for index, _ in results], [0, 1, 2, 3])
+        for _, result in results:
+            self.assertIsInstance(result, InvalidInputError)
+            self.assertIn("timeout", str(result))
+
     def test_predict_batch_parallel_timeout(self):
         """Test parallel batch prediction with timeout."""
         import time
@@ -363,7 +576,7 @@ class TestInferenceService(unittest.TestCase):
 
         def slow_predict(df):
             time.sleep(0.1)
-            return {"BaseSalary": {"p50": pd.Series([150000.0])}}
+            return {"BaseSalary": {"p50": pd.Series([150000.0] * len(df))}}
 
         mock_model.predict.side_effect = slow_predict
 
@@ -37,3 +37,21 @@ def test_generate_config_json_error(mock_get_client):
 
     with pytest.raises(ValueError, match="LLM did not return valid JSON"):
         service.generate_config(df)
+
+
+@patch("src.services.llm_service.get_llm_client")
+def test_generate_config_uses_json_mode_for_openai(mock_get_client):
+    from src.llm.client import OpenAIClient
+
+    mock_client_instance = MagicMock(spec=OpenAIClient)
+    mock_client_instance.generate_json.return_value = {"model": {"targets": ["Salary"]}}
+    mock_get_client.return_value = mock_client_instance
+
+    service = LLMService(provider="openai")
+    df = pd.DataFrame({"Salary": [100]})
+
+    config = service.generate_config(df)
+
+    assert config["model"]["targets"] == ["Salary"]
+    mock_client_instance.generate_json.assert_called_once()
+    mock_client_instance.generate.assert_not_called()
@@ -1,10 +1,23 @@
+import os
+import pickle
+import tempfile
 import unittest
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
-from src.services.model_registry import ModelRegistry
+from src.services.model_registry import ModelRegistry, SalaryForecasterWrapper, _pin_requirements
+
+
+def _mock_run(run_id, start_time, tags=None, metrics=None):
+    """Build a mock MLflow Run as returned by search_runs(output_format="list")."""
+    run = MagicMock()
+    run.info.run_id = run_id
+    run.info.start_time = start_time
+    run.data.tags = tags or {}
+    run.data.metrics = metrics or {}
+    return run
 
 
 class TestModelRegistry(unittest.TestCase):
@@ -15,31 +28,23 @@ class TestModelRegistry(unittest.TestCase):
 
     @patch("src.services.model_registry.mlflow.search_runs")
     def test_list_models(self, mock_search):
-        # Mock dataframe return from search_runs
-        mock_df = pd.DataFrame(
-            {
-                "run_id": ["run1", "run2"],
-                "start_time": [datetime(2023, 1, 1), datetime(2023, 1, 2)],
-                "status": ["FINISHED", "FINISHED"],
-                "status": ["FINISHED", "FINISHED"],
-                "metrics.cv_mean_score": [0.95, 0.96],
-                "tags.dataset_name": ["d1", "d2"],
-            }
-        )
-        mock_search.return_value = mock_df
+        mock_search.return_value = [
+            _mock_run("run1", 1672531200000, {"dataset_name": "d1"}, {"cv_mean_score": 0.95}),
+            _mock_run("run2", 1672617600000, {"dataset_name": "d2"}, {"cv_mean_score": 0.96}),
+        ]
 
         models = self.registry.list_models()
         self.assertEqual(len(models), 2)
         self.assertEqual(models[0]["run_id"], "run1")
         self.assertEqual(models[0]["tags.dataset_name"], "d1")
+        self.assertEqual(models[1]["metrics.cv_mean_score"], 0.96)
+        self.assertEqual(models[0]["start_time"], pd.Timestamp("2023-01-01", tz="UTC"))
+        self.assertEqual(mock_search.call_args.kwargs["output_format"], "list")
 
     @patch("src.services.model_registry.mlflow.search_runs")
     def test_list_models_missing_col(self, mock_search):
-        # Mock dataframe WITHOUT metric column
-        mock_df = pd.DataFrame(
-            {"run_id": ["run1"], "start_time": [datetime(2023, 1, 1)], "status": ["FINISHED"]}
-        )
-        mock_search.return_value = mock_df
+        # Run WITHOUT metrics or tags
+        mock_search.return_value = [_mock_run("run1", 1672531200000)]
 
         models = self.registry.list_models()
         self.assertEqual(len(models), 1)
@@ -49,8 +54,26 @@ class TestModelRegistry(unittest.TestCase):
         self.assertNotIn("tags.dataset_name", models[0])
 
     @patch("src.services.model_registry.mlflow.pyfunc.load_model")
-    def test_load_model(self, mock_load):
-        mock_model_wrapper = MagicMock()
+    @patch("src.services.model_registry.mlflow.artifacts.download_artifacts")
+    def test_load_model(self, mock_download, mock_load):
+        """Test load_model unpickles the python model artifact directly."""
+        wrapper = SalaryForecasterWrapper({"model": "RealModel"})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "python_model.pkl")
+            with open(path, "wb") as f:
+                pickle.dump(wrapper, f)
+            mock_download.return_value = path
+
+            model = self.registry.load_model("run123")
+
+        self.assertEqual(model, {"model": "RealModel"})
+        mock_download.assert_called_with(run_id="run123", artifact_path="model/python_model.pkl")
+        mock_load.assert_not_called()
+
+    @patch("src.services.model_registry.mlflow.pyfunc.load_model")
+    @patch("src.services.model_registry.mlflow.artifacts.download_artifacts")
+    def test_load_model_falls_back_to_pyfunc(self, mock_download, mock_load):
+        mock_download.side_effect = Exception("artifact missing")
         # First unwrap returns the SalaryForecasterWrapper instance
         # Second unwrap (called on Wrapper) returns the Inner Model
 
@@ -70,9 +93,25 @@ class TestModelRegistry(unittest.TestCase):
         # Just ensure it doesn't crash on dummy call
         self.registry.save_model(None, "test")
 
+    @patch("src.services.model_registry.version")
+    def test_pin_requirements(self, mock_version):
+        from importlib.metadata import PackageNotFoundError
+
+        def fake_version(package):
+            if package == "xgboost":
+                return "2.0.3"
+            raise PackageNotFoundError(package)
+
+        mock_version.side_effect = fake_version
+
+        pinned = _pin_requirements(("xgboost", "missing-pkg"))
+        self.assertEqual(pinned, ["xgboost==2.0.3", "missing-pkg"])
+
     @patch("src.services.model_registry.mlflow.pyfunc.load_model")
-    def test_load_model_error(self, mock_load):
+    @patch("src.services.model_registry.mlflow.artifacts.download_artifacts")
+    def test_load_model_error(self, mock_download, mock_load):
         """Test load_model handles errors gracefully."""
+        mock_download.side_effect = Exception("Artifact not found")
         mock_load.side_effect = Exception("Model not found")
 
         with self.assertRaises(Exception) as cm:
@@ -83,7 +122,7 @@ class TestModelRegistry(unittest.TestCase):
     @patch("src.services.model_registry.mlflow.search_runs")
     def test_list_models_empty(self, mock_search):
         """Test list_models with no runs."""
-        mock_search.return_value = pd.DataFrame()
+        mock_search.return_value = []
 
         models = self.registry.list_models()
 
@@ -2,7 +2,7 @@
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pandas as pd
 
@@ -103,6 +103,92 @@ class TestTrainingService(unittest.TestCase):
             # Verify MockForecaster was used
             MockForecaster.return_value.train.assert_called()
 
+    def test_run_async_job_streams_cv_scores_and_batches_summary(self):
+        import asyncio
+
+        import src.services.training_service as ts
+
+        with (
+            patch.object(ts, "mlflow") as mock_mlflow,
+            patch.object(ts, "SalaryForecaster") as MockForecaster,
+        ):
+            job_id = "test_job"
+            self.service._jobs[job_id] = {
+                "status": "QUEUED",
+                "logs": [],
+                "history": [],
+                "scores": [],
+                "result": None,
+            }
+
+            mock_run = MagicMock()
+            mock_run.info.run_id = "run_123"
+            mock_mlflow.start_run.return_value.__enter__.return_value = mock_run
+            client = mock_mlflow.MlflowClient.return_value
+
+            def fake_train(df, callback=None, remove_outliers=False):
+                callback("cv", {"stage": "cv_end", "best_score": 0.5})
+                # Each score reaches the run before training moves on
+                client.log_metric.assert_called_once_with("run_123", "cv_score", 0.5, step=0)
+                callback("cv", {"stage": "cv_end", "best_score": 0.25})
+
+            MockForecaster.return_value.train.side_effect = fake_train
+
+            asyncio.run(
+                self.service._run_async_job(
+                    job_id, self.df, self.config, True, False, 10, None, "test.csv"
+                )
+            )
+
+            self.assertEqual(self.service._jobs[job_id]["status"], "COMPLETED")
+            mock_mlflow.log_metric.assert_not_called()
+            self.assertEqual(
+                client.log_metric.call_args_list,
+                [
+                    call("run_123", "cv_score", 0.5, step=0),
+                    call("run_123", "cv_score", 0.25, step=1),
+                ],
+            )
+
+            client.log_batch.assert_called_once()
+            self.assertEqual(client.log_batch.call_args.args[0], "run_123")
+            logged = client.log_batch.call_args.kwargs["metrics"]
+            self.assertNotIn("cv_score", {m.key for m in logged})
+            self.assertIn("cv_mean_score", {m.key for m in logged})
+
+    def test_cv_score_logging_failure_does_not_fail_job(self):
+        import asyncio
+
+        import src.services.training_service as ts
+
+        with (
+            patch.object(ts, "mlflow") as mock_mlflow,
+            patch.object(ts, "SalaryForecaster") as MockForecaster,
+        ):
+            job_id = "test_job"
+            self.service._jobs[job_id] = {
+                "status": "QUEUED",
+                "logs": [],
+                "history": [],
+                "scores": [],
+                "result": None,
+            }
+            mock_mlflow.MlflowClient.return_value.log_metric.side_effect = RuntimeError("down")
+            MockForecaster.return_value.train.side_effect = (
+                lambda df, callback=None, remove_outliers=False: callback(
+                    "cv", {"stage": "cv_end", "best_score": 0.5}
+                )
+            )
+
+            asyncio.run(
+                self.service._run_async_job(
+                    job_id, self.df, self.config, True, False, 10, None, "test.csv"
+                )
+            )
+
+            self.assertEqual(self.service._jobs[job_id]["status"], "COMPLETED")
+            self.assertEqual(self.service._jobs[job_id]["scores"], [0.5])
+
     def test_get_job_status_invalid(self):
         status = self.service.get_job_status("invalid_id")
         self.assertIsNone(status)
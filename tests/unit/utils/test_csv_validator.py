@@ -1,4 +1,5 @@
 import io
+from unittest.mock import patch
 
 from src.utils.csv_validator import validate_csv
 
@@ -64,3 +65,31 @@ def test_csv_unicode_characters():
     assert is_valid
     assert err is None
     assert len(df) == 2
+
+
+def test_whitespace_only_file_is_empty():
+    """Verify files containing only whitespace are reported as empty."""
+    f = io.BytesIO(b"  \n\n")
+    is_valid, err, df = validate_csv(f)
+    assert not is_valid
+    assert "File is empty" in err
+
+
+def test_single_column_header_rejected_before_parsing():
+    """Verify a delimiter-free header is rejected without parsing the file."""
+    f = io.BytesIO(b"\nCol1\n1\n2")
+    with patch("src.utils.csv_validator.pd.read_csv") as mock_read_csv:
+        is_valid, err, df = validate_csv(f)
+    assert not is_valid
+    assert "must have at least 2 columns" in err
+    mock_read_csv.assert_not_called()
+    assert f.tell() == 0
+
+
+def test_truncated_header_falls_through_to_parser():
+    """Verify a header longer than the sniffed prefix is left to pandas."""
+    header = "A" * 10_000 + ",B"
+    f = io.BytesIO(f"{header}\n1,2".encode("utf-8"))
+    is_valid, err, df = validate_csv(f)
+    assert is_valid
+    assert len(df.columns) == 2
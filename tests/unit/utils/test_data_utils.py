@@ -1,4 +1,6 @@
-from src.utils.data_utils import load_data
+import pandas as pd
+
+from src.utils.data_utils import iqr_outlier_mask, load_data
 
 
 def test_load_data(tmp_path):
@@ -44,3 +46,24 @@ E3,NY,1,0,100,0,0,100,Mar 2023
     assert len(df) == 4
     # Dates should be strings (raw data)
     assert all(isinstance(d, str) for d in df["Date"])
+
+
+def test_iqr_outlier_mask_multiple_targets():
+    """Verify a row is dropped when it is an outlier in any target."""
+    df = pd.DataFrame(
+        {
+            "BaseSalary": [100, 102, 98, 101, 99, 100],
+            "Stock": [50, 51, 49, 50, 500, 50],
+        }
+    )
+
+    mask = iqr_outlier_mask(df, ["BaseSalary", "Stock", "Missing"])
+
+    assert mask.tolist() == [True, True, True, True, False, True]
+
+
+def test_iqr_outlier_mask_no_targets():
+    """Verify all rows are kept when no target column is present."""
+    df = pd.DataFrame({"Other": [1, 2, 1000]})
+
+    assert iqr_outlier_mask(df, ["BaseSalary"]).all()
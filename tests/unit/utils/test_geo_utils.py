@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock, mock_open, patch
 
+import numpy as np
 import pytest
+from geopy.distance import geodesic
 
 from src.utils.geo_utils import GeoMapper
 
@@ -68,3 +70,73 @@ def test_get_zone_far(mock_config):
         mock_geolocator.geocode.return_value = mock_location
         zone = mapper.get_zone("London, UK")
         assert zone == 4
+
+
+def test_get_zones_geocodes_each_city_once(mock_config):
+    with (
+        patch("src.utils.geo_utils.Nominatim") as MockNominatim,
+        patch("src.utils.geo_utils.GeoMapper._init_targets"),
+        patch("src.utils.geo_utils.time.sleep"),
+    ):
+        mapper = GeoMapper(config=mock_config)
+        mapper.target_coords = {
+            "New York, NY": (40.7128, -74.0060),
+            "San Francisco, CA": (37.7749, -122.4194),
+        }
+        coords = {"Newark, NJ": (40.7357, -74.1724), "Oakland, CA": (37.8044, -122.2712)}
+        mock_geolocator = MockNominatim.return_value
+        mock_geolocator.geocode.side_effect = lambda city, timeout: (
+            MagicMock(latitude=coords[city][0], longitude=coords[city][1])
+            if city in coords
+            else None
+        )
+
+        zones = mapper.get_zones(["Newark, NJ", "Oakland, CA", "Newark, NJ", None, "Nowhere"])
+
+        assert zones.tolist() == [1, 2, 1, 4, 4]
+        assert mock_geolocator.geocode.call_count == 3
+
+
+def test_get_zones_matches_geodesic_scan(mock_config):
+    """Test batch zones match a full per-city geodesic scan, including near-tied targets."""
+    targets = {
+        "New York, NY": (40.7128, -74.0060),
+        "Jersey City, NJ": (40.7178, -74.0431),
+        "Philadelphia, PA": (39.9526, -75.1652),
+        "Trenton, NJ": (40.2206, -74.7597),
+        "San Francisco, CA": (37.7749, -122.4194),
+        "Oakland, CA": (37.8044, -122.2712),
+    }
+    zones_by_target = dict(zip(targets, [1, 2, 1, 3, 2, 3]))
+    # Midpoints between neighbouring targets are where spherical and ellipsoidal
+    # distances are most likely to disagree about the nearest one.
+    names = list(targets)
+    cities = {
+        f"mid {a} / {b}": tuple((np.array(targets[a]) + np.array(targets[b])) / 2)
+        for a, b in zip(names, names[1:])
+    }
+    cities.update({"Newark, NJ": (40.7357, -74.1724), "London, UK": (51.5074, -0.1278)})
+
+    def geodesic_scan(city):
+        nearest, min_dist = None, float("inf")
+        for target, coords in targets.items():
+            dist = geodesic(cities[city], coords).kilometers
+            if dist < min_dist:
+                nearest, min_dist = target, dist
+        return zones_by_target[nearest] if min_dist <= 50 else 4
+
+    with (
+        patch("src.utils.geo_utils.Nominatim") as MockNominatim,
+        patch("src.utils.geo_utils.GeoMapper._init_targets"),
+        patch("src.utils.geo_utils.time.sleep"),
+    ):
+        mapper = GeoMapper(config=mock_config)
+        mapper.targets = zones_by_target
+        mapper.target_coords = targets
+        MockNominatim.return_value.geocode.side_effect = lambda city, timeout: MagicMock(
+            latitude=cities[city][0], longitude=cities[city][1]
+        )
+
+        zones = mapper.get_zones(list(cities))
+
+    assert zones.tolist() == [geodesic_scan(city) for city in cities]
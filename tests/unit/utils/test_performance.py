@@ -16,6 +16,7 @@ from src.utils.performance import (
     get_global_llm_tracker,
     get_llm_metrics_summary,
     get_metric_stats,
+    record_metric,
     set_global_llm_tracker,
     timing_decorator,
 )
@@ -97,6 +98,15 @@ class TestPerformanceMetrics(unittest.TestCase):
             elapsed = pm.elapsed
             self.assertGreater(elapsed, 0)
 
+    def test_record_metric(self):
+        """Test recording an externally measured metric value."""
+        record_metric("test_external", 0.5)
+        record_metric("test_external", 1.5)
+
+        stats = get_metric_stats("test_external")
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["mean"], 1.0)
+
 
 class TestLLMCallTracker(unittest.TestCase):
     """Tests for LLMCallTracker."""
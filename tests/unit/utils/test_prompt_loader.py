@@ -1,72 +1,79 @@
 import unittest
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 from src.utils.prompt_loader import load_prompt
 
 
 class TestPromptLoader(unittest.TestCase):
-    @patch("src.utils.prompt_loader.os.path.exists")
-    @patch("src.utils.prompt_loader.open", new_callable=mock_open, read_data="Mock Prompt Content")
-    def test_load_prompt_success(self, mock_file, mock_exists):
-        mock_exists.return_value = True
-
+    @patch(
+        "src.utils.prompt_loader.Path.read_text", autospec=True, return_value="Mock Prompt Content"
+    )
+    def test_load_prompt_success(self, mock_file):
         content = load_prompt("test_prompt")
 
         self.assertEqual(content, "Mock Prompt Content")
 
-        # Verify path logic implies calling exists on a path ending in test_prompt.md
+        # Verify the file read is the one ending in test_prompt.md
         args, _ = mock_file.call_args
-        self.assertTrue(args[0].endswith("test_prompt.md"))
+        self.assertTrue(str(args[0]).endswith("test_prompt.md"))
+
+    @patch("src.utils.prompt_loader.Path.read_text", autospec=True, return_value="Cached")
+    def test_load_prompt_reads_file_once(self, mock_file):
+        """Repeated loads of the same prompt are served from memory."""
+        self.assertEqual(load_prompt("cached_prompt"), "Cached")
+        self.assertEqual(load_prompt("cached_prompt"), "Cached")
+
+        mock_file.assert_called_once()
 
-    @patch("src.utils.prompt_loader.os.path.exists")
-    def test_load_prompt_not_found(self, mock_exists):
-        mock_exists.return_value = False
+    @patch("src.utils.prompt_loader.Path.read_text", side_effect=FileNotFoundError)
+    def test_load_prompt_does_not_cache_missing_files(self, mock_file):
+        """A missing prompt is looked up again on the next call."""
+        for _ in range(2):
+            with self.assertRaises(FileNotFoundError):
+                load_prompt("missing_prompt")
 
-        with self.assertRaises(FileNotFoundError):
+        self.assertEqual(mock_file.call_count, 2)
+
+    @patch("src.utils.prompt_loader.Path.read_text", side_effect=FileNotFoundError)
+    def test_load_prompt_not_found(self, mock_file):
+        with self.assertRaisesRegex(FileNotFoundError, "Prompt file not found: .*missing_prompt"):
             load_prompt("missing_prompt")
 
-    @patch("src.utils.prompt_loader.os.path.exists")
+        mock_file.assert_called_once()
+
     @patch(
-        "src.utils.prompt_loader.open",
-        new_callable=mock_open,
-        read_data="Column Classification System Prompt",
+        "src.utils.prompt_loader.Path.read_text",
+        autospec=True,
+        return_value="Column Classification System Prompt",
     )
-    def test_load_column_classifier_prompt(self, mock_file, mock_exists):
+    def test_load_column_classifier_prompt(self, mock_file):
         """Test loading column classifier system prompt."""
-        mock_exists.return_value = True
-
         content = load_prompt("agents/column_classifier_system")
 
         self.assertIn("Column Classification", content or "")
         args, _ = mock_file.call_args
-        self.assertTrue(args[0].endswith("column_classifier_system.md"))
+        self.assertTrue(str(args[0]).endswith("column_classifier_system.md"))
 
-    @patch("src.utils.prompt_loader.os.path.exists")
     @patch(
-        "src.utils.prompt_loader.open",
-        new_callable=mock_open,
-        read_data="Feature Encoding System Prompt",
+        "src.utils.prompt_loader.Path.read_text",
+        autospec=True,
+        return_value="Feature Encoding System Prompt",
     )
-    def test_load_feature_encoder_prompt(self, mock_file, mock_exists):
+    def test_load_feature_encoder_prompt(self, mock_file):
         """Test loading feature encoder system prompt."""
-        mock_exists.return_value = True
-
         content = load_prompt("agents/feature_encoder_system")
 
         self.assertIn("Feature Encoding", content or "")
         args, _ = mock_file.call_args
-        self.assertTrue(args[0].endswith("feature_encoder_system.md"))
+        self.assertTrue(str(args[0]).endswith("feature_encoder_system.md"))
 
-    @patch("src.utils.prompt_loader.os.path.exists")
     @patch(
-        "src.utils.prompt_loader.open",
-        new_callable=mock_open,
-        read_data="Model Configurator System Prompt",
+        "src.utils.prompt_loader.Path.read_text",
+        autospec=True,
+        return_value="Model Configurator System Prompt",
     )
-    def test_load_model_configurator_prompt(self, mock_file, mock_exists):
+    def test_load_model_configurator_prompt(self, mock_file):
         """Test loading model configurator system prompt."""
-        mock_exists.return_value = True
-
         content = load_prompt("agents/model_configurator_system")
 
         # Check that the prompt was loaded (content should contain something from the file)
@@ -75,7 +82,7 @@ class TestPromptLoader(unittest.TestCase):
         # The mock returns "Model Configurator System Prompt", so check for that
         self.assertIn("Model Configurator", content or "")
         args, _ = mock_file.call_args
-        self.assertTrue(args[0].endswith("model_configurator_system.md"))
+        self.assertTrue(str(args[0]).endswith("model_configurator_system.md"))
 
     def test_agent_prompt_files_exist(self):
         """Test that agent prompt files exist."""
@@ -6,7 +6,7 @@ import pandas as pd
 import pytest
 from conftest import create_test_config
 
-from src.xgboost.model import QuantileForecaster, SalaryForecaster
+from src.xgboost.model import QuantileForecaster, SalaryForecaster, _clean_years
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -168,6 +168,67 @@ def test_location_impact(trained_model):
         assert pred_ny > 0 and pred_austin > 0, "Predictions should be positive"
 
 
+def test_predict_accepts_column_mapping(trained_model):
+    """Verify a column mapping of scalars or arrays predicts the same as a DataFrame."""
+    row = {"Level": "E5", "Location": "New York", "YearsOfExperience": 8, "YearsAtCompany": 2}
+
+    from_frame = trained_model.predict(pd.DataFrame([row]))
+    from_scalars = trained_model.predict(row)
+    from_arrays = trained_model.predict({k: np.array([v]) for k, v in row.items()})
+
+    for q_key, preds in from_frame["BaseSalary"].items():
+        np.testing.assert_allclose(from_scalars["BaseSalary"][q_key], preds)
+        np.testing.assert_allclose(from_arrays["BaseSalary"][q_key], preds)
+
+
+def test_predict_broadcasts_scalars_in_column_mapping(trained_model):
+    """Verify scalar columns are broadcast against array columns in a column mapping."""
+    columns = {
+        "Level": ["E3", "E5"],
+        "Location": "New York",
+        "YearsOfExperience": 8,
+        "YearsAtCompany": 2,
+    }
+
+    result = trained_model.predict(columns)
+    expected = trained_model.predict(pd.DataFrame(columns))
+
+    for q_key, preds in expected["BaseSalary"].items():
+        assert len(result["BaseSalary"][q_key]) == 2
+        np.testing.assert_allclose(result["BaseSalary"][q_key], preds)
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        pytest.param([5], ["5"], id="int_vs_str"),
+        pytest.param([None], ["None"], id="none_vs_str"),
+        pytest.param(["E5", 5], ["E5", "5"], id="mixed_types"),
+    ],
+)
+def test_prediction_cache_key_distinguishes_object_value_types(left, right):
+    """Verify object values that stringify identically get distinct prediction cache keys."""
+    forecaster = QuantileForecaster(config=create_test_config())
+    key = forecaster._prediction_cache_key
+
+    left_df = pd.DataFrame({"Level": pd.Series(left, dtype=object), "YearsOfExperience": 1.0})
+    right_df = pd.DataFrame({"Level": pd.Series(right, dtype=object), "YearsOfExperience": 1.0})
+
+    assert key(left_df) == key(left_df.copy())
+    assert key(left_df) != key(right_df)
+
+
+def test_prediction_cache_key_includes_dtypes():
+    """Verify numerically equal columns of different dtypes get distinct prediction cache keys."""
+    forecaster = QuantileForecaster(config=create_test_config())
+
+    ints = pd.DataFrame({"YearsOfExperience": [1, 2]})
+
+    assert forecaster._prediction_cache_key(ints) != forecaster._prediction_cache_key(
+        ints.astype(float)
+    )
+
+
 class TestConfigHyperparams(unittest.TestCase):
     def setUp(self):
         self.df = pd.DataFrame(
@@ -236,6 +297,128 @@ class TestConfigHyperparams(unittest.TestCase):
         self.assertEqual(call_kwargs.get("num_boost_round"), 10)
         self.assertEqual(call_kwargs.get("nfold"), 2)
 
+    def test_get_n_jobs(self):
+        """Verify parallel worker count defaults to serial and is clamped to the model count."""
+        forecaster = SalaryForecaster(config=self.custom_config)
+        self.assertEqual(forecaster._get_n_jobs(4), 1)
+
+        forecaster.model_config["hyperparameters"]["n_jobs"] = 8
+        self.assertEqual(forecaster._get_n_jobs(3), 3)
+
+        forecaster.model_config["hyperparameters"]["n_jobs"] = -1
+        with patch("src.xgboost.model.os.cpu_count", return_value=2):
+            self.assertEqual(forecaster._get_n_jobs(6), 1)
+        with patch("src.xgboost.model.os.cpu_count", return_value=32):
+            self.assertEqual(forecaster._get_n_jobs(6), 4)
+        with patch("src.xgboost.model.os.cpu_count", return_value=128):
+            self.assertEqual(forecaster._get_n_jobs(6), 6)
+
+    def test_device_hyperparameter(self):
+        """Verify a configured device is passed to XGBoost and disables the process pool."""
+        forecaster = SalaryForecaster(config=self.custom_config)
+        self.assertNotIn("device", forecaster._get_training_params(0.5, "(1,)"))
+
+        forecaster.model_config["hyperparameters"]["device"] = "cuda"
+        forecaster.model_config["hyperparameters"]["n_jobs"] = 4
+        params = forecaster._get_training_params(0.5, "(1,)")
+
+        self.assertEqual(params["device"], "cuda")
+        self.assertEqual(params["tree_method"], "hist")
+        self.assertEqual(forecaster._get_n_jobs(3), 1)
+
+    @patch("src.xgboost.model.record_metric")
+    @patch("src.xgboost.model.xgb.train")
+    @patch("src.xgboost.model.xgb.cv")
+    @patch("src.xgboost.model.xgb.DMatrix")
+    def test_train_parallel_ships_features_once_per_worker(
+        self, mock_dmatrix, mock_cv, mock_train, mock_record_metric
+    ):
+        """Verify workers build one DMatrix each, tasks carry labels, and timings are recorded."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_cv.return_value = pd.DataFrame({"test-quantile-mean": [0.5, 0.4]})
+        self.custom_config["model"]["quantiles"] = [0.1, 0.5, 0.9]
+        self.custom_config["model"]["hyperparameters"]["n_jobs"] = 2
+
+        def in_process_pool(max_workers, mp_context, initializer, initargs):
+            # Threads share the module-level worker DMatrix, so use a single worker here.
+            return ThreadPoolExecutor(max_workers=1, initializer=initializer, initargs=initargs)
+
+        forecaster = SalaryForecaster(config=self.custom_config)
+        with patch("src.xgboost.model.ProcessPoolExecutor", side_effect=in_process_pool) as pool:
+            forecaster.train(self.df)
+
+        pool.assert_called_once()
+        self.assertEqual(pool.call_args[1]["max_workers"], 2)
+        mock_dmatrix.assert_called_once()
+        self.assertEqual(mock_dmatrix.return_value.set_label.call_count, 3)
+        self.assertEqual(mock_train.call_count, 3)
+        self.assertEqual(
+            set(forecaster.models), {"BaseSalary_p10", "BaseSalary_p50", "BaseSalary_p90"}
+        )
+        recorded = {call[0][0] for call in mock_record_metric.call_args_list}
+        self.assertEqual(
+            recorded,
+            {
+                "training_quantile_BaseSalary_p10_time",
+                "training_quantile_BaseSalary_p50_time",
+                "training_quantile_BaseSalary_p90_time",
+            },
+        )
+
+    @patch("src.xgboost.model.xgb.train")
+    @patch("src.xgboost.model.xgb.cv")
+    @patch("src.xgboost.model.xgb.DMatrix")
+    def test_train_trains_each_quantile_once(self, mock_dmatrix, mock_cv, mock_train):
+        """Verify each quantile model is cross-validated and trained exactly once."""
+        mock_cv.return_value = pd.DataFrame({"test-quantile-mean": [0.5, 0.4]})
+        self.custom_config["model"]["quantiles"] = [0.1, 0.5, 0.9]
+
+        forecaster = SalaryForecaster(config=self.custom_config)
+        forecaster.train(self.df)
+
+        self.assertEqual(mock_cv.call_count, 3)
+        self.assertEqual(mock_train.call_count, 3)
+        self.assertEqual(mock_dmatrix.call_count, 1)
+        self.assertEqual(
+            set(forecaster.models), {"BaseSalary_p10", "BaseSalary_p50", "BaseSalary_p90"}
+        )
+
+    @patch("src.xgboost.model.xgb.train")
+    @patch("src.xgboost.model.xgb.cv")
+    @patch("src.xgboost.model.xgb.DMatrix")
+    def test_train_shares_dmatrix_across_targets(self, mock_dmatrix, mock_cv, mock_train):
+        """Verify one DMatrix is built for all targets and only the label is swapped."""
+        mock_cv.return_value = pd.DataFrame({"test-quantile-mean": [0.5, 0.4]})
+        self.df["TotalComp"] = [150000, 180000]
+        self.custom_config["model"]["targets"] = ["BaseSalary", "TotalComp"]
+
+        forecaster = SalaryForecaster(config=self.custom_config)
+        forecaster.train(self.df)
+
+        mock_dmatrix.assert_called_once()
+        dtrain = mock_dmatrix.return_value
+        self.assertEqual(dtrain.set_label.call_count, 2)
+        self.assertEqual(list(dtrain.set_label.call_args_list[1][0][0]), [150000, 180000])
+        self.assertEqual(set(forecaster.models), {"BaseSalary_p50", "TotalComp_p50"})
+
+    @patch("src.xgboost.model.xgb.train")
+    @patch("src.xgboost.model.xgb.cv")
+    @patch("src.xgboost.model.xgb.DMatrix")
+    def test_train_builds_float32_dmatrix(self, mock_dmatrix, mock_cv, mock_train):
+        """Verify the DMatrix is built from a float32 array with the feature names attached."""
+        mock_cv.return_value = pd.DataFrame({"test-quantile-mean": [0.5, 0.4]})
+
+        forecaster = SalaryForecaster(config=self.custom_config)
+        forecaster.train(self.df)
+
+        data = mock_dmatrix.call_args[0][0]
+        call_kwargs = mock_dmatrix.call_args[1]
+        self.assertIsInstance(data, np.ndarray)
+        self.assertEqual(data.dtype, np.float32)
+        self.assertEqual(call_kwargs["feature_names"], ["Level_Enc"])
+        self.assertEqual(call_kwargs["weight"].dtype, np.float32)
+
     def test_analyze_cv_results_static(self):
         """Verify CV results analysis correctly identifies best round and score."""
         cv_df = pd.DataFrame(
@@ -309,6 +492,33 @@ def test_tune(mock_optuna, mock_xgb):
     assert best_params == {"eta": 0.15, "max_depth": 7}
 
 
+def test_clean_years_numeric_column_casts_to_float():
+    """Numeric years columns are cast to float, keeping their index."""
+    result = _clean_years(pd.Series([1, 5, 12], index=[4, 2, 9]))
+
+    assert result.dtype == np.float64
+    assert list(result.index) == [4, 2, 9]
+    assert list(result) == [1.0, 5.0, 12.0]
+
+
+def test_clean_years_parses_ranges_and_plus_suffixes():
+    """String years handle '11+' and '5-10' forms alongside plain numbers."""
+    result = _clean_years(pd.Series(["11+", "5-10", " 3 ", 2, 4.5]))
+
+    assert list(result) == [11.0, 7.5, 3.0, 2.0, 4.5]
+
+
+def test_clean_years_keeps_missing_and_rejects_garbage():
+    """Missing values stay NaN while unparseable strings raise."""
+    result = _clean_years(pd.Series(["2-4", np.nan, "-1"]))
+    assert result[0] == 3.0
+    assert np.isnan(result[1])
+    assert result[2] == -1.0
+
+    with pytest.raises(ValueError, match="senior"):
+        _clean_years(pd.Series(["3", "senior"]))
+
+
 class TestOutlierDetection:
     @pytest.fixture
     def forecaster(self):
@@ -434,6 +644,28 @@ class TestPreprocess(unittest.TestCase):
             # The important thing is it doesn't crash unexpectedly
             pass
 
+    def test_preprocess_does_not_mutate_input(self):
+        """Test _preprocess leaves the input frame untouched and keeps its index."""
+        forecaster = SalaryForecaster(config=self.config)
+
+        df = pd.DataFrame(
+            {
+                "Level": ["E4", "E3"],
+                "Location": ["New York", "Austin"],
+                "YearsOfExperience": [10, 5],
+                "Unused": ["a", "b"],
+            },
+            index=[7, 3],
+        )
+        original_columns = list(df.columns)
+
+        result = forecaster._preprocess(df)
+
+        self.assertEqual(list(df.columns), original_columns)
+        self.assertEqual(list(result.index), [7, 3])
+        self.assertEqual(list(result["Level_Enc"]), [1, 0])
+        self.assertEqual(list(result["YearsOfExperience"]), [10, 5])
+
     def test_preprocess_empty_dataframe(self):
         """Test _preprocess with empty DataFrame."""
         forecaster = SalaryForecaster(config=self.config)
@@ -526,6 +758,46 @@ class TestPredict(unittest.TestCase):
         self.assertIn("BaseSalary", result)
         self.assertIn("TotalComp", result)
 
+    @patch("src.xgboost.model.xgb.DMatrix")
+    def test_predict_writes_quantiles_into_shared_buffer(self, mock_dmatrix):
+        """Test quantile predictions are contiguous views of one float32 output buffer."""
+        forecaster = SalaryForecaster(config=self.config)
+        p50_model, p75_model = MagicMock(), MagicMock()
+        p50_model.predict.return_value = np.array([100.0, 200.0])
+        p75_model.predict.return_value = np.array([150.0, 250.0])
+        forecaster.models = {"BaseSalary_p50": p50_model, "BaseSalary_p75": p75_model}
+
+        result = forecaster.predict(pd.DataFrame({"Level": ["E3", "E4"]}))
+
+        p50, p75 = result["BaseSalary"]["p50"], result["BaseSalary"]["p75"]
+        np.testing.assert_array_equal(p50, [100.0, 200.0])
+        np.testing.assert_array_equal(p75, [150.0, 250.0])
+        self.assertEqual(p50.dtype, np.float32)
+        self.assertTrue(p50.flags["C_CONTIGUOUS"])
+        self.assertIs(p50.base, p75.base)
+
+    @patch("src.xgboost.model.xgb.DMatrix")
+    def test_predict_reuses_preprocessed_matrix_for_repeated_input(self, mock_dmatrix):
+        """Test repeated identical inputs skip preprocessing until the model is retrained."""
+        forecaster = SalaryForecaster(config=self.config)
+        mock_model = MagicMock()
+        mock_model.predict.return_value = np.array([100000])
+        forecaster.models = {"BaseSalary_p50": mock_model}
+
+        with patch.object(forecaster, "_preprocess", wraps=forecaster._preprocess) as spy:
+            forecaster.predict(pd.DataFrame({"Level": ["E3"]}))
+            forecaster.predict(pd.DataFrame({"Level": ["E3"]}))
+            self.assertEqual(spy.call_count, 1)
+
+            forecaster.predict(pd.DataFrame({"Level": ["E4"]}))
+            self.assertEqual(spy.call_count, 2)
+
+            forecaster._cache_token = "retrained"
+            forecaster.predict(pd.DataFrame({"Level": ["E3"]}))
+            self.assertEqual(spy.call_count, 3)
+
+        self.assertEqual(mock_dmatrix.call_count, 3)
+
 
 class TestRemoveOutliersErrorHandling(unittest.TestCase):
     """Tests for remove_outliers error handling."""
@@ -638,7 +910,7 @@ class TestOptionalEncodings(unittest.TestCase):
             "optional_encodings": {"Location": {"type": "cost_of_living", "params": {}}},
         }
         mock_mapper = mock_geo_mapper.return_value
-        mock_mapper.get_zone.return_value = 1
+        mock_mapper.get_zones.side_effect = lambda cities: [1] * len(cities)
         forecaster = QuantileForecaster(config=config)
         result = forecaster._preprocess(self.df)
 
@@ -663,7 +935,7 @@ class TestOptionalEncodings(unittest.TestCase):
             "optional_encodings": {"Location": {"type": "metro_population", "params": {}}},
         }
         mock_mapper = mock_geo_mapper.return_value
-        mock_mapper.get_zone.return_value = 1
+        mock_mapper.get_zones.side_effect = lambda cities: [1] * len(cities)
 
         forecaster = QuantileForecaster(config=config)
         result = forecaster._preprocess(self.df)
@@ -772,7 +1044,7 @@ class TestOptionalEncodings(unittest.TestCase):
             },
         }
         mock_mapper = mock_geo_mapper.return_value
-        mock_mapper.get_zone.return_value = 1
+        mock_mapper.get_zones.side_effect = lambda cities: [1] * len(cities)
         forecaster = QuantileForecaster(config=config)
         result = forecaster._preprocess(self.df)
 
@@ -10,6 +10,7 @@ from src.xgboost.preprocessing import (
     ProximityEncoder,
     RankedCategoryEncoder,
     SampleWeighter,
+    _as_series,
 )
 
 # --- RankedCategoryEncoder Tests ---
@@ -37,15 +38,49 @@ def test_ranked_encoder_dataframe_input():
     assert result[0] == 0
 
 
+def test_ranked_encoder_preserves_index_and_follows_mapping_updates():
+    encoder = RankedCategoryEncoder(mapping={"E3": 0, "E4": 1})
+
+    X = pd.Series(["E4", None, "E3"], index=[10, 11, 12])
+    result = encoder.transform(X)
+
+    assert list(result.index) == [10, 11, 12]
+    np.testing.assert_array_equal(result, np.array([1, -1, 0]))
+
+    encoder.mapping = {"E3": 5}
+    np.testing.assert_array_equal(encoder.transform(X), np.array([-1, -1, 5]))
+
+
+def test_ranked_encoder_reuses_cached_lookup():
+    encoder = RankedCategoryEncoder(mapping={"E3": 0, "E4": 1})
+    X = pd.Series(["E3", "E4"])
+
+    encoder.transform(X)
+    cached = encoder._lookup_cache
+    encoder.transform(X)
+    assert encoder._lookup_cache is cached
+
+    # Encoders unpickled from older models have no cache attribute yet
+    del encoder._lookup_cache
+    np.testing.assert_array_equal(encoder.transform(X), np.array([0, 1]))
+
+
 # --- ProximityEncoder Tests ---
 
 
+def _zones(zone_for):
+    """Build a GeoMapper.get_zones side effect from a per-city zone function."""
+    return lambda cities: [zone_for(city) for city in cities]
+
+
 def test_proximity_encoder_transform():
     # Mock GeoMapper
     with patch("src.xgboost.preprocessing.GeoMapper") as MockGeoMapper:
         mock_mapper = MockGeoMapper.return_value
         # Setup mock behavior: NY -> 1, SF -> 2, Unknown -> 4
-        mock_mapper.get_zone.side_effect = lambda x: 1 if x == "NY" else (2 if x == "SF" else 4)
+        mock_mapper.get_zones.side_effect = _zones(
+            lambda x: 1 if x == "NY" else (2 if x == "SF" else 4)
+        )
 
         encoder = ProximityEncoder()
 
@@ -96,24 +131,20 @@ def test_ranked_encoder_edge_cases():
 def test_proximity_encoder_edge_cases():
     with patch("src.xgboost.preprocessing.GeoMapper") as MockGeoMapper:
         mock_mapper = MockGeoMapper.return_value
-        # If input is not a string (e.g. NaN), get_zone might not even be called if we handle it in transform
-        # or we rely on get_zone to handle it.
-        # Looking at implementation:
-        # def map_loc(loc):
-        #     if not isinstance(loc, str): return 4
-        #     return self.mapper.get_zone(loc)
+        # Non-string inputs (e.g. NaN) are mapped to 4 in transform without calling get_zones
 
         encoder = ProximityEncoder()
 
-        # None, NaN -> Should return 4 (Unknown) without calling mapper.get_zone
+        # None, NaN -> Should return 4 (Unknown) without calling mapper.get_zones
         X = pd.Series([None, np.nan, 123])
         result = encoder.transform(X)
+        mock_mapper.get_zones.assert_not_called()
 
         expected = np.array([4, 4, 4])
         np.testing.assert_array_equal(result, expected)
 
-        # Empty string -> Should call mapper.get_zone("") -> let's say mapper returns 4 for empty
-        mock_mapper.get_zone.return_value = 4
+        # Empty string -> Should call mapper.get_zones -> let's say mapper returns 4 for empty
+        mock_mapper.get_zones.side_effect = _zones(lambda x: 4)
 
         X_str = pd.Series(["", "   "])
         result_str = encoder.transform(X_str)
@@ -122,6 +153,37 @@ def test_proximity_encoder_edge_cases():
         np.testing.assert_array_equal(result_str, expected_str)
 
 
+def test_proximity_encoder_maps_each_unique_location_once():
+    with patch("src.xgboost.preprocessing.GeoMapper") as MockGeoMapper:
+        mock_mapper = MockGeoMapper.return_value
+        mock_mapper.get_zones.side_effect = _zones(lambda x: 1 if x == "NY" else 3)
+
+        encoder = ProximityEncoder()
+
+        X = pd.Series(["NY", "Austin", "NY", None, "Austin", "NY"], index=[5, 4, 3, 2, 1, 0])
+        result = encoder.transform(X)
+
+        mock_mapper.get_zones.assert_called_once_with(["NY", "Austin"])
+        assert list(result.index) == [5, 4, 3, 2, 1, 0]
+        np.testing.assert_array_equal(result, np.array([1, 3, 1, 4, 3, 1]))
+
+
+def test_cost_of_living_encoder_categorical_input():
+    with patch("src.xgboost.preprocessing.GeoMapper") as MockGeoMapper:
+        mock_mapper = MockGeoMapper.return_value
+        mock_mapper.get_zones.side_effect = _zones(lambda x: 1 if x == "NY" else 2)
+
+        encoder = CostOfLivingEncoder()
+
+        X = pd.Series(["NY", "Austin", None, "NY"], dtype="category")
+        result = encoder.transform(X)
+
+        mock_mapper.get_zones.assert_called_once()
+        assert sorted(mock_mapper.get_zones.call_args.args[0]) == ["Austin", "NY"]
+        assert result.dtype == np.int64
+        np.testing.assert_array_equal(result, np.array([1, 2, 4, 1]))
+
+
 def test_sample_weighter_edge_cases():
     weighter = SampleWeighter(k=1.0)
 
@@ -201,6 +263,33 @@ def test_sample_weighter_dataframe_with_date_col():
     np.testing.assert_almost_equal(weights[2], 1 / 3, decimal=3)
 
 
+def test_sample_weighter_preserves_index_and_applies_k():
+    """Test SampleWeighter keeps the input index and applies the decay exponent."""
+    weighter = SampleWeighter(k=2.0, ref_date="2023-01-01")
+
+    dates = pd.Series(["2022-01-01", "2024-01-01", None], index=["a", "b", "c"])
+    weights = weighter.transform(dates)
+
+    assert list(weights.index) == ["a", "b", "c"]
+    assert weights.dtype == np.float32
+    np.testing.assert_almost_equal(weights["a"], 0.25, decimal=3)
+    assert weights["b"] == 1.0
+    assert np.isnan(weights["c"])
+
+
+def test_sample_weighter_skips_parsing_datetime_input():
+    """Test SampleWeighter does not re-parse columns that are already datetime64."""
+    weighter = SampleWeighter(k=1.0, ref_date="2023-01-01")
+    dates = pd.Series(pd.to_datetime(["2022-01-01", None]))
+
+    with patch("src.xgboost.preprocessing.pd.to_datetime") as mock_to_datetime:
+        weights = weighter.transform(dates)
+
+    mock_to_datetime.assert_not_called()
+    np.testing.assert_almost_equal(weights[0], 0.5, decimal=3)
+    assert np.isnan(weights[1])
+
+
 def test_sample_weighter_dataframe_missing_date_col():
     """Test SampleWeighter with DataFrame missing date_col falls back to first column."""
     weighter = SampleWeighter(k=1.0, ref_date="2023-01-01", date_col="MissingCol")
@@ -286,7 +375,9 @@ def test_sample_weighter_config_key():
 def test_cost_of_living_encoder_transform():
     with patch("src.xgboost.preprocessing.GeoMapper") as MockGeoMapper:
         mock_mapper = MockGeoMapper.return_value
-        mock_mapper.get_zone.side_effect = lambda x: 1 if x == "NY" else (2 if x == "SF" else 4)
+        mock_mapper.get_zones.side_effect = _zones(
+            lambda x: 1 if x == "NY" else (2 if x == "SF" else 4)
+        )
 
         encoder = CostOfLivingEncoder()
 
@@ -311,7 +402,7 @@ def test_cost_of_living_encoder_fit():
 def test_metro_population_encoder_transform():
     with patch("src.xgboost.preprocessing.GeoMapper") as MockGeoMapper:
         mock_mapper = MockGeoMapper.return_value
-        mock_mapper.get_zone.return_value = 1
+        mock_mapper.get_zones.side_effect = _zones(lambda x: 1)
 
         encoder = MetroPopulationEncoder()
 
@@ -326,7 +417,9 @@ def test_metro_population_encoder_transform():
 def test_metro_population_encoder_different_zones():
     with patch("src.xgboost.preprocessing.GeoMapper") as MockGeoMapper:
         mock_mapper = MockGeoMapper.return_value
-        mock_mapper.get_zone.side_effect = lambda x: {"NY": 1, "Austin": 2, "Small": 4}.get(x, 4)
+        mock_mapper.get_zones.side_effect = _zones(
+            lambda x: {"NY": 1, "Austin": 2, "Small": 4}.get(x, 4)
+        )
 
         encoder = MetroPopulationEncoder()
 
@@ -393,6 +486,8 @@ def test_date_normalizer_single_date():
     encoder.fit(dates)
     result = encoder.transform(dates)
 
+    assert result.dtype == np.float32
+
     # Single date should result in 1.0 (or 0.0 if range is 0)
     assert result.iloc[0] in [0.0, 1.0]
 
@@ -433,3 +528,113 @@ def test_date_normalizer_fit():
     assert result is encoder
     assert encoder.min_date is not None
     assert encoder.max_date is not None
+
+
+def test_date_normalizer_skips_parsing_datetime_input():
+    """Test DateNormalizer does not re-parse columns that are already datetime64."""
+    encoder = DateNormalizer()
+    dates = pd.Series(pd.to_datetime(["2020-01-01", "2021-01-01", "2022-01-01"]))
+
+    with patch("src.xgboost.preprocessing.pd.to_datetime") as mock_to_datetime:
+        result = encoder.fit(dates).transform(dates)
+
+    mock_to_datetime.assert_not_called()
+    assert result.iloc[0] == 0.0
+    assert result.iloc[2] == 1.0
+
+
+def test_date_normalizer_clips_dates_outside_fitted_range():
+    """Test DateNormalizer scales linearly and clips dates outside the fitted range."""
+    encoder = DateNormalizer().fit(pd.Series(pd.to_datetime(["2020-01-01", "2020-01-05"])))
+
+    result = encoder.transform(
+        pd.Series(pd.to_datetime(["2019-01-01", "2020-01-02", "2030-01-01", None]))
+    )
+
+    assert result.dtype == np.float32
+    assert result.tolist() == [0.0, 0.25, 1.0, 0.0]
+
+
+def test_date_normalizer_fit_ignores_unparseable_dates():
+    """Test DateNormalizer.fit takes min/max over valid dates only."""
+    encoder = DateNormalizer().fit(pd.Series(["2021-06-01", "not a date", None, "2020-01-01"]))
+
+    assert encoder.min_date == pd.Timestamp("2020-01-01")
+    assert encoder.max_date == pd.Timestamp("2021-06-01")
+
+
+def test_as_series_returns_series_input_unchanged():
+    """Test _as_series passes Series through and takes the first DataFrame column."""
+    series = pd.Series([1, 2], index=[5, 6])
+    df = pd.DataFrame({"a": [3, 4], "b": [5, 6]})
+
+    assert _as_series(series) is series
+    assert _as_series(df).tolist() == [3, 4]
+    assert _as_series([7, 8]).tolist() == [7, 8]
+
+
+def test_date_normalizer_accepts_list_input():
+    """Test DateNormalizer transforms plain lists of date strings."""
+    encoder = DateNormalizer().fit(["2020-01-01", "2022-01-01"])
+
+    result = encoder.transform(["2020-01-01", "2021-01-01", "2022-01-01"])
+
+    assert result.tolist()[0] == 0.0
+    assert result.tolist()[2] == 1.0
+
+
+def test_metro_population_encoder_zone_lookup_table():
+    """Test populations are gathered from a zone table that follows population_map updates."""
+    with patch("src.xgboost.preprocessing.GeoMapper") as MockGeoMapper:
+        MockGeoMapper.return_value.get_zones.side_effect = _zones(
+            lambda x: {"A": 2, "B": 9, "C": 3}[x]
+        )
+
+        encoder = MetroPopulationEncoder()
+        X = pd.Series(["A", "B", "C"], index=[3, 1, 2])
+        result = encoder.transform(X)
+
+        assert list(result.index) == [3, 1, 2]
+        assert result.tolist() == [2000000, 100000, 500000]
+
+        encoder.population_map = {**encoder.population_map, 9: 42}
+        assert encoder.transform(X).tolist() == [2000000, 42, 500000]
+
+
+def test_sample_weighter_unparseable_column_gets_unit_weights():
+    """Test SampleWeighter falls back to weight 1.0 when the column cannot be parsed."""
+    weighter = SampleWeighter(k=1.0, ref_date="2023-01-01")
+    dates = pd.Series(["2022-01-01", "2021-01-01"], index=[9, 8])
+
+    with patch("src.xgboost.preprocessing._as_datetime", side_effect=ValueError("mixed tz")):
+        weights = weighter.transform(dates)
+
+    assert list(weights.index) == [9, 8]
+    assert weights.dtype == np.float32
+    assert weights.tolist() == [1.0, 1.0]
+
+
+def test_date_transformers_single_row_skips_series_parsing():
+    """Test one-row inputs are parsed as scalars and match the batched result."""
+    weighter = SampleWeighter(k=2.0, ref_date="2023-01-01")
+    encoder = DateNormalizer().fit(pd.Series(["2020-01-01", "2022-01-01"]))
+    batch = pd.Series(["2021-01-01", "2021-01-01"])
+
+    with patch("src.xgboost.preprocessing._as_datetime") as mock_as_datetime:
+        weight = weighter.transform(pd.Series(["2021-01-01"], index=[4]))
+        normalized = encoder.transform(pd.Series(["2021-01-01"], index=[4]))
+
+    mock_as_datetime.assert_not_called()
+    assert list(weight.index) == [4]
+    assert weight.iloc[0] == weighter.transform(batch).iloc[0]
+    assert normalized.iloc[0] == encoder.transform(batch).iloc[0]
+
+
+def test_date_transformers_empty_input():
+    """Test empty inputs return empty float32 Series."""
+    encoder = DateNormalizer().fit(pd.Series(["2020-01-01", "2022-01-01"]))
+    empty = pd.Series([], dtype=object)
+
+    for result in (SampleWeighter().transform(empty), encoder.transform(empty)):
+        assert len(result) == 0
+        assert result.dtype == np.float32